@@ -487,7 +487,8 @@ def setup_for_ssp(
         include_all_parts=False,
         yaml_header=yaml_path,
         allowed_sections=None,
-        force_overwrite=None
+        force_overwrite=None,
+        jobs=1
     )
 
     return args, yaml_path
@@ -514,7 +515,8 @@ def setup_for_ssp_fedramp(
         include_all_parts=False,
         yaml_header=None,
         allowed_sections=None,
-        force_overwrite=None
+        force_overwrite=None,
+        jobs=1
     )
 
     return args
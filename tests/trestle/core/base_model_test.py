@@ -18,6 +18,8 @@ import pathlib
 from datetime import datetime, timezone, tzinfo
 from uuid import uuid4
 
+from pydantic.v1 import ValidationError
+
 import pytest
 
 import tests.test_utils as test_utils
@@ -32,6 +34,7 @@ import trestle.oscal.common as common
 import trestle.oscal.component as component
 import trestle.oscal.ssp as ssp
 from trestle.core.base_model import OscalBaseModel
+from trestle.core.parsed_model_cache import ParsedModelCache
 
 
 def test_echo_tmp_path(tmp_path) -> None:
@@ -180,6 +183,15 @@ def test_stripping_model_class() -> None:
         raise Exception('Test failure')
 
 
+def test_stripped_model_type_cached() -> None:
+    """Test that identical stripped model types are only created once."""
+    by_name = oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata', 'groups'])
+    by_alias = oscatalog.Catalog.create_stripped_model_type(stripped_fields_aliases=['groups', 'metadata'])
+    assert by_name is by_alias
+    assert by_name is not oscatalog.Catalog.create_stripped_model_type(stripped_fields=['metadata'])
+    assert by_name is not common.Metadata.create_stripped_model_type(stripped_fields=['metadata', 'groups'])
+
+
 def test_stripped_model_type_failure() -> None:
     """Test for user failure conditions."""
     with pytest.raises(err.TrestleError):
@@ -259,6 +271,55 @@ def test_copy_to() -> None:
     _ = remark.copy_to(common.RiskStatus)
 
 
+def test_bulk_edit() -> None:
+    """Test that assignments are validated once when the bulk edit scope exits."""
+    metadata = common.Metadata(
+        title='My simple catalog',
+        last_modified=datetime.now().astimezone(),
+        version='0.0.0',
+        oscal_version=trestle.oscal.OSCAL_VERSION
+    )
+    party = common.Party(uuid=str(uuid4()), type=common.PartyTypeValidValues.person, name='Fred')
+    with pytest.raises(ValidationError):
+        metadata.roles = [party]
+    role = common.Role(id='admin', title='Administrator')
+    roles = [role]
+    with OscalBaseModel.bulk_edit(metadata) as edited:
+        assert edited is metadata
+        metadata.roles = roles
+        # the list is copied but its models are stored as is rather than copied by validation
+        roles.append(common.Role(id='viewer', title='Viewer'))
+        assert len(metadata.roles) == 1
+        assert metadata.roles[0] is role
+        # models of another type are still validated immediately
+        with pytest.raises(ValidationError):
+            metadata.roles = [party]
+        # simple values are still validated and coerced immediately
+        metadata.oscal_version = trestle.oscal.OSCAL_VERSION
+        assert metadata.oscal_version.__root__ == trestle.oscal.OSCAL_VERSION
+        with pytest.raises(ValidationError):
+            metadata.title = None
+    assert 'roles' in metadata.__fields_set__
+    assert 'parties' not in metadata.__fields_set__
+
+    bad_role = common.Role.construct(id='bad role id', title='Bad')
+    with pytest.raises(err.TrestleError):
+        with OscalBaseModel.bulk_edit(metadata):
+            # invalid model is accepted until the scope exits
+            metadata.roles = [bad_role]
+            metadata.parties = [party]
+            assert metadata.roles[0] is bad_role
+    # the assignments are undone when the model is not valid on exit
+    assert metadata.roles == [role]
+    assert metadata.parties is None
+    assert 'parties' not in metadata.__fields_set__
+    metadata.validate_fields()
+
+    # outside of any scope assignments are validated immediately again
+    with pytest.raises(ValidationError):
+        metadata.roles = [party]
+
+
 def test_copy_components() -> None:
     """Test copying across similar but different objects."""
     state_obj = 'under-development'
@@ -351,3 +412,86 @@ def test_oscal_serialize_json() -> None:
     new_catalog = oscatalog.Catalog.parse_obj(jsoned['catalog'])
 
     assert simple_catalog_obj.metadata.title == new_catalog.metadata.title
+
+
+def test_oscal_read_parsed_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a model read again from an unchanged file in the workspace is loaded pre-parsed from the cache."""
+    monkeypatch.setattr(const, 'PARSED_CACHE_MIN_BYTES', 0)
+    cache_dir = tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.PARSED_CACHE_DIR
+    catalog_path = tmp_trestle_dir / 'catalogs/my_catalog/catalog.json'
+    catalog_path.parent.mkdir(parents=True)
+    nist_path = test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME
+    catalog = oscatalog.Catalog.oscal_read(nist_path)
+    catalog.oscal_write(catalog_path)
+    # the cache is only used when enabled
+    assert oscatalog.Catalog.oscal_read(catalog_path) == catalog
+    assert not cache_dir.exists()
+
+    def parse_obj_fail(*args, **kwargs):
+        raise err.TrestleError('the file should not be parsed')
+
+    with ParsedModelCache.enable(tmp_trestle_dir):
+        assert oscatalog.Catalog.oscal_read(catalog_path) == catalog
+        # files outside the workspace are not cached
+        assert oscatalog.Catalog.oscal_read(nist_path) == catalog
+        entries = list(cache_dir.glob('*'))
+        assert len(entries) == 1
+        # entries are plain oscal json
+        assert oscatalog.Catalog.oscal_read(entries[0]) == catalog
+
+        with monkeypatch.context() as m:
+            m.setattr(oscatalog.Catalog, 'parse_obj', parse_obj_fail)
+            assert oscatalog.Catalog.oscal_read(catalog_path) == catalog
+            # changed content needs a fresh parse
+            catalog.metadata.title = 'new title'
+            catalog.oscal_write(catalog_path)
+            with pytest.raises(err.TrestleError, match='should not be parsed'):
+                oscatalog.Catalog.oscal_read(catalog_path)
+        assert oscatalog.Catalog.oscal_read(catalog_path).metadata.title == 'new title'
+
+
+def test_trusted_construct(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test trusted models are constructed without validation and equal the validated ones."""
+    catalog_path = test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME
+    catalog = oscatalog.Catalog.oscal_read(catalog_path)
+    trusted_catalog = oscatalog.Catalog.oscal_read(catalog_path, trusted=True)
+    assert trusted_catalog == catalog
+    assert trusted_catalog.oscal_serialize_json() == catalog.oscal_serialize_json()
+    assert isinstance(trusted_catalog.groups[0].controls[0].parts[0], common.Part)
+    # data that does not fit the model is still fully validated
+    with pytest.raises(Exception):
+        common.Property.trusted_construct({'name': 'x', 'bad-field': 'y'})
+
+    workspace_path = tmp_trestle_dir / 'catalogs/my_catalog/catalog.json'
+    workspace_path.parent.mkdir(parents=True)
+    catalog.oscal_write(workspace_path)
+
+    def parse_obj_fail(*args, **kwargs):
+        raise err.TrestleError('the file should not be parsed')
+
+    monkeypatch.setattr(oscatalog.Catalog, 'parse_obj', parse_obj_fail)
+    with pytest.raises(err.TrestleError, match='should not be parsed'):
+        oscatalog.Catalog.oscal_read(workspace_path)
+    with OscalBaseModel.trust_workspace(tmp_trestle_dir):
+        assert OscalBaseModel.is_trusted_path(workspace_path)
+        assert not OscalBaseModel.is_trusted_path(tmp_trestle_dir / const.TRESTLE_CACHE_DIR / 'catalog.json')
+        assert oscatalog.Catalog.oscal_read(workspace_path) == catalog
+        # files outside the workspace are still validated
+        with pytest.raises(err.TrestleError, match='should not be parsed'):
+            oscatalog.Catalog.oscal_read(catalog_path)
+    assert not OscalBaseModel.is_trusted_path(workspace_path)
+
+
+def test_copy_to_field_transfer() -> None:
+    """Test copy to a class of the same name transfers fields into the new types without sharing models."""
+    set_param = ssp.SetParameter(param_id='ac-1_prm_1', values=['one', 'two'], remarks='my remarks')
+    copied = set_param.copy_to(component.SetParameter)
+    assert isinstance(copied, component.SetParameter)
+    assert copied.oscal_serialize_json(wrapped=False) == set_param.oscal_serialize_json(wrapped=False)
+    assert copied.values is not set_param.values
+
+    party = common.Party(uuid=str(uuid4()), type=common.PartyTypeValidValues.person, name='Fred')
+    copied_party = party.copy_to(common.Party)
+    assert copied_party == party
+    assert copied_party.type == common.PartyTypeValidValues.person
+    assert copied_party.__fields_set__ == {'uuid', 'type', 'name'}
@@ -38,6 +38,7 @@ from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.commands.import_ import ImportCmd
 from trestle.core.control_context import ContextPurpose, ControlContext
 from trestle.core.control_interface import ControlInterface, ParameterRep
+from trestle.core.control_reader import ControlReader
 from trestle.core.markdown.markdown_api import MarkdownAPI
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.profile_resolver import ProfileResolver
@@ -602,6 +603,107 @@ def test_catalog_force_overwrite(tmp_trestle_dir: pathlib.Path, monkeypatch: Mon
     assert fc.files_unchanged()
 
 
+def test_catalog_generate_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test catalog generate writes the same markdown whatever the number of jobs."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    ModelUtils.save_top_level_model(catalog, tmp_trestle_dir, 'my_catalog', FileContentType.JSON)
+
+    catalog_generate = 'trestle author catalog-generate -n my_catalog -o md_catalog'
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+
+    fc = test_utils.FileChecker(tmp_trestle_dir / 'md_catalog/')
+    # forget the generated digests so every control is written again
+    (tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.GENERATED_MD_DIGESTS_FILE).unlink()
+    catalog_generate = 'trestle author catalog-generate -n my_catalog -o md_catalog --force-overwrite -j 4'
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+    assert fc.files_unchanged()
+
+
+def test_catalog_generate_skips_unchanged(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys) -> None:
+    """Test catalog generate only rewrites controls whose inputs or markdown changed."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    ModelUtils.save_top_level_model(catalog, tmp_trestle_dir, 'my_catalog', FileContentType.JSON)
+    controls = CatalogInterface(catalog).get_all_controls_from_catalog(True)
+    n_controls = len([control for control in controls if not ControlInterface.is_withdrawn(control)])
+
+    catalog_generate = 'trestle author catalog-generate -n my_catalog -o md_catalog'
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+    assert f'Regenerated {n_controls} control markdown files and skipped 0' in capsys.readouterr().out
+
+    # change one control in the catalog and edit the markdown of another
+    catalog.groups[0].controls[0].title = 'New title'
+    ModelUtils.save_top_level_model(catalog, tmp_trestle_dir, 'my_catalog', FileContentType.JSON)
+    md_path = tmp_trestle_dir / 'md_catalog/ac/ac-2.md'
+    md_path.write_text(md_path.read_text(encoding=const.FILE_ENCODING) + '\n', encoding=const.FILE_ENCODING)
+
+    test_utils.execute_command_and_assert(catalog_generate, 0, monkeypatch)
+    assert f'Regenerated 2 control markdown files and skipped {n_controls - 2}' in capsys.readouterr().out
+    assert '# ac-1 - \\[Access Control\\] New title' in (tmp_trestle_dir / 'md_catalog/ac/ac-1.md').read_text(
+        encoding=const.FILE_ENCODING
+    )
+
+
+def test_catalog_assemble_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test catalog assemble gives the same catalog when the markdown is read by several processes."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    ModelUtils.save_top_level_model(catalog, tmp_trestle_dir, 'my_catalog', FileContentType.JSON)
+
+    test_utils.execute_command_and_assert('trestle author catalog-generate -n my_catalog -o md_catalog', 0, monkeypatch)
+    test_utils.execute_command_and_assert(
+        'trestle author catalog-assemble -m md_catalog -o serial_catalog', 0, monkeypatch
+    )
+    test_utils.execute_command_and_assert(
+        'trestle author catalog-assemble -m md_catalog -o parallel_catalog -j 3', 0, monkeypatch
+    )
+
+    serial_catalog, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'serial_catalog', cat.Catalog)
+    parallel_catalog, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'parallel_catalog', cat.Catalog)
+    assert serial_catalog.groups == parallel_catalog.groups
+    assert serial_catalog.controls == parallel_catalog.controls
+
+
+def test_catalog_assemble_reparses_changed(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test catalog assemble only parses the control markdown that changed since the last assemble."""
+    catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    ModelUtils.save_top_level_model(catalog, tmp_trestle_dir, 'my_catalog', FileContentType.JSON)
+    test_utils.execute_command_and_assert('trestle author catalog-generate -n my_catalog -o md_catalog', 0, monkeypatch)
+
+    parsed_ids = []
+    read_control = ControlReader.read_control
+
+    def _read_control(control_path: pathlib.Path, set_parameters_flag: bool):
+        parsed_ids.append(control_path.stem)
+        return read_control(control_path, set_parameters_flag)
+
+    monkeypatch.setattr(ControlReader, 'read_control', _read_control)
+    catalog_assemble = 'trestle author catalog-assemble -m md_catalog -o my_catalog'
+    test_utils.execute_command_and_assert(catalog_assemble, 0, monkeypatch)
+    assert 'ac-2' in parsed_ids and len(parsed_ids) > 1
+
+    parsed_ids.clear()
+    md_path = tmp_trestle_dir / 'md_catalog/ac/ac-2.md'
+    file_utils.insert_text_in_file(md_path, '## Control Statement', 'New prose\n')
+    test_utils.execute_command_and_assert(catalog_assemble, 0, monkeypatch)
+    assert parsed_ids == ['ac-2']
+
+    catalog, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'my_catalog', cat.Catalog)
+    assert catalog.groups[0].controls[1].parts[0].prose.startswith('New prose')
+
+    # the result is the same as parsing every file again
+    parsed_ids.clear()
+    test_utils.execute_command_and_assert(
+        'trestle author catalog-assemble -m md_catalog -o cached_catalog', 0, monkeypatch
+    )
+    assert parsed_ids == []
+    shutil.rmtree(tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.ASSEMBLED_MD_CACHE_DIR)
+    test_utils.execute_command_and_assert(
+        'trestle author catalog-assemble -m md_catalog -o full_catalog', 0, monkeypatch
+    )
+    cached_catalog, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'cached_catalog', cat.Catalog)
+    full_catalog, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'full_catalog', cat.Catalog)
+    assert cached_catalog.groups == full_catalog.groups
+
+
 def test_prune_written_controls(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test pruning of written controls."""
     catalog = cat.Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
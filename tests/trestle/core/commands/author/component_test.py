@@ -25,7 +25,9 @@ import trestle.core.generic_oscal as generic
 import trestle.oscal.component as comp
 from trestle.common import const, file_utils, model_utils
 from trestle.core.commands.common.return_codes import CmdReturnCodes
+from trestle.core.control_context import ControlContext
 from trestle.core.control_interface import ControlInterface
+from trestle.core.control_reader import ControlReader
 from trestle.core.markdown.markdown_processor import MarkdownProcessor
 
 md_path = 'md_comp'
@@ -204,6 +206,21 @@ def test_component_generate_more_than_one_param(tmp_trestle_dir: pathlib.Path, m
     test_utils.execute_command_and_assert(assemble_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
 
 
+def test_component_generate_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test component generate writes the same markdown whatever the number of jobs."""
+    comp_name = test_utils.setup_component_generate(tmp_trestle_dir)
+    generate_cmd = f'trestle author component-generate -n {comp_name} -o {md_path}'
+    test_utils.execute_command_and_assert(generate_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+
+    fc = test_utils.FileChecker(tmp_trestle_dir / md_path)
+    # forget the generated digests so every control is written again
+    (tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.GENERATED_MD_DIGESTS_FILE).unlink()
+    test_utils.execute_command_and_assert(
+        f'{generate_cmd} --force-overwrite -j 4', CmdReturnCodes.SUCCESS.value, monkeypatch
+    )
+    assert fc.files_unchanged()
+
+
 def test_component_workflow_no_rules(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test component generate and assemble with no rules set."""
     comp_name = test_utils.setup_component_generate(tmp_trestle_dir, 'comp_def_c')
@@ -263,3 +280,43 @@ ______________________________________________________________________"""
     imp_req = next((i_req for i_req in imp_reqs if i_req.control_id == 'ac-1'), None)
     assert imp_req.description == 'imp req prose for ac-1 from comp cc'
     assert ControlInterface.get_status_from_props(imp_req).state == const.STATUS_IMPLEMENTED  # type: ignore
+
+
+def test_component_assemble_reparses_changed(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test component assemble only parses the control markdown that changed since the last assemble."""
+    comp_name = test_utils.setup_component_generate(tmp_trestle_dir)
+    generate_cmd = f'trestle author component-generate -n {comp_name} -o {md_path}'
+    test_utils.execute_command_and_assert(generate_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+
+    parsed_files = []
+    read_implemented_requirement = ControlReader.read_implemented_requirement
+
+    def _read_implemented_requirement(control_file: pathlib.Path, context: ControlContext):
+        parsed_files.append(control_file.relative_to(tmp_trestle_dir / md_path).as_posix())
+        return read_implemented_requirement(control_file, context)
+
+    monkeypatch.setattr(ControlReader, 'read_implemented_requirement', _read_implemented_requirement)
+    assemble_cmd = f'trestle author component-assemble -m {md_path} -n {comp_name} -o assem_comp'
+    test_utils.execute_command_and_assert(assemble_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+    assert 'comp_aa/comp_prof_aa/ac/ac-1.md' in parsed_files
+
+    parsed_files.clear()
+    test_utils.execute_command_and_assert(assemble_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+    assert parsed_files == []
+
+    ac1_path = tmp_trestle_dir / md_path / 'comp_aa/comp_prof_aa/ac/ac-1.md'
+    test_utils.substitute_text_in_file(ac1_path, 'statement prose for part a. from comp aa', 'new prose')
+    test_utils.execute_command_and_assert(assemble_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+    assert parsed_files == ['comp_aa/comp_prof_aa/ac/ac-1.md']
+
+    # the result from the cache is the same as parsing every file again
+    shutil.rmtree(tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.ASSEMBLED_MD_CACHE_DIR)
+    full_cmd = f'trestle author component-assemble -m {md_path} -n {comp_name} -o full_comp'
+    test_utils.execute_command_and_assert(full_cmd, CmdReturnCodes.SUCCESS.value, monkeypatch)
+    cached_comp, _ = model_utils.ModelUtils.load_model_for_class(
+        tmp_trestle_dir, 'assem_comp', comp.ComponentDefinition
+    )
+    full_comp, _ = model_utils.ModelUtils.load_model_for_class(tmp_trestle_dir, 'full_comp', comp.ComponentDefinition)
+    assert model_utils.ModelUtils.models_are_equivalent(cached_comp, full_comp, True)
+    statement = cached_comp.components[0].control_implementations[0].implemented_requirements[0].statements[0]
+    assert statement.description == 'new prose'
@@ -28,8 +28,10 @@ import pytest
 from tests.test_utils import execute_command_and_assert
 
 import trestle
+from trestle.common.err import TrestleError
 from trestle.core.commands.author.consts import START_TEMPLATE_VERSION
 from trestle.core.markdown.markdown_api import MarkdownAPI
+from trestle.core.markdown.markdown_processor import MarkdownProcessor
 
 import yaml
 
@@ -723,6 +725,22 @@ def test_template_validate_flags_invalid_body(
     execute_command_and_assert(command_validate, 1, monkeypatch)
 
 
+def test_template_validate_strict_gfm(
+    testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Test the body is only checked to be valid Github Flavored Markdown with the strict flag."""
+    task_template = tmp_trestle_dir / '.trestle/author/test_task/0.0.1/template.md'
+    (tmp_trestle_dir / '.trestle/author/test_task/0.0.1').mkdir(parents=True)
+    shutil.copy(testdata_dir / 'author/0.0.1/test_1_md_format/template.md', task_template)
+
+    def _render_gfm_to_html(self, markdown_text: str) -> str:
+        raise TrestleError('Not a valid Github Flavored markdown.')
+
+    monkeypatch.setattr(MarkdownProcessor, 'render_gfm_to_html', _render_gfm_to_html)
+    execute_command_and_assert('trestle author docs template-validate -tn test_task', 0, monkeypatch)
+    execute_command_and_assert('trestle author docs template-validate -tn test_task --strict-gfm', 1, monkeypatch)
+
+
 def test_multiple_dif_templates_recursive(
     testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch
 ) -> None:
@@ -20,7 +20,7 @@ from _pytest.monkeypatch import MonkeyPatch
 
 from tests.test_utils import execute_command_and_assert, setup_for_ssp
 
-from trestle.core.commands.author.jinja import _number_captions
+from trestle.core.commands.author.jinja import JinjaCmd, _number_captions
 from trestle.core.commands.author.ssp import SSPGenerate
 from trestle.core.markdown.docs_markdown_node import DocsMarkdownNode
 
@@ -295,3 +295,27 @@ def test_jinja_with_template_only(
         node1 = tree.get_node_for_key('# A')
         node2 = tree.get_node_for_key('# C')
         assert node1.subnodes[0].key == node2.subnodes[0].key
+
+
+def test_render_template_reuses_compiled_output(tmp_path: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test nested expressions are rendered and intermediate output is compiled only once per environment."""
+    (tmp_path / 'nested.md.jinja').write_text('Value: {{ outer }}')
+    jinja_env = JinjaCmd.get_environment(tmp_path)
+    template = jinja_env.get_template('nested.md.jinja')
+    lut = {'outer': '{{ inner }}', 'inner': 'done'}
+
+    compiled = []
+    orig_compile = jinja_env.compile
+
+    def spy_compile(*args, **kwargs):
+        compiled.append(args[0])
+        return orig_compile(*args, **kwargs)
+
+    monkeypatch.setattr(jinja_env, 'compile', spy_compile)
+    assert JinjaCmd.render_template(template, lut, tmp_path) == 'Value: done'
+    n_compiled = len(compiled)
+    assert n_compiled > 0
+    assert JinjaCmd.render_template(template, lut, tmp_path) == 'Value: done'
+    assert len(compiled) == n_compiled
+    # the intermediate output is not kept by the loader once compiled
+    assert not jinja_env.loader.loaders[0]._sources
@@ -500,7 +500,8 @@ def test_profile_failures(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatc
         yaml_header=None,
         sections='NeededExtra:Needed Extra,implgdn:Implementation Guidance,expevid:Expected Evidence',
         required_sections=None,
-        force_overwrite=False
+        force_overwrite=False,
+        jobs=1
     )
     profile_generate = ProfileGenerate()
     assert profile_generate._run(test_args) == 0
@@ -519,7 +520,8 @@ def test_profile_failures(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatc
         version=None,
         allowed_sections=None,
         sections=None,
-        force_overwrite=False
+        force_overwrite=False,
+        jobs=1
     )
     # fail since required section not present
     profile_assemble = ProfileAssemble()
@@ -813,15 +815,16 @@ def test_adding_removing_sections(tmp_trestle_dir: pathlib.Path, monkeypatch: Mo
     assert not tree.get_node_for_key('## Control this_should_appear_in_parts')
 
 
+@pytest.mark.parametrize('jobs', [1, 3])
 @pytest.mark.parametrize('bracket_format', [True, False])
 @pytest.mark.parametrize('show_values', [True, False])
 def test_profile_resolve(
-    tmp_trestle_dir: pathlib.Path, show_values: bool, bracket_format: bool, monkeypatch: MonkeyPatch
+    tmp_trestle_dir: pathlib.Path, show_values: bool, bracket_format: bool, jobs: int, monkeypatch: MonkeyPatch
 ) -> None:
     """Test profile resolve to create resolved profile catalog."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, False)
     cat_name = 'resolved_catalog'
-    command_profile_resolve = f'trestle author profile-resolve -n main_profile -o {cat_name}'
+    command_profile_resolve = f'trestle author profile-resolve -n main_profile -o {cat_name} -j {jobs}'
     if show_values:
         command_profile_resolve += ' -sv'
     if bracket_format:
@@ -915,6 +918,19 @@ def test_profile_generate_updates_statement(tmp_trestle_dir: pathlib.Path, monke
     assert ac1.parts[5].id == 'ac-1_koala'
 
 
+def test_profile_generate_jobs(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test profile generate writes the same markdown whatever the number of jobs."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    prof_generate = f'trestle author profile-generate -n main_profile -o {md_name}'
+    test_utils.execute_command_and_assert(prof_generate, 0, monkeypatch)
+
+    fc = test_utils.FileChecker(tmp_trestle_dir / md_name)
+    # forget the generated digests so every control is written again
+    (tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.GENERATED_MD_DIGESTS_FILE).unlink()
+    test_utils.execute_command_and_assert(f'{prof_generate} --force-overwrite -j 4', 0, monkeypatch)
+    assert fc.files_unchanged()
+
+
 def test_profile_generate_inherited_props(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test generation of inherited props in header."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
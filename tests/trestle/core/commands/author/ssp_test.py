@@ -15,6 +15,7 @@
 
 import argparse
 import pathlib
+import shutil
 from typing import Dict, List
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -28,6 +29,7 @@ import trestle.oscal.profile as prof
 import trestle.oscal.ssp as ossp
 from trestle.common import const, file_utils, list_utils
 from trestle.common.model_utils import ModelUtils
+from trestle.core.catalog.catalog_reader import CatalogReader
 from trestle.core.commands.author.ssp import SSPAssemble, SSPFilter, SSPGenerate
 from trestle.core.control_context import ContextPurpose, ControlContext
 from trestle.core.control_reader import ControlReader
@@ -111,6 +113,21 @@ def test_ssp_generate(tmp_trestle_dir: pathlib.Path) -> None:
     assert fc.files_unchanged()
 
 
+def test_ssp_generate_jobs(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test the ssp generator writes the same markdown whatever the number of jobs."""
+    args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    ssp_cmd = SSPGenerate()
+    assert ssp_cmd._run(args) == 0
+
+    fc = FileChecker(tmp_trestle_dir / ssp_name)
+    # forget the generated digests so every control is written again
+    (tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.GENERATED_MD_DIGESTS_FILE).unlink()
+    args.force_overwrite = True
+    args.jobs = 4
+    assert ssp_cmd._run(args) == 0
+    assert fc.files_unchanged()
+
+
 def test_ssp_generate_no_cds(tmp_trestle_dir: pathlib.Path) -> None:
     """Test the ssp generator with no comp defs."""
     args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
@@ -406,7 +423,8 @@ def test_ssp_assemble(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=False,
         version=new_version,
         name=None,
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -442,7 +460,8 @@ def test_ssp_assemble(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=False,
         name=None,
         version=None,
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -463,7 +482,8 @@ def test_ssp_assemble(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=True,
         name=None,
         version=None,
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
     assert orig_uuid == test_utils.get_model_uuid(tmp_trestle_dir, ssp_name, ossp.SystemSecurityPlan)
@@ -478,7 +498,8 @@ def test_ssp_assemble(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=True,
         name=None,
         version='new version to force write',
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
     assert orig_uuid != test_utils.get_model_uuid(tmp_trestle_dir, ssp_name, ossp.SystemSecurityPlan)
@@ -533,6 +554,42 @@ def test_ssp_assemble_remove_comp_defs(tmp_trestle_dir: pathlib.Path, monkeypatc
     assert not [x for x in imp_reqs[0].by_components if x.component_uuid == generic_uuid]
 
 
+def test_ssp_assemble_reparses_changed(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test ssp assemble only parses the control markdown that changed since the last assemble."""
+    gen_args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    assert SSPGenerate()._run(gen_args) == 0
+
+    parsed_ids = []
+    read_comp_info = CatalogReader._read_comp_info_from_md
+
+    def _read_comp_info(control_file_path: pathlib.Path, context: ControlContext):
+        parsed_ids.append(control_file_path.stem)
+        return read_comp_info(control_file_path, context)
+
+    monkeypatch.setattr(CatalogReader, '_read_comp_info_from_md', staticmethod(_read_comp_info))
+    ssp_assemble = f'trestle author ssp-assemble -m {ssp_name} -o {ssp_name} -cd {gen_args.compdefs}'
+    test_utils.execute_command_and_assert(ssp_assemble, 0, monkeypatch)
+    assert 'ac-1' in parsed_ids and len(parsed_ids) > 1
+
+    parsed_ids.clear()
+    test_utils.execute_command_and_assert(ssp_assemble, 0, monkeypatch)
+    assert parsed_ids == []
+
+    ac1_path = tmp_trestle_dir / ssp_name / 'ac/ac-1.md'
+    file_utils.insert_text_in_file(ac1_path, '### This System', 'new system prose\n')
+    test_utils.execute_command_and_assert(ssp_assemble, 0, monkeypatch)
+    assert parsed_ids == ['ac-1']
+
+    # the result from the cache is the same as parsing every file again
+    shutil.rmtree(tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.ASSEMBLED_MD_CACHE_DIR)
+    full_assemble = f'trestle author ssp-assemble -m {ssp_name} -o full_ssp -cd {gen_args.compdefs}'
+    test_utils.execute_command_and_assert(full_assemble, 0, monkeypatch)
+    cached_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, ssp_name, ossp.SystemSecurityPlan)
+    full_ssp, _ = ModelUtils.load_model_for_class(tmp_trestle_dir, 'full_ssp', ossp.SystemSecurityPlan)
+    assert ModelUtils.models_are_equivalent(cached_ssp, full_ssp, True)
+    assert 'new system prose' in cached_ssp.oscal_serialize_json()
+
+
 def test_ssp_generate_bad_name(tmp_trestle_dir: pathlib.Path) -> None:
     """Test bad output name."""
     args = argparse.Namespace(
@@ -586,7 +643,8 @@ def test_ssp_assemble_with_inheritance(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=False,
         name=None,
         compdefs=args_compdefs,
-        version=None
+        version=None,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -620,7 +678,8 @@ def test_ssp_filter(tmp_trestle_dir: pathlib.Path) -> None:
         name=None,
         version=None,
         regenerate=False,
-        compdefs=gen_args.compdefs
+        compdefs=gen_args.compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -822,7 +881,8 @@ def test_ssp_filter_control_origination(tmp_trestle_dir: pathlib.Path) -> None:
         name=None,
         version=None,
         regenerate=False,
-        compdefs=gen_args.compdefs
+        compdefs=gen_args.compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -1035,7 +1095,8 @@ def test_ssp_assemble_no_comps(tmp_trestle_dir: pathlib.Path, capsys) -> None:
         regenerate=False,
         version=None,
         name=None,
-        compdefs=None
+        compdefs=None,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -1094,7 +1155,8 @@ def test_ssp_gen_and_assemble_more_than_one_param(tmp_trestle_dir: pathlib.Path,
         regenerate=False,
         version=new_version,
         name=None,
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -1153,6 +1215,7 @@ def test_ssp_gen_and_assemble_add_props(tmp_trestle_dir: pathlib.Path) -> None:
         version=None,
         compdefs=args_compdefs,
         regenerate=False,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -1245,7 +1308,8 @@ ______________________________________________________________________
         regenerate=False,
         version='',
         name=None,
-        compdefs=args_compdefs
+        compdefs=args_compdefs,
+        jobs=1
     )
     assert ssp_assemble._run(args) == 0
 
@@ -1333,7 +1397,8 @@ def test_ssp_generate_aggregates_no_cds(tmp_trestle_dir: pathlib.Path) -> None:
         regenerate=False,
         version='',
         name=None,
-        compdefs=None
+        compdefs=None,
+        jobs=1
     )
     assert ssp_assemble._run(assemble_args) == 0
 
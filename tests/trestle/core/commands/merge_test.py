@@ -40,10 +40,10 @@ from trestle.core.models.plans import Plan
 def test_merge_invalid_element_path(testdata_dir, tmp_trestle_dir):
     """Test to make sure each element in -e contains 2 parts at least, and no chained element paths."""
     cmd = MergeCmd()
-    args = argparse.Namespace(verbose=1, element='catalog', trestle_root=tmp_trestle_dir)
+    args = argparse.Namespace(verbose=1, element='catalog', trestle_root=tmp_trestle_dir, jobs=1)
     assert cmd._run(args) == 1
 
-    args = argparse.Namespace(verbose=1, element='catalog.metadata', trestle_root=tmp_trestle_dir)
+    args = argparse.Namespace(verbose=1, element='catalog.metadata', trestle_root=tmp_trestle_dir, jobs=1)
     test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
     test_data_source = testdata_dir / 'split_merge/step4_split_groups_array/catalogs'
     catalogs_dir = Path('catalogs/')
@@ -296,7 +296,7 @@ def test_bad_merge(testdata_dir, tmp_trestle_dir):
 
     os.chdir(mycatalog_dir)
     cmd = MergeCmd()
-    args = argparse.Namespace(verbose=1, element='catalog.roles', trestle_root=tmp_trestle_dir)
+    args = argparse.Namespace(verbose=1, element='catalog.roles', trestle_root=tmp_trestle_dir, jobs=1)
     assert cmd._run(args) == 1
 
     # test from outside trestle project
@@ -370,7 +370,8 @@ def test_merge_plan_simple_list(testdata_dir, tmp_trestle_dir):
     assert generated_plan == expected_plan
 
 
-def test_split_merge(testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path) -> None:
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_split_merge(testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path, jobs: int) -> None:
     """Test merging data that has been split using the split command- to ensure symmetry."""
     # trestle split -f catalog.json -e catalog.groups.*.controls.*
 
@@ -412,7 +413,7 @@ def test_split_merge(testdata_dir: pathlib.Path, tmp_trestle_dir: pathlib.Path)
 
     # Merge everything back into the catalog
     # Equivalent to trestle merge -e catalog.*
-    args = argparse.Namespace(name='merge', element='catalog.*', verbose=2, trestle_root=tmp_trestle_dir)
+    args = argparse.Namespace(name='merge', element='catalog.*', verbose=2, trestle_root=tmp_trestle_dir, jobs=jobs)
     rc = MergeCmd()._run(args)
     assert rc == 0
 
@@ -477,7 +477,7 @@ def test_split_comp_def(
         assert SplitCmd()._run(args) == 0
 
     os.chdir(compdef_dir)
-    args = argparse.Namespace(element='component-definition.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(element='component-definition.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model = component.ComponentDefinition.oscal_read(compdef_file)
@@ -552,7 +552,7 @@ def test_split_tutorial_workflow(
 
     # step4
     os.chdir(catalog_dir)
-    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model = oscatalog.Catalog.oscal_read(catalog_file)
@@ -590,7 +590,7 @@ def test_split_catalog_star(
     os.chdir(catalog_dir)
     args = argparse.Namespace(file='catalog.json', element=split_path, verbose=1, trestle_root=trestle_root)
     assert SplitCmd()._run(args) == 0
-    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model: oscatalog.Catalog = oscatalog.Catalog.oscal_read(catalog_file)
@@ -618,7 +618,7 @@ def test_split_deep(
     )
     assert SplitCmd()._run(args) == 0
 
-    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model: oscatalog.Catalog = oscatalog.Catalog.oscal_read(catalog_file)
@@ -649,7 +649,7 @@ def test_split_relative_path(
     # merge receives an element path not a file path
     # so need to chdir to where the file is
     os.chdir(catalog_dir)
-    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(element='catalog.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model: oscatalog.Catalog = oscatalog.Catalog.oscal_read(catalog_file)
@@ -694,7 +694,7 @@ def test_no_file_given(
     assert SplitCmd()._run(args) == 0
 
     os.chdir(catalog_dir)
-    args = argparse.Namespace(file=None, element='catalog.*', verbose=1, trestle_root=trestle_root)
+    args = argparse.Namespace(file=None, element='catalog.*', verbose=1, trestle_root=trestle_root, jobs=1)
     assert MergeCmd()._run(args) == 0
 
     new_model: oscatalog.Catalog = oscatalog.Catalog.oscal_read(catalog_file)
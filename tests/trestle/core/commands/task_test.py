@@ -252,3 +252,66 @@ def test_trestle_fail_on_task_exception(tmp_trestle_dir: pathlib.Path, monkeypat
     )
     rc = taskcmd.TaskCmd()._run(args)
     assert rc > 0
+
+
+def _write_batch_config(config_path: pathlib.Path) -> None:
+    """Write a config with two pass-fail sections, the second of which fails to execute."""
+    config_object = configparser.ConfigParser()
+    config_object.read(config_path)
+    config_object.add_section('task.pass-fail')
+    config_object['task.pass-fail']['execute_status'] = 'True'
+    config_object.add_section('task.pass-fail.broken')
+    config_object['task.pass-fail.broken']['execute_status'] = 'False'
+    config_object.write(config_path.open('w', encoding=const.FILE_ENCODING))
+
+
+def test_task_batch(tmp_trestle_dir: pathlib.Path, capsys: pytest.CaptureFixture) -> None:
+    """Test running several task sections in one invocation."""
+    _write_batch_config(pathlib.Path(const.TRESTLE_CONFIG_DIR) / const.TRESTLE_CONFIG_FILE)
+    args = argparse.Namespace(
+        trestle_root=tmp_trestle_dir,
+        name='task',
+        list=False,
+        verbose=0,
+        task=None,
+        config=None,
+        info=False,
+        all=False,
+        sections='pass-fail',
+        jobs=1
+    )
+    rc = taskcmd.TaskCmd()._run(args)
+    assert rc == 0
+    assert '1 of 1 tasks succeeded' in capsys.readouterr().out
+
+    args.sections = None
+    args.all = True
+    rc = taskcmd.TaskCmd()._run(args)
+    assert rc > 0
+    out = capsys.readouterr().out
+    assert 'pass-fail.broken' in out
+    assert '1 of 2 tasks succeeded' in out
+
+    # unknown sections and conflicting arguments are rejected
+    args.all = False
+    args.sections = 'pass-fail,not-a-section'
+    assert taskcmd.TaskCmd()._run(args) > 0
+    args.all = True
+    args.sections = 'pass-fail'
+    assert taskcmd.TaskCmd()._run(args) > 0
+    args.all = False
+    args.task = 'pass-fail'
+    assert taskcmd.TaskCmd()._run(args) > 0
+
+
+def test_task_batch_cli(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test running task sections concurrently from the command line."""
+    _write_batch_config(pathlib.Path(const.TRESTLE_CONFIG_DIR) / const.TRESTLE_CONFIG_FILE)
+    results = []
+    for command in ['trestle task -s pass-fail,task.pass-fail -j 2', 'trestle task -a -j 2']:
+        monkeypatch.setattr(sys, 'argv', command.split())
+        with pytest.raises(SystemExit) as wrapped_error:
+            trestle.cli.run()
+        results.append(wrapped_error.value.code)
+    assert results[0] == 0
+    assert results[1] > 0
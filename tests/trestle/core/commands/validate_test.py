@@ -22,12 +22,15 @@ from uuid import uuid4
 
 from _pytest.monkeypatch import MonkeyPatch
 
+from pydantic.v1 import ValidationError
+
 import pytest
 
 from tests import test_utils
 from tests.test_utils import setup_for_ssp
 
 import trestle.common.const as const
+import trestle.core.all_validator as all_validator_module
 import trestle.core.generators as gens
 import trestle.oscal.assessment_plan as ap
 import trestle.oscal.common as common
@@ -35,12 +38,17 @@ import trestle.oscal.profile as prof
 import trestle.oscal.ssp as ossp
 from trestle import cli
 from trestle.cli import Trestle
+from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
+from trestle.core.all_validator import AllValidator
+from trestle.core.base_model import OscalBaseModel
+from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.commands.split import SplitCmd
 from trestle.core.generators import generate_sample_model
 from trestle.core.models.file_content_type import FileContentType
-from trestle.core.validator import Validator
+from trestle.core.remote.cache import FetcherFactory
+from trestle.core.validator import Validator, ValuesByNameVisitor, visit_model
 from trestle.core.validator_factory import validator_factory
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.common import ResponsibleParty, Role
@@ -177,6 +185,92 @@ def test_role_refs_validator(
     assert pytest_wrapped_e.value.code == code
 
 
+@pytest.mark.parametrize('jobs', [1, 3])
+def test_validate_all_reports_every_failure(
+    jobs: int, tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Test validation of all models with a pool of workers reports every invalid model."""
+    roles = [Role(id='id1', title='title1')]
+    for name, role_id in [('ap_good', 'id1'), ('ap_bad1', 'foo'), ('ap_bad2', 'bar')]:
+        ap_obj = generate_sample_model(ap.AssessmentPlan)
+        ap_obj.metadata.roles = roles
+        ap_obj.metadata.responsible_parties = [ResponsibleParty(role_id=role_id, party_uuids=[str(uuid4())])]
+        ap_dir = tmp_trestle_dir / 'assessment-plans' / name
+        ap_dir.mkdir(parents=True)
+        ap_obj.oscal_write(ap_dir / 'assessment-plan.json')
+
+    test_utils.execute_command_and_assert(f'trestle validate -a -j {jobs}', 4, monkeypatch)
+    out = capsys.readouterr().out
+    assert 'INVALID: Model' in out
+    assert 'ap_bad1' in out
+    assert 'ap_bad2' in out
+    assert 'VALID: Model' in out
+
+
+def test_validate_changed_only(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that models unchanged since they passed validation are skipped."""
+    for name in ['my_cat1', 'my_cat2']:
+        (tmp_trestle_dir / test_utils.CATALOGS_DIR / name).mkdir(parents=True)
+        cat_path = tmp_trestle_dir / test_utils.CATALOGS_DIR / name / 'catalog.json'
+        shutil.copyfile(test_data_dir / 'json/minimal_catalog.json', cat_path)
+    validated = []
+    orig_model_is_valid = AllValidator.model_is_valid
+
+    def count_model_is_valid(self, model, quiet, trestle_root=None) -> bool:
+        validated.append(model.metadata.title)
+        return orig_model_is_valid(self, model, quiet, trestle_root)
+
+    monkeypatch.setattr(AllValidator, 'model_is_valid', count_model_is_valid)
+    test_utils.execute_command_and_assert('trestle validate -t catalog --changed-only', 0, monkeypatch)
+    assert len(validated) == 2
+    assert (tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.VALIDATED_DIGESTS_FILE).exists()
+
+    validated.clear()
+    test_utils.execute_command_and_assert('trestle validate -t catalog --changed-only', 0, monkeypatch)
+    assert not validated
+
+    cat_path = tmp_trestle_dir / test_utils.CATALOGS_DIR / 'my_cat2' / 'catalog.json'
+    catalog = Catalog.oscal_read(cat_path)
+    catalog.metadata.title = 'changed title'
+    catalog.oscal_write(cat_path)
+    test_utils.execute_command_and_assert('trestle validate -t catalog --changed-only', 0, monkeypatch)
+    assert validated == ['changed title']
+
+    # without the flag every model is validated
+    validated.clear()
+    test_utils.execute_command_and_assert('trestle validate -t catalog', 0, monkeypatch)
+    assert len(validated) == 2
+
+
+def test_validate_changed_only_imports(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test that an ssp unchanged since it passed validation is validated again when its imported catalog changes."""
+    prof_name = 'comp_prof'
+    ssp_name = 'my_ssp'
+    gen_args, _ = setup_for_ssp(tmp_trestle_dir, prof_name, ssp_name)
+    test_utils.gen_and_assemble_first_ssp(prof_name, ssp_name, gen_args, monkeypatch)
+    validated = []
+    orig_model_is_valid = AllValidator.model_is_valid
+
+    def count_model_is_valid(self, model, quiet, trestle_root=None) -> bool:
+        validated.append(model.uuid)
+        return orig_model_is_valid(self, model, quiet, trestle_root)
+
+    monkeypatch.setattr(AllValidator, 'model_is_valid', count_model_is_valid)
+    command = 'trestle validate -t system-security-plan --changed-only'
+    test_utils.execute_command_and_assert(command, 0, monkeypatch)
+    assert len(validated) == 1
+
+    validated.clear()
+    test_utils.execute_command_and_assert(command, 0, monkeypatch)
+    assert not validated
+
+    catalog, cat_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'simplified_nist_catalog', Catalog)
+    catalog.metadata.title = 'changed title'
+    catalog.oscal_write(cat_path)
+    test_utils.execute_command_and_assert(command, 0, monkeypatch)
+    assert len(validated) == 1
+
+
 def test_oscal_version_validator(
     tmp_trestle_dir: pathlib.Path, sample_catalog_minimal: Catalog, monkeypatch: MonkeyPatch
 ) -> None:
@@ -224,6 +318,46 @@ def test_oscal_incorrect_fields_validator(tmp_trestle_dir: pathlib.Path, monkeyp
     assert rc == 1
 
 
+def test_validate_trust_workspace(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test validation still checks models in full when the workspace is trusted."""
+    catalog = Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    catalog_path = tmp_trestle_dir / 'catalogs/mycat/catalog.json'
+    catalog_path.parent.mkdir()
+    catalog.oscal_write(catalog_path)
+    test_utils.execute_command_and_assert('trestle validate -a --trust-workspace', 0, monkeypatch)
+    catalog_path.write_text(catalog_path.read_text().replace(catalog.uuid, 'not-a-uuid'))
+    test_utils.execute_command_and_assert('trestle validate -a --trust-workspace', 1, monkeypatch)
+
+
+def test_validate_ignores_parsed_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test a model read as trusted is not cached and cannot make an invalid model pass validation."""
+    monkeypatch.setattr(const, 'PARSED_CACHE_MIN_BYTES', 0)
+    catalog = Catalog.oscal_read(test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME)
+    catalog_path = tmp_trestle_dir / 'catalogs/mycat/catalog.json'
+    catalog_path.parent.mkdir()
+    catalog.oscal_write(catalog_path)
+    catalog_path.write_text(catalog_path.read_text().replace(catalog.uuid, 'not-a-uuid'))
+    cache_dir = tmp_trestle_dir / const.TRESTLE_CACHE_DIR / const.PARSED_CACHE_DIR
+    test_utils.execute_command_and_assert('trestle validate -a --parsed-cache', 1, monkeypatch)
+    test_utils.execute_command_and_assert(
+        'trestle author catalog-generate -n mycat -o md --trust-workspace --parsed-cache', 0, monkeypatch
+    )
+    assert not list(cache_dir.glob('*'))
+    test_utils.execute_command_and_assert('trestle validate -a --parsed-cache', 1, monkeypatch)
+    test_utils.execute_command_and_assert(
+        'trestle validate -f catalogs/mycat/catalog.json --parsed-cache', 1, monkeypatch
+    )
+    # models fetched as trusted are not memoized for fetches outside of the trusted workspace
+    href = 'trestle://catalogs/mycat/catalog.json'
+    with OscalBaseModel.trust_workspace(tmp_trestle_dir):
+        FetcherFactory.get_fetcher(tmp_trestle_dir, href).get_oscal()
+        FetcherFactory.get_fetcher(tmp_trestle_dir, href).get_oscal_with_model_type(Catalog)
+    with pytest.raises(ValidationError):
+        FetcherFactory.get_fetcher(tmp_trestle_dir, href).get_oscal()
+    with pytest.raises(TrestleError):
+        FetcherFactory.get_fetcher(tmp_trestle_dir, href).get_oscal_with_model_type(Catalog)
+
+
 def test_validate_direct(sample_catalog_minimal: Catalog, tmp_trestle_dir: pathlib.Path) -> None:
     """Test a validator by invoking it directly without CLI."""
     args = argparse.Namespace(mode=const.VAL_MODE_ALL, quiet=True)
@@ -300,6 +434,36 @@ def test_validate_distributed(
     assert pytest_wrapped_e.value.code == 0
 
 
+def test_all_validator_single_traversal(sample_catalog_rich_controls: Catalog, monkeypatch: MonkeyPatch) -> None:
+    """Test the all validator walks the model once for every validator that needs a traversal."""
+    visits = []
+
+    def count_visit_model(object_of_interest, visitors) -> None:
+        visits.append(len(visitors))
+        visit_model(object_of_interest, visitors)
+
+    monkeypatch.setattr(all_validator_module, 'visit_model', count_visit_model)
+    args = argparse.Namespace(mode=const.VAL_MODE_ALL)
+    validator: Validator = validator_factory.get(args)
+    assert validator.model_is_valid(sample_catalog_rich_controls, True, None)
+    # catalog, duplicates and links validators share the one traversal
+    assert visits == [3]
+
+    visitor = ValuesByNameVisitor(['uuid', 'href', 'prose'])
+    visit_model(sample_catalog_rich_controls, [visitor])
+    for name, values in visitor.values.items():
+        assert values == ModelUtils.find_values_by_name(sample_catalog_rich_controls, name)
+
+    visits.clear()
+    control = next(
+        control for control in CatalogInterface(sample_catalog_rich_controls).get_all_controls_from_dict()
+        if control.params and len(control.params) > 1
+    )
+    control.params[0].id = control.params[1].id
+    assert not validator.model_is_valid(sample_catalog_rich_controls, True, None)
+    assert visits == [3]
+
+
 def test_validate_catalog_params(sample_catalog_rich_controls: Catalog) -> None:
     """Test validation of unique param ids in catalog."""
     args = argparse.Namespace(mode=const.VAL_MODE_CATALOG)
@@ -15,14 +15,19 @@
 # limitations under the License.
 """Tests for trestle markdown_validator module."""
 import pathlib
+import shutil
+from unittest import mock
 
 import frontmatter
 
 import pytest
 
 import trestle.common.const as const
+from trestle.common.err import TrestleError
+from trestle.core.markdown.control_markdown_node import ControlMarkdownNode
 from trestle.core.markdown.docs_markdown_node import DocsMarkdownNode, DocsSectionContent
 from trestle.core.markdown.markdown_api import MarkdownAPI
+from trestle.core.markdown.markdown_processor import MarkdownProcessor
 
 
 @pytest.mark.parametrize('md_path', [(pathlib.Path('tests/data/markdown/valid_complex_md.md'))])
@@ -198,3 +203,37 @@ def test_get_header_level() -> None:
     assert node._get_header_level_if_valid('## #') == 2
     assert node._get_header_level_if_valid('### #') == 3
     assert node._get_header_level_if_valid('foo # bar') is None
+
+
+def test_control_markdown_cached_until_changed(testdata_dir: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    """Test parsed control markdown is reused until the file contents change."""
+    md_path = tmp_path / 'ac-1.md'
+    shutil.copyfile(testdata_dir / 'author/controls/control_with_components.md', md_path)
+    processor = MarkdownAPI().processor
+
+    header, tree = processor.process_control_markdown(md_path)
+    header['foo'] = 'bar'
+    tree.subnodes[0].content.control_title = 'changed by caller'
+
+    with mock.patch.object(ControlMarkdownNode, 'build_tree_from_markdown') as build_mock:
+        cached_header, cached_tree = processor.process_control_markdown(md_path)
+        assert build_mock.call_count == 0
+    assert 'foo' not in cached_header
+    assert cached_tree.subnodes[0].content.control_title != 'changed by caller'
+
+    md_path.write_text(md_path.read_text(encoding=const.FILE_ENCODING) + '\n', encoding=const.FILE_ENCODING)
+    with mock.patch.object(ControlMarkdownNode, 'build_tree_from_markdown', return_value=tree) as build_mock:
+        processor.process_control_markdown(md_path)
+        assert build_mock.call_count == 1
+
+
+def test_control_markdown_strict_gfm_not_cached(testdata_dir: pathlib.Path, tmp_path: pathlib.Path) -> None:
+    """Test control markdown is checked as Github Flavored Markdown when strict even if already cached."""
+    md_path = tmp_path / 'ac-1.md'
+    shutil.copyfile(testdata_dir / 'author/controls/control_with_components.md', md_path)
+    MarkdownAPI().processor.process_control_markdown(md_path)
+
+    strict_processor = MarkdownAPI(strict_gfm=True).processor
+    with mock.patch.object(MarkdownProcessor, 'render_gfm_to_html', side_effect=TrestleError('bad gfm')):
+        with pytest.raises(TrestleError):
+            strict_processor.process_control_markdown(md_path)
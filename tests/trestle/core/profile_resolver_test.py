@@ -16,23 +16,28 @@
 """Tests profile_resolver module."""
 
 import copy
+import json
 import pathlib
 import shutil
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import pytest
 
 from tests import test_utils
 
-from trestle.common.const import RESOLUTION_SOURCE
+from trestle.common import file_utils
+from trestle.common.const import FILE_ENCODING, RESOLUTION_SOURCE
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
 from trestle.core import generators as gens
 from trestle.core.catalog.catalog_interface import CatalogInterface
-from trestle.core.control_interface import ControlInterface, ParameterRep
+from trestle.core.control_interface import ControlInterface, ParamSubstituter, ParameterRep
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.profile_resolver import ProfileResolver
+from trestle.core.remote.cache import FetcherFactory, HTTPSFetcher
 from trestle.core.repository import Repository
+from trestle.core.resolver._import import Import
+from trestle.core.resolver.control_id_index import ControlIdIndex
 from trestle.core.resolver.merge import Merge
 from trestle.oscal import OSCAL_VERSION
 from trestle.oscal import catalog as cat
@@ -278,6 +283,24 @@ def test_profile_resolver_param_sub() -> None:
     assert new_text == 'Make sure that the cat is very well fed today.  Very well fed!'
 
 
+def test_profile_resolver_param_sub_nested() -> None:
+    """Test nested moustaches are resolved in one pass and circular references are left in place."""
+    param_1 = com.Parameter(id='p1', values=['owner of {{ insert: param, p2 }}'])
+    param_2 = com.Parameter(id='p2', values=['the cat'])
+    param_3 = com.Parameter(id='p3', values=['{{ p4 }}'])
+    param_4 = com.Parameter(id='p4', values=['{{ p3 }}'])
+    param_dict = {param.id: param for param in [param_1, param_2, param_3, param_4]}
+    substituter = ParamSubstituter(param_dict)
+
+    assert substituter.replace('Ask the {{ p1 }}.') == 'Ask the owner of the cat.'
+    assert substituter.replace('Loop {{ p3 }}.') == 'Loop {{ p3 }}.'
+    # rendered params are cached until forgotten
+    param_2.values = ['the dog']
+    assert substituter.replace('{{ p2 }}') == 'the cat'
+    substituter.forget('p2')
+    assert substituter.replace('{{ p2 }}') == 'the dog'
+
+
 def test_parameter_resolution(tmp_trestle_dir: pathlib.Path) -> None:
     """Test whether expected order of operations is preserved for parameter substution."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
@@ -337,6 +360,24 @@ def test_merge_two_catalogs() -> None:
     assert len(cat_1.params) == 6
 
 
+@pytest.mark.parametrize('method', ['merge', 'use-first'])
+def test_merge_lists_by_id_and_content(method: str) -> None:
+    """Test merged lists drop exact copies and combine items sharing an id."""
+    profile = gens.generate_sample_model(prof.Profile)
+    merge = Merge(profile)
+    dest = [com.Property(name='a', value='1'), com.Property(name='b', value='2', remarks='dest')]
+    src = [
+        com.Property(name='a', value='1'),
+        com.Property(name='b', value='2', remarks='src'),
+        com.Property(name='c', value='3'),
+        com.Property(name='c', value='3')
+    ]
+    merge._merge_lists(dest, src, method)
+    # exact copies in dest are skipped but duplicates new to dest are kept as in the source
+    assert [prop.name for prop in dest] == ['a', 'b', 'c', 'c']
+    assert dest[1].remarks == ('src' if method == 'merge' else 'dest')
+
+
 def test_add_props(tmp_trestle_dir: pathlib.Path) -> None:
     """Test all types of property additions."""
     test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
@@ -444,3 +485,147 @@ def test_remote_profile_relative_cat(tmp_trestle_dir: pathlib.Path) -> None:
     profile_path = 'https://raw.githubusercontent.com/usnistgov/oscal-content/690f517daaf3a6cbb4056d3cde6eae2756765620/nist.gov/SP800-53/rev5/json/NIST_SP-800-53_rev5_LOW-baseline_profile.json'  # noqa E501
     resolved_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, profile_path)
     assert len(resolved_cat.groups) > 10
+
+
+def test_profile_resolver_cache(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test resolved catalog is reused from the cache until an upstream model or argument changes."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    prof_a_path = ModelUtils.get_model_path_for_name_and_class(
+        tmp_trestle_dir, 'test_profile_a', prof.Profile, FileContentType.JSON
+    )
+    orig_cat, orig_props = ProfileResolver.get_resolved_profile_catalog_and_inherited_props(
+        tmp_trestle_dir, prof_a_path
+    )
+
+    # the pipeline must not run on a cache hit
+    def fail_process(*args, **kwargs):
+        raise TrestleError('pipeline should not run')
+
+    with monkeypatch.context() as m:
+        m.setattr(Import, 'process', fail_process)
+        cached_cat, cached_props = ProfileResolver.get_resolved_profile_catalog_and_inherited_props(
+            tmp_trestle_dir, prof_a_path
+        )
+        assert ModelUtils.models_are_equivalent(cached_cat, orig_cat)
+        assert cached_props == orig_props
+
+        # different resolver arguments or disabled cache need a fresh resolution
+        with pytest.raises(TrestleError):
+            ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, block_adds=True)
+        with pytest.raises(TrestleError):
+            ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path, use_cache=False)
+
+        # a change in a transitively imported profile invalidates the entry
+        prof_c: prof.Profile
+        prof_c, prof_c_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_c', prof.Profile)
+        prof_c.metadata.title = 'changed title'
+        prof_c.oscal_write(prof_c_path)
+        with pytest.raises(TrestleError):
+            ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+
+    new_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+    assert ModelUtils.models_are_equivalent(new_cat, orig_cat, True)
+
+
+def test_profile_resolver_parallel_imports(tmp_trestle_dir: pathlib.Path) -> None:
+    """Test concurrent resolution of sibling imports gives the same catalog as serial resolution."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    prof_a_path = ModelUtils.get_model_path_for_name_and_class(
+        tmp_trestle_dir, 'test_profile_a', prof.Profile, FileContentType.JSON
+    )
+    serial_cat, serial_props = ProfileResolver.get_resolved_profile_catalog_and_inherited_props(
+        tmp_trestle_dir, prof_a_path, use_cache=False
+    )
+    parallel_cat, parallel_props = ProfileResolver.get_resolved_profile_catalog_and_inherited_props(
+        tmp_trestle_dir, prof_a_path, use_cache=False, jobs=4
+    )
+    assert ModelUtils.models_are_equivalent(serial_cat, parallel_cat, True)
+    assert serial_props == parallel_props
+    serial_ids = CatalogInterface(serial_cat).get_control_ids()
+    assert serial_ids == CatalogInterface(parallel_cat).get_control_ids()
+
+
+def test_remote_profile_prefetch(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the remote import graph is prefetched once over pooled connections before resolution."""
+    profile_dict = json.loads((test_utils.JSON_TEST_DATA_PATH / 'simplified_nist_profile.json').read_text())
+    profile_dict['profile']['imports'][0]['href'] = 'catalog.json'
+    catalog_path = test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME
+    remote_files = {
+        'https://some.host/oscal/profile.json': json.dumps(profile_dict),
+        'https://some.host/oscal/catalog.json': catalog_path.read_text()
+    }
+    fetched_uris = []
+
+    def do_fetch_mock(self) -> None:
+        assert FetcherFactory.get_connection_pool() is not None
+        fetched_uris.append(self._uri)
+        self._cached_object_path.write_text(remote_files[self._uri])
+
+    loaded_names = []
+    load_file = file_utils.load_file
+
+    def load_file_mock(file_path: pathlib.Path) -> Dict[str, Any]:
+        loaded_names.append(file_path.name)
+        return load_file(file_path)
+
+    monkeypatch.setattr(HTTPSFetcher, '_do_fetch', do_fetch_mock)
+    monkeypatch.setattr(file_utils, 'load_file', load_file_mock)
+    resolved_cat = ProfileResolver.get_resolved_profile_catalog(
+        tmp_trestle_dir, 'https://some.host/oscal/profile.json', use_cache=False, jobs=2
+    )
+    assert resolved_cat.groups
+    assert sorted(fetched_uris) == sorted(remote_files.keys())
+    # the catalog is only parsed by the resolution, since the prefetch only parses profiles to find their imports
+    assert loaded_names.count('catalog.json') == 1
+    assert loaded_names.count('profile.json') == 2
+    assert FetcherFactory.get_connection_pool() is None
+
+
+@pytest.mark.parametrize(
+    'file_name, text, root_key',
+    [
+        ('a.json', '{\n  "catalog": {"uuid": "x"}}', 'catalog'), ('a.json', '\ufeff{"profile": {}}', 'profile'),
+        ('a.yaml', '# comment\n---\nprofile:\n  uuid: x\n', 'profile'), ('a.yaml', '{profile: {}}', None),
+        ('a.json', '[]', None)
+    ]
+)
+def test_peek_root_key(tmp_path: pathlib.Path, file_name: str, text: str, root_key: Optional[str]) -> None:
+    """Test the root key of a fetched file is found from its start without parsing it."""
+    file_path = tmp_path / file_name
+    file_path.write_text(text, encoding=FILE_ENCODING)
+    assert Import._peek_root_key(file_path) == root_key
+
+
+def test_control_id_index(tmp_trestle_dir: pathlib.Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test control ids of a resolved profile are reused from memory and disk until an upstream model changes."""
+    test_utils.setup_for_multi_profile(tmp_trestle_dir, False, True)
+    prof_a_path = ModelUtils.get_model_path_for_name_and_class(
+        tmp_trestle_dir, 'test_profile_a', prof.Profile, FileContentType.JSON
+    )
+    resolved_cat = ProfileResolver.get_resolved_profile_catalog(tmp_trestle_dir, prof_a_path)
+    expected_ids = set(CatalogInterface.get_control_ids_from_catalog(resolved_cat))
+    ControlIdIndex.clear()
+    index = ControlIdIndex(tmp_trestle_dir)
+    assert index.get_control_ids(str(prof_a_path)) == expected_ids
+    assert index.contains(str(prof_a_path), sorted(expected_ids)[0])
+    assert not index.contains(str(prof_a_path), 'not-a-control')
+
+    # the profile must not be resolved again while its imports are unchanged
+    def fail_resolve(*args, **kwargs):
+        raise TrestleError('profile should not be resolved')
+
+    with monkeypatch.context() as m:
+        m.setattr(ProfileResolver, 'get_resolved_profile_catalog', fail_resolve)
+        ControlIdIndex.clear()
+        assert ControlIdIndex(tmp_trestle_dir).get_control_ids(str(prof_a_path)) == expected_ids
+
+        # a change in a transitively imported profile needs a fresh resolution
+        prof_c: prof.Profile
+        prof_c, prof_c_path = ModelUtils.load_model_for_class(tmp_trestle_dir, 'test_profile_c', prof.Profile)
+        prof_c.metadata.title = 'changed title'
+        prof_c.oscal_write(prof_c_path)
+        with pytest.raises(TrestleError):
+            index.get_control_ids(str(prof_a_path))
+
+    assert index.get_control_ids(str(prof_a_path)) == expected_ids
+    ControlIdIndex.clear()
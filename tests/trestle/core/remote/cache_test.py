@@ -16,11 +16,13 @@
 """Testing for cache functionality."""
 
 import getpass
+import os
 import pathlib
 import random
 import string
 import time
-from typing import Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
 from urllib import parse
 
 from _pytest.monkeypatch import MonkeyPatch
@@ -29,6 +31,8 @@ from paramiko import SSHClient
 
 import pytest
 
+from tests import test_utils
+
 import trestle.common.const as const
 import trestle.common.err as err
 from trestle.common import file_utils
@@ -98,6 +102,31 @@ def test_local_fetcher_relative(tmp_trestle_dir: pathlib.Path) -> None:
     assert ModelUtils.models_are_equivalent(fetched_data, catalog_data)
 
 
+def test_fetcher_memoizes_parsed_model(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the fetched model is parsed once until the file changes and callers get independent copies."""
+    fetcher, catalog_data = get_catalog_fetcher(tmp_trestle_dir)
+    parse_dict = cache.parser.parse_dict
+    parsed = []
+
+    def parse_dict_mock(*args, **kwargs):
+        parsed.append(args[1])
+        return parse_dict(*args, **kwargs)
+
+    monkeypatch.setattr(cache.parser, 'parse_dict', parse_dict_mock)
+    first, root_key = fetcher.get_oscal()
+    first.metadata.title = 'changed by caller'
+    second, second_root_key = cache.FetcherFactory.get_fetcher(tmp_trestle_dir, fetcher._uri).get_oscal()
+    assert len(parsed) == 1
+    assert second_root_key == root_key == 'catalog'
+    assert ModelUtils.models_are_equivalent(second, catalog_data)
+
+    catalog_data.metadata.title = 'new title'
+    catalog_data.oscal_write(fetcher._cached_object_path)
+    third, _ = fetcher.get_oscal()
+    assert len(parsed) == 2
+    assert third.metadata.title == 'new title'
+
+
 def test_https_fetcher_fails(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test the HTTPS fetcher failing."""
     monkeypatch.setenv('myusername', 'user123')
@@ -135,6 +164,89 @@ def test_https_fetcher(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch)
         fetcher._update_cache()
 
 
+class _FakeResponse:
+    """Streamed response returned by the mocked requests.get."""
+
+    def __init__(self, status_code: int, body: bytes = b'', headers: Optional[Dict[str, str]] = None) -> None:
+        self.status_code = status_code
+        self.headers = headers if headers else {}
+        self._body = body
+
+    def iter_content(self, chunk_size: int):
+        for i in range(0, len(self._body), chunk_size):
+            yield self._body[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args) -> None:
+        pass
+
+
+def test_https_fetcher_conditional(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test the HTTPS fetcher only downloads the object again if the server says it changed."""
+    body = (test_utils.JSON_TEST_DATA_PATH / test_utils.SIMPLIFIED_NIST_CATALOG_NAME).read_bytes()
+    sent_headers = []
+    headers = {'ETag': '"v1"', 'Last-Modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    responses = [_FakeResponse(200, body, headers), _FakeResponse(304)]
+
+    def get_mock(url: str, **kwargs):
+        assert kwargs['stream']
+        sent_headers.append(kwargs['headers'])
+        return responses.pop(0)
+
+    monkeypatch.setattr(cache.requests, 'get', get_mock)
+    uri = 'https://some.host/path/to/catalog.json'
+    fetcher = cache.FetcherFactory.get_fetcher(tmp_trestle_dir, uri)
+    fetcher._update_cache()
+    assert fetcher._cached_object_path.read_bytes() == body
+    assert 'If-None-Match' not in sent_headers[0]
+
+    # make the cached copy look old, then force a fetch that the server answers with not modified
+    old_time = time.time() - const.DAY_SECONDS
+    os.utime(fetcher._cached_object_path, (old_time, old_time))
+    fetcher._update_cache(True)
+    assert sent_headers[1]['If-None-Match'] == '"v1"'
+    assert sent_headers[1]['If-Modified-Since'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert fetcher._cached_object_path.read_bytes() == body
+    assert not fetcher._is_stale()
+
+
+def test_connection_pool(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
+    """Test fetchers share one connection per host while a connection pool is open."""
+    connects = []
+
+    def connect_mock(self, u, username):
+        connects.append(u.hostname)
+        return None, SFTPClientMock()
+
+    class SFTPClientMock:
+
+        def get(self, remotepath: str, localpath: str) -> None:
+            pathlib.Path(localpath).write_text('{}')
+
+    monkeypatch.setattr(cache.SFTPFetcher, '_connect', connect_mock)
+    with cache.FetcherFactory.connection_pool() as pool:
+        with cache.FetcherFactory.connection_pool() as inner_pool:
+            assert inner_pool is pool
+        for name in ['a.json', 'b.json']:
+            cache.FetcherFactory.get_fetcher(tmp_trestle_dir, f'sftp://user@some.host/path/{name}')._update_cache()
+        cache.FetcherFactory.get_fetcher(tmp_trestle_dir, 'sftp://user@other.host/path/a.json')._update_cache()
+        session = pool.get_session('https://some.host/path/a.json')
+        assert pool.get_session('https://some.host/path/b.json') is session
+        assert pool.get_session('https://other.host/path/a.json') is not session
+        # sessions are not thread safe, so other threads get their own
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            thread_session = executor.submit(pool.get_session, 'https://some.host/path/a.json').result()
+        assert thread_session is not session
+    assert connects == ['some.host', 'other.host']
+    assert cache.FetcherFactory.get_connection_pool() is None
+
+    # without a pool every fetch connects
+    cache.FetcherFactory.get_fetcher(tmp_trestle_dir, 'sftp://user@some.host/path/c.json')._update_cache()
+    assert connects == ['some.host', 'other.host', 'some.host']
+
+
 def test_sftp_fetcher_load_system_keys_fails(tmp_trestle_dir: pathlib.Path, monkeypatch: MonkeyPatch) -> None:
     """Test the sftp fetcher when SSHClient loading of system host keys fails."""
 
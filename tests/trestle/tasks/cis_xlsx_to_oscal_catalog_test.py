@@ -25,6 +25,7 @@ from openpyxl import load_workbook
 import trestle.tasks.cis_xlsx_to_oscal_catalog as cis_xlsx_to_oscal_catalog
 from trestle.oscal.catalog import Catalog
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.xlsx_helper import read_merged_ranges, read_sheet_rows
 
 ocp_config = 'tests/data/tasks/cis-xlsx-to-oscal-catalog/test-cis-xlsx-to-oscal-catalog.ocp.config'
 rhel_config = 'tests/data/tasks/cis-xlsx-to-oscal-catalog/test-cis-xlsx-to-oscal-catalog.rhel.config'
@@ -286,3 +287,19 @@ def _validate_rhel(tmp_path: pathlib.Path):
     assert len(rs) == 1
     assert rs[
         0].description == 'CRYPTO-POLICIES(7):https://access.redhat.com/articles/3642912#what-polices-are-provided-1'
+
+
+def test_cis_xlsx_read_sheet_rows():
+    """Test streamed rows end at the last row with values."""
+    folder = 'tests/data/tasks/cis-xlsx-to-oscal-catalog'
+    file_ = f'{folder}/CIS_Red_Hat_Enterprise_Linux_8_Benchmark_v2.0.0.snippet.xlsx'
+    wb = load_workbook(file_, read_only=True)
+    work_sheet = wb['Combined']
+    # the sheet dimension claims the full row limit
+    assert work_sheet.max_row == 1048576
+    rows = read_sheet_rows(work_sheet)
+    wb.close()
+    assert len(rows) == 12
+    assert any(rows[-1])
+    merged_ranges = read_merged_ranges('tests/data/spread-sheet/good.xlsx', 'example_best_practices_controls')
+    assert [str(merged_range) for merged_range in merged_ranges] == ['D1:J1']
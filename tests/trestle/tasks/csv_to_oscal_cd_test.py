@@ -18,6 +18,7 @@ import configparser
 import csv
 import os
 import pathlib
+import uuid
 from typing import List
 from unittest import mock
 
@@ -28,7 +29,9 @@ import pytest
 from tests import test_utils
 
 import trestle.tasks.csv_to_oscal_cd as csv_to_oscal_cd
+from trestle.oscal.common import Property
 from trestle.oscal.component import ComponentDefinition
+from trestle.oscal.component import DefinedComponent
 from trestle.tasks.base_task import TaskOutcome
 
 
@@ -1396,6 +1399,65 @@ def test_execute_add_user_property(tmp_path: pathlib.Path) -> None:
     assert component.props[5].value == 'new-column-value-2'
 
 
+def test_csv_mgr_columns(tmp_path: pathlib.Path) -> None:
+    """Test csv manager looks up values by column from the header map."""
+    csv_path = pathlib.Path('tests/data/csv/bp.sample.v2.csv')
+    rows = _get_rows(csv_path)
+    csv_mgr = csv_to_oscal_cd._CsvMgr(csv_path)
+    rule_id_index = rows[0].index('Rule_Id')
+    assert csv_mgr.get_col_index('$$Rule_Id') == rule_id_index
+    assert csv_mgr.get_col_index('Rule_Id') == rule_id_index
+    assert csv_mgr.get_col_index('No_Such_Column') == -1
+    rule_keys = list(csv_mgr.get_rule_keys())
+    assert rule_keys
+    for rule_key in rule_keys:
+        row = rows[csv_mgr.get_row_number(rule_key) - 1]
+        assert csv_mgr.get_value(rule_key, 'Rule_Id') == row[rule_id_index]
+    # missing cells of a short row read as empty
+    rows[-1].pop()
+    short_csv_path = tmp_path / 'short-row.csv'
+    with open(short_csv_path, 'w', newline='') as f:
+        csv.writer(f, delimiter=',', quoting=csv.QUOTE_MINIMAL).writerows(rows)
+    with pytest.raises(RuntimeError, match=f'row "{len(rows)}" missing value for "Namespace"'):
+        csv_to_oscal_cd._CsvMgr(short_csv_path)
+
+
+def test_rule_set_props_index() -> None:
+    """Test props edited through the rule set index are placed in column order when committed."""
+
+    def prop(name: str, value: str, rule_set: str) -> Property:
+        return Property(name=name, value=value, remarks=rule_set)
+
+    component = DefinedComponent(
+        uuid=str(uuid.uuid4()),
+        type='Service',
+        title='title',
+        description='description',
+        props=[
+            prop('Rule_Id', 'rule-1', 'rule_set_0'),
+            prop('Parameter_Id', 'param-1', 'rule_set_0'),
+            prop('Rule_Id', 'rule-2', 'rule_set_1'),
+            prop('Rule_Description', 'desc-2', 'rule_set_1'),
+        ]
+    )
+    props_index = csv_to_oscal_cd._RuleSetPropsIndex(component)
+    assert props_index.get_rule_set('rule-2') == 'rule_set_1'
+    assert props_index.find('rule_set_0', 'Parameter_Id').value == 'param-1'
+    props_index.add(prop('Rule_Description', 'desc-1', 'rule_set_0'))
+    props_index.delete('rule_set_1', 'Rule_Description')
+    assert props_index.find('rule_set_0', 'Rule_Description').value == 'desc-1'
+    assert props_index.find('rule_set_1', 'Rule_Description') is None
+    # the component is unchanged until the edits are committed
+    assert len(component.props) == 4
+    props_index.commit()
+    assert [(p.remarks, p.name) for p in component.props] == [
+        ('rule_set_0', 'Rule_Id'),
+        ('rule_set_0', 'Rule_Description'),
+        ('rule_set_0', 'Parameter_Id'),
+        ('rule_set_1', 'Rule_Id'),
+    ]
+
+
 def test_execute_validation(tmp_path: pathlib.Path) -> None:
     """Test execute validation."""
     _, section = _get_config_section_init(tmp_path, 'test-csv-to-oscal-cd-bp.config')
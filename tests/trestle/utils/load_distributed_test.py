@@ -16,6 +16,7 @@
 """Tests for trestle load_distributed module."""
 
 import shutil
+import threading
 from typing import Dict
 
 import pytest
@@ -24,6 +25,7 @@ from tests import test_utils
 
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.oscal.catalog import Catalog
 from trestle.oscal.common import Role
 
@@ -82,7 +84,8 @@ def test_load_list_group(testdata_dir, tmp_trestle_dir):
     assert actual_groups == expected_groups.__root__
 
 
-def test_load_distributed(testdata_dir, tmp_trestle_dir):
+@pytest.mark.parametrize('jobs', [1, 4])
+def test_load_distributed(testdata_dir, tmp_trestle_dir, jobs):
     """Test massive distributed load, that includes recursive load and list."""
     # prepare trestle project dir with the file
     test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
@@ -98,7 +101,7 @@ def test_load_distributed(testdata_dir, tmp_trestle_dir):
     shutil.copytree(test_data_source, catalogs_dir)
 
     actual_model_type, actual_model_alias, actual_model_instance = ModelUtils.load_distributed(
-        catalog_file, tmp_trestle_dir)
+        catalog_file, tmp_trestle_dir, jobs=jobs)
 
     expected_model_instance = Catalog.oscal_read(testdata_dir / 'split_merge/load_distributed/catalog.json')
 
@@ -110,3 +113,24 @@ def test_load_distributed(testdata_dir, tmp_trestle_dir):
     with pytest.raises(TrestleError):
         actual_model_type, actual_model_alias, actual_model_instance = ModelUtils.load_distributed(
             catalog_file, tmp_trestle_dir, Dict)
+
+
+def test_load_distributed_leaf_list_concurrent(testdata_dir, tmp_trestle_dir, monkeypatch):
+    """Test that the files of a list split below the first level are read concurrently."""
+    test_utils.ensure_trestle_config_dir(tmp_trestle_dir)
+    catalogs_dir = tmp_trestle_dir / 'catalogs'
+    shutil.rmtree(catalogs_dir)
+    shutil.copytree(testdata_dir / 'split_merge/step4_split_groups_array/catalogs', catalogs_dir)
+    roles_dir = catalogs_dir / 'mycatalog/catalog/metadata/roles'
+    # both role files must be read at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=10)
+    orig_oscal_read = OscalBaseModel.oscal_read.__func__
+
+    def oscal_read_at_barrier(cls, path):
+        if path.parent == roles_dir:
+            barrier.wait()
+        return orig_oscal_read(cls, path)
+
+    monkeypatch.setattr(OscalBaseModel, 'oscal_read', classmethod(oscal_read_at_barrier))
+    _, _, catalog = ModelUtils.load_distributed(catalogs_dir / 'mycatalog/catalog.json', tmp_trestle_dir, jobs=4)
+    assert len(catalog.metadata.roles) == 2
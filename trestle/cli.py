@@ -75,6 +75,16 @@ class Trestle(CommandBase):
         self.add_argument(
             '-tr', '--trestle-root', help='Path of trestle root dir', type=pathlib.Path, default=pathlib.Path.cwd()
         )
+        self.add_argument(
+            '--trust-workspace',
+            help='Read models in the workspace without validating them, assuming they were written by trestle',
+            action='store_true'
+        )
+        self.add_argument(
+            '--parsed-cache',
+            help='Cache models validated when read from large files of the workspace, to load them faster later',
+            action='store_true'
+        )
 
 
 def run() -> None:
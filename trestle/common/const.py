@@ -212,6 +212,25 @@ HOUR_SECONDS: int = 3600
 
 DAY_SECONDS: int = 24 * HOUR_SECONDS
 
+# suffix of the file next to an object cached via https holding its validators for conditional requests
+HTTP_CACHE_META_SUFFIX = '.http-meta.json'
+
+HTTP_DOWNLOAD_CHUNK_SIZE: int = 64 * 1024
+
+# maximum number of models parsed from fetched files kept in memory
+PARSED_MODEL_MEMO_MAX_ENTRIES: int = 16
+
+# number of characters read from the start of a fetched file to find its model type without parsing it
+ROOT_KEY_PEEK_CHARS: int = 4096
+
+# subdirectory of the trestle cache holding pickled models parsed from large oscal files
+PARSED_CACHE_DIR = '__parsed__'
+
+PARSED_CACHE_MAX_ENTRIES: int = 32
+
+# oscal files smaller than this are parsed directly rather than loaded from the parsed cache
+PARSED_CACHE_MIN_BYTES: int = 256 * 1024
+
 FILE_URI = 'file:///'
 
 SFTP_URI = 'sftp://'
@@ -237,6 +256,31 @@ CACHE_ABS_DIR = '__abs__'
 
 UNIX_CACHE_ROOT = '__root__'
 
+# subdirectory of the trestle cache holding resolved profile catalogs
+RESOLVED_CACHE_DIR = '__resolved__'
+
+RESOLVED_CACHE_MAX_ENTRIES: int = 64
+
+# subdirectory of the trestle cache holding the control ids of resolved profile catalogs
+CONTROL_ID_INDEX_DIR = '__control_ids__'
+
+CONTROL_ID_INDEX_MAX_ENTRIES: int = 256
+
+# maximum number of generated stripped and collection model types kept in memory
+MODEL_TYPE_CACHE_MAX_ENTRIES: int = 512
+
+# maximum number of parsed control markdown trees kept in memory
+MARKDOWN_TREE_CACHE_MAX_ENTRIES: int = 4096
+
+# file in the trestle cache holding digests of models that passed validation
+VALIDATED_DIGESTS_FILE = 'validated.json'
+
+# file in the trestle cache holding digests of the inputs and content of generated control markdown
+GENERATED_MD_DIGESTS_FILE = 'generated_md.json'
+
+# subdirectory of the trestle cache holding the parsed content of control markdown read by assemble
+ASSEMBLED_MD_CACHE_DIR = '__assembled__'
+
 TRESTLE_HREF_HEADING = 'trestle://'
 
 TRESTLE_HREF_REGEX = '^trestle://[^/]'
@@ -318,6 +362,12 @@ HELP_REGENERATE = 'Flag to force generation of new uuids in the model'
 
 HELP_VERSION = 'New version for the assembled model'
 
+HELP_JOBS = 'Number of parallel workers to use, default 1'
+
+HELP_JOBS_GENERATE = 'Accepted for symmetry with assemble but has no effect, since the markdown is written serially'
+
+HELP_CHANGED_ONLY = 'Skip models unchanged since they last passed validation'
+
 HELP_SECTIONS = 'Comma-separated list of sections as short_name_no_spaces:long name with spaces'
 
 HELP_REQUIRED_SECTIONS = 'Short names of sections that must be in the assembled model, comma-separated'
@@ -34,7 +34,8 @@ class TrestleError(RuntimeError):
         Args:
             msg (str): The error message
         """
-        RuntimeError.__init__(self)
+        # pass msg on so the error survives pickling, e.g. when raised in a worker process
+        RuntimeError.__init__(self, msg)
         self.msg = msg
 
     def __str__(self) -> str:
@@ -14,12 +14,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Common utilities for the OSCAL models and directories."""
+import dataclasses
+import functools
+import hashlib
 import importlib
+import json
 import logging
 import pathlib
 import re
+import time
 import uuid
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from datetime import datetime
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Type, Union
 
@@ -48,7 +55,8 @@ class ModelUtils:
     def load_distributed(
         abs_path: Path,
         abs_trestle_root: Path,
-        collection_type: Optional[Type[Any]] = None
+        collection_type: Optional[Type[Any]] = None,
+        jobs: int = 1
     ) -> Tuple[Type[OscalBaseModel],
                str,
                Optional[Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]]]:
@@ -63,6 +71,7 @@ class ModelUtils:
             collection_type: The type of collection model, if it is a collection model.
                 typing.List is the only collection type handled or expected.
                 Defaults to None.
+            jobs: Number of threads used to read the files of a decomposed model concurrently.
 
         Returns:
             Return a tuple of Model Type (e.g. class 'trestle.oscal.catalog.Catalog'),
@@ -74,6 +83,23 @@ class ModelUtils:
             This does not validate the model.  You must either validate the model separately or use the load_validate
             utilities.
         """
+        if jobs > 1:
+            # one pool reads the files at every level of the model, so split lists are loaded concurrently too
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                return ModelUtils._load_distributed(abs_path, abs_trestle_root, collection_type, executor)
+        return ModelUtils._load_distributed(abs_path, abs_trestle_root, collection_type, None)
+
+    @staticmethod
+    def _load_distributed(
+        abs_path: Path, abs_trestle_root: Path, collection_type: Optional[Type[Any]], executor: Optional[Executor]
+    ) -> Tuple[Type[OscalBaseModel],
+               str,
+               Optional[Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]]]:
+        """
+        Load the model with the files read by the executor, if any.
+
+        Only the calling thread waits for files read by the executor, so its workers never block one another.
+        """
         # if trying to load file that does not exist, load path instead
         if not abs_path.exists():
             abs_path = abs_path.with_name(abs_path.stem)
@@ -84,7 +110,7 @@ class ModelUtils:
         if collection_type:
             # If the path contains a list type model
             if collection_type is list:
-                return ModelUtils._load_list(abs_path, abs_trestle_root)
+                return ModelUtils._load_list(abs_path, abs_trestle_root, executor)
             # the only other collection type in OSCAL is dict, and it only applies to include_all,
             # which is too granular ever to be loaded by this routine
             else:
@@ -93,24 +119,28 @@ class ModelUtils:
         # Get current model
         primary_model_type, primary_model_alias = ModelUtils.get_stripped_model_type(abs_path, abs_trestle_root)
         primary_model_instance: Optional[Union[OscalBaseModel, List[OscalBaseModel], Dict[str, OscalBaseModel]]] = None
+        primary_model_future: Optional[Future] = None
 
         # is this an attempt to load an actual json or yaml file?
         content_type = FileContentType.path_to_content_type(abs_path)
         # if file is sought but it doesn't exist, ignore and load as decomposed model
         if FileContentType.is_readable_file(content_type) and abs_path.exists():
-            primary_model_instance = primary_model_type.oscal_read(abs_path)
+            if executor is None:
+                primary_model_instance = ModelUtils._read_file(primary_model_type, abs_path)
+            else:
+                # read the file while its decomposed parts are loaded
+                primary_model_future = executor.submit(ModelUtils._read_file, primary_model_type, abs_path)
         # Is model decomposed?
         decomposed_dir = abs_path.with_name(abs_path.stem)
 
         if decomposed_dir.exists():
             aliases_not_to_be_stripped = []
             instances_to_be_merged: List[OscalBaseModel] = []
+            paths_to_be_loaded: List[Tuple[Path, Optional[Type[Any]]]] = []
 
             for local_path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(decomposed_dir)):
                 if local_path.is_file():
-                    model_type, model_alias, model_instance = ModelUtils.load_distributed(local_path, abs_trestle_root)
-                    aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
-                    instances_to_be_merged.append(model_instance)
+                    paths_to_be_loaded.append((local_path, None))
 
                 elif local_path.is_dir():
                     model_type, model_alias = ModelUtils.get_stripped_model_type(local_path, abs_trestle_root)
@@ -126,12 +156,14 @@ class ModelUtils:
 
                     if model_type.is_collection_container():
                         # This directory is a decomposed List or Dict
-                        collection_type = model_type.get_collection_type()
-                        model_type, model_alias, model_instance = ModelUtils.load_distributed(local_path,
-                                                                                              abs_trestle_root,
-                                                                                              collection_type)
-                        aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
-                        instances_to_be_merged.append(model_instance)
+                        paths_to_be_loaded.append((local_path, model_type.get_collection_type()))
+
+            for _, model_alias, model_instance in ModelUtils._load_paths(paths_to_be_loaded, abs_trestle_root,
+                                                                         executor):
+                aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
+                instances_to_be_merged.append(model_instance)
+            if primary_model_future is not None:
+                primary_model_instance = primary_model_future.result()
             primary_model_dict = {}
             if primary_model_instance is not None:
                 primary_model_dict = primary_model_instance.__dict__
@@ -157,8 +189,18 @@ class ModelUtils:
 
             merged_model_instance = merged_model_type(**primary_model_dict)
             return merged_model_type, merged_model_alias, merged_model_instance
+        if primary_model_future is not None:
+            primary_model_instance = primary_model_future.result()
         return primary_model_type, primary_model_alias, primary_model_instance
 
+    @staticmethod
+    def _read_file(model_type: Type[OscalBaseModel], abs_path: Path) -> Optional[OscalBaseModel]:
+        """Read a single file of a model."""
+        start = time.perf_counter()
+        model_instance = model_type.oscal_read(abs_path)
+        logger.debug(f'loaded {abs_path} in {time.perf_counter() - start:.4f}s')
+        return model_instance
+
     @staticmethod
     def load_model_for_class(
         trestle_root: pathlib.Path,
@@ -252,6 +294,12 @@ class ModelUtils:
 
         return model_type, full_alias
 
+    @staticmethod
+    @functools.lru_cache(maxsize=const.MODEL_TYPE_CACHE_MAX_ENTRIES)
+    def _create_collection_model_type(class_name: str, collection_type: Type[Any]) -> Type[OscalBaseModel]:
+        """Create the model wrapping a collection type once per class name and collection type."""
+        return create_model(class_name, __base__=OscalBaseModel, __root__=(collection_type, ...))
+
     @staticmethod
     def get_stripped_model_type(
         absolute_path: pathlib.Path,
@@ -277,7 +325,7 @@ class ModelUtils:
             malias = model_alias.split('.')[-1]
             class_name = alias_to_classname(malias, AliasMode.JSON)
             logger.debug(f'collection field type class name {class_name} and alias {malias}')
-            model_type = create_model(class_name, __base__=OscalBaseModel, __root__=(singular_model_type, ...))
+            model_type = ModelUtils._create_collection_model_type(class_name, singular_model_type)
             logger.debug(f'model_type created: {model_type}')
             return model_type, model_alias
 
@@ -508,21 +556,53 @@ class ModelUtils:
         return name[0] == '.' or name[0] == '_'
 
     @staticmethod
-    def _load_list(abs_path: Path, abs_trestle_root: Path) -> Tuple[Type[OscalBaseModel], str, List[OscalBaseModel]]:
-        """Given path to a directory of list(array) models, load the distributed models."""
-        aliases_not_to_be_stripped = []
-        instances_to_be_merged: List[OscalBaseModel] = []
-        collection_model_type, collection_model_alias = ModelUtils.get_stripped_model_type(abs_path, abs_trestle_root)
-        for path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(abs_path)):
-
-            # ASSUMPTION HERE: if it is a directory, there's a file that can not be decomposed further.
-            if path.is_dir():
-                continue
-            _, model_alias, model_instance = ModelUtils.load_distributed(path, abs_trestle_root)
+    def _load_paths(
+        paths: List[Tuple[Path, Optional[Type[Any]]]], abs_trestle_root: Path, executor: Optional[Executor]
+    ) -> List[Tuple[Type[OscalBaseModel], str, Any]]:
+        """
+        Load the sibling files and collection directories of a decomposed model in the order given.
 
-            instances_to_be_merged.append(model_instance)
-            aliases_not_to_be_stripped.append(model_alias.split('.')[-1])
+        With an executor the files that are not decomposed further are read by it, while each decomposed part is
+        loaded by the calling thread with the same executor, so the files at every level are read concurrently.
+        """
+        start = time.perf_counter()
+        if executor is None:
+            results = [
+                ModelUtils._load_distributed(path, abs_trestle_root, collection_type, None)
+                for path, collection_type in paths
+            ]
+        else:
+            results = [None] * len(paths)
+            futures: Dict[int, Future] = {}
+            for i, (path, collection_type) in enumerate(paths):
+                if collection_type is None and not path.with_name(path.stem).exists():
+                    futures[i] = executor.submit(ModelUtils._load_distributed, path, abs_trestle_root, None, None)
+            for i, (path, collection_type) in enumerate(paths):
+                if i not in futures:
+                    results[i] = ModelUtils._load_distributed(path, abs_trestle_root, collection_type, executor)
+            for i, future in futures.items():
+                results[i] = future.result()
+        if paths:
+            logger.debug(
+                f'loaded {len(paths)} parts in {paths[0][0].parent} in {time.perf_counter() - start:.4f}s '
+                f'{"concurrently" if executor else "serially"}'
+            )
+        return results
 
+    @staticmethod
+    def _load_list(abs_path: Path,
+                   abs_trestle_root: Path,
+                   executor: Optional[Executor] = None) -> Tuple[Type[OscalBaseModel], str, List[OscalBaseModel]]:
+        """Given path to a directory of list(array) models, load the distributed models."""
+        collection_model_type, collection_model_alias = ModelUtils.get_stripped_model_type(abs_path, abs_trestle_root)
+        # ASSUMPTION HERE: if it is a directory, there's a file that can not be decomposed further.
+        paths_to_be_loaded: List[Tuple[Path, Optional[Type[Any]]]] = [
+            (path, None)
+            for path in sorted(trestle.common.file_utils.iterdir_without_hidden_files(abs_path))
+            if not path.is_dir()
+        ]
+        loaded_paths = ModelUtils._load_paths(paths_to_be_loaded, abs_trestle_root, executor)
+        instances_to_be_merged = [model_instance for _, _, model_instance in loaded_paths]
         return collection_model_type, collection_model_alias, instances_to_be_merged
 
     @staticmethod
@@ -702,6 +782,11 @@ class ModelUtils:
     def has_no_duplicate_values_by_name(object_of_interest: BaseModel, name_of_interest: str) -> bool:
         """Determine if duplicate values of type exist in object."""
         loe = ModelUtils.find_values_by_name(object_of_interest, name_of_interest)
+        return ModelUtils.has_no_duplicate_values(loe)
+
+    @staticmethod
+    def has_no_duplicate_values(loe: List[Any]) -> bool:
+        """Determine if the list of values has no duplicates, and warn of any found."""
         set_loe = set(loe)
         if len(loe) == len(set_loe):
             return True
@@ -718,10 +803,16 @@ class ModelUtils:
     def find_uuid_refs(object_of_interest: BaseModel) -> Set[str]:
         """Find uuid references made in prose and links."""
         # hrefs have form #foo or #uuid
-        uuid_strs = ModelUtils.find_values_by_name(object_of_interest, 'href')
+        hrefs = ModelUtils.find_values_by_name(object_of_interest, 'href')
+        prose_list = ModelUtils.find_values_by_name(object_of_interest, 'prose')
+        return ModelUtils.find_uuid_refs_in_values(hrefs, prose_list)
+
+    @staticmethod
+    def find_uuid_refs_in_values(hrefs: List[str], prose_list: List[str]) -> Set[str]:
+        """Find uuid references in lists of hrefs and prose already collected from a model."""
+        uuid_strs = list(hrefs)
 
         # prose has uuid refs in markdown form: [foo](#bar) or [foo](#uuid)
-        prose_list = ModelUtils.find_values_by_name(object_of_interest, 'prose')
         for prose in prose_list:
             matches = re.findall(const.MARKDOWN_URL_REGEX, prose)
             # the [1] is to extract the inner of 3 capture patterns
@@ -940,6 +1031,29 @@ class ModelUtils:
         type_list = uuid_type_list if ignore_all_uuid else [common.LastModified]
         return not ModelUtils._objects_differ(model_a, model_b, type_list, ['last_modified'], ignore_all_uuid)
 
+    @staticmethod
+    def _digest_default(obj: Any) -> Any:
+        """Convert objects that json cannot serialize to a form that can be hashed."""
+        if isinstance(obj, BaseModel):
+            return obj.dict(exclude_none=True)
+        if dataclasses.is_dataclass(obj):
+            return dataclasses.asdict(obj)
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, (set, frozenset)):
+            return sorted(obj, key=str)
+        return str(obj)
+
+    @staticmethod
+    def get_digest(*items: Any) -> str:
+        """
+        Get a sha256 digest of the content of the items, which may be models, dataclasses, dicts and lists of them.
+
+        Dicts are not sorted since the order of their keys is often carried into the output.
+        """
+        text = json.dumps(items, default=ModelUtils._digest_default)
+        return hashlib.sha256(text.encode(const.FILE_ENCODING)).hexdigest()
+
     @staticmethod
     def get_title_from_model_uri(trestle_root: pathlib.Path, uri: str) -> str:
         """Get title from model at uri."""
@@ -19,7 +19,7 @@ from typing import Optional
 
 import trestle.core.validator_factory as vfact
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
+from trestle.core.validator import Validator, visit_model
 
 
 class AllValidator(Validator):
@@ -31,6 +31,10 @@ class AllValidator(Validator):
         """Return information on which validation failed."""
         return self.last_failure_msg
 
+    def reads_imported_models(self) -> bool:
+        """Determine if any of the registered validators reads the models imported by the model."""
+        return any(val.reads_imported_models() for val in vfact.validator_factory.get_all() if val != self)
+
     def model_is_valid(self, model: OscalBaseModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None) -> bool:
         """
         Validate an oscal model against all available validators in the trestle library.
@@ -43,8 +47,13 @@ class AllValidator(Validator):
             True (valid) if the model passed all registered validators.
         """
         self.last_failure_msg = self.__doc__
-        for val in vfact.validator_factory.get_all():
-            if val != self and not val.model_is_valid(model, quiet, trestle_root):
+        # validators that walk the whole model share a single traversal
+        validators = [val for val in vfact.validator_factory.get_all() if val != self]
+        validators_and_visitors = [(val, val.get_visitor(model, quiet, trestle_root)) for val in validators]
+        visit_model(model, [visitor for _, visitor in validators_and_visitors if visitor is not None])
+        for val, visitor in validators_and_visitors:
+            is_valid = visitor.is_valid() if visitor is not None else val.model_is_valid(model, quiet, trestle_root)
+            if not is_valid:
                 self.last_failure_msg = val.error_msg()
                 return False
         return True
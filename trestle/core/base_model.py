@@ -27,14 +27,18 @@ I can write a comment in here and you can even edit on the same line.
 """
 
 import datetime
+import functools
 import logging
 import pathlib
-from typing import Any, Dict, List, Optional, Type, cast
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple, Type, cast
 
 import orjson
 
-from pydantic.v1 import Extra, Field, create_model
-from pydantic.v1.fields import ModelField
+from pydantic.v1 import BaseModel, ConstrainedStr, Extra, Field, create_model, validate_model
+from pydantic.v1.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 from pydantic.v1.parse import load_file
 
 from ruamel.yaml import YAML
@@ -44,10 +48,35 @@ import trestle.common.err as err
 from trestle.common.str_utils import AliasMode, classname_to_alias
 from trestle.common.type_utils import get_origin, is_collection_field_type
 from trestle.core.models.file_content_type import FileContentType
+from trestle.core.parsed_model_cache import ParsedModelCache
 from trestle.core.trestle_base_model import TrestleBaseModel
 
 logger = logging.getLogger(__name__)
 
+# assignments whose validation was deferred in the innermost bulk_edit scope of the current thread or task, with the
+# values they replaced, or None outside of any scope
+_bulk_edit_journal: ContextVar[Optional[List[Tuple[BaseModel, str, Any, bool]]]] = ContextVar(
+    'bulk_edit_journal', default=None
+)
+
+# root of the workspace whose models are read without validation in the current thread or task, if any
+_trusted_root: ContextVar[Optional[pathlib.Path]] = ContextVar('trusted_root', default=None)
+
+
+@functools.lru_cache(maxsize=const.MODEL_TYPE_CACHE_MAX_ENTRIES)
+def _create_stripped_model_type(model_type: Type['OscalBaseModel'],
+                                excluded_fields: FrozenSet[str]) -> Type['OscalBaseModel']:
+    """Create the stripped model type once per model type and set of excluded fields."""
+    return model_type._build_stripped_model_type(excluded_fields)
+
+
+@functools.lru_cache(maxsize=const.MODEL_TYPE_CACHE_MAX_ENTRIES)
+def _trusted_fields(model_type: Type['OscalBaseModel']) -> Tuple[Dict[str, ModelField], FrozenSet[str]]:
+    """Map the aliases and names of the fields of the model type to the fields, along with the required names."""
+    fields = {field.name: field for field in model_type.__fields__.values()}
+    fields.update(model_type.alias_to_field_map())
+    return fields, frozenset(name for name, field in model_type.__fields__.items() if field.required)
+
 
 def robust_datetime_serialization(input_dt: datetime.datetime) -> str:
     """Return a nicely formatted string for in a format compatible with OSCAL specifications.
@@ -98,6 +127,167 @@ class OscalBaseModel(TrestleBaseModel):
         # Validate on assignment of variables to ensure no escapes
         validate_assignment = True
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute, deferring validation of model values if inside a bulk_edit scope."""
+        journal = _bulk_edit_journal.get()
+        if journal is not None and OscalBaseModel._needs_no_coercion(self.__fields__.get(name, None), value):
+            journal.append((self, name, self.__dict__.get(name, None), name in self.__fields_set__))
+            # lists are copied as validation would, so later changes to the list passed in do not change the model
+            self.__dict__[name] = list(value) if isinstance(value, list) else value
+            self.__fields_set__.add(name)
+            return
+        super().__setattr__(name, value)
+
+    @staticmethod
+    def _needs_no_coercion(field: Optional[ModelField], value: Any) -> bool:
+        """Determine if the value is a model or a non-empty list of models already of the type held by the field."""
+        if field is None or not (isinstance(field.type_, type) and issubclass(field.type_, BaseModel)):
+            return False
+        if isinstance(value, list):
+            return field.shape == SHAPE_LIST and bool(value) and all(isinstance(item, field.type_) for item in value)
+        return field.shape == SHAPE_SINGLETON and isinstance(value, field.type_)
+
+    @staticmethod
+    def _undo_assignments(journal: List[Tuple[BaseModel, str, Any, bool]]) -> None:
+        """Restore the values replaced by the deferred assignments, most recent first."""
+        for model, name, old_value, was_set in reversed(journal):
+            model.__dict__[name] = old_value
+            if not was_set:
+                model.__fields_set__.discard(name)
+
+    @classmethod
+    @contextmanager
+    def bulk_edit(cls, model: Optional['OscalBaseModel'] = None) -> Iterator[Optional['OscalBaseModel']]:
+        """
+        Defer validation of attribute assignments until the end of a block of edits.
+
+        Inside the scope, assignments to fields of any OscalBaseModel in the current thread or task of models, or
+        lists of models, already of the type held by the field are not validated, which avoids repeated validation
+        and copying of large models as they are built up.  Lists are still copied, and other values are validated
+        and coerced on assignment as usual.  On normal exit the model, if provided, is validated once in full.  If
+        the scope exits with an error, including a failed validation of the model, the deferred assignments made in
+        it are undone.
+
+        Args:
+            model: The model to validate on exit of the scope.
+
+        Raises:
+            err.TrestleError: If the model is not valid on exit.
+        """
+        journal: List[Tuple[BaseModel, str, Any, bool]] = []
+        token = _bulk_edit_journal.set(journal)
+        try:
+            yield model
+            if model is not None:
+                model.validate_fields()
+        except BaseException:
+            OscalBaseModel._undo_assignments(journal)
+            raise
+        finally:
+            _bulk_edit_journal.reset(token)
+        # the assignments are undone with those of the enclosing scope if it fails
+        outer_journal = _bulk_edit_journal.get()
+        if outer_journal is not None:
+            outer_journal.extend(journal)
+
+    def validate_fields(self) -> None:
+        """
+        Validate all fields of the model recursively.
+
+        Raises:
+            err.TrestleError: If any field is not valid.
+        """
+        _, _, error = validate_model(self.__class__, self.dict())
+        if error:
+            raise err.TrestleError(f'Validation of {self.__class__.__name__} failed: {error}')
+
+    @classmethod
+    @contextmanager
+    def trust_workspace(cls, trestle_root: Optional[pathlib.Path]) -> Iterator[None]:
+        """
+        Read models from the files of a trestle workspace without validating them.
+
+        Inside the scope, oscal files read in the current thread or task from the workspace, other than those in its
+        .trestle directory, are assumed to be valid output of trestle and are constructed directly rather than
+        validated.  Files outside the workspace, and fetched remote content cached in it, are still validated.
+
+        Args:
+            trestle_root: The root of the trusted workspace, or None to trust nothing.
+        """
+        token = _trusted_root.set(trestle_root.resolve() if trestle_root else None)
+        try:
+            yield
+        finally:
+            _trusted_root.reset(token)
+
+    @staticmethod
+    def is_trusted_path(path: pathlib.Path) -> bool:
+        """Determine if the file is in the workspace trusted by the current trust_workspace scope."""
+        trusted_root = _trusted_root.get()
+        if trusted_root is None:
+            return False
+        try:
+            rel_path = path.resolve().relative_to(trusted_root)
+        except ValueError:
+            return False
+        return not rel_path.parts or rel_path.parts[0] != const.TRESTLE_CONFIG_DIR
+
+    @classmethod
+    def trusted_construct(cls, obj: Any) -> 'OscalBaseModel':
+        """
+        Build the model from already validated data without running the full validation.
+
+        Nested models are constructed recursively, string and enum values are used as is and other values are
+        validated individually.  Validators of the models are not run, so the data must come from trestle itself,
+        e.g. a model previously written by trestle.  Data that does not fit the fields of the model is parsed with
+        full validation instead.
+
+        Args:
+            obj: The data of the model as loaded from json or yaml, with the root key removed.
+
+        Returns:
+            The model constructed from the data.
+        """
+        if isinstance(obj, cls):
+            return obj
+        if cls.__custom_root_type__:
+            return cls.construct(__root__=cls._trusted_value(cls.__fields__['__root__'], obj))
+        if not isinstance(obj, dict):
+            return cls.parse_obj(obj)
+        fields, required_names = _trusted_fields(cls)
+        values: Dict[str, Any] = {}
+        for key, value in obj.items():
+            field = fields.get(key)
+            if field is None:
+                return cls.parse_obj(obj)
+            values[field.name] = value
+        if not required_names.issubset(values):
+            return cls.parse_obj(obj)
+        for name, value in values.items():
+            values[name] = cls._trusted_value(cls.__fields__[name], value)
+        return cls.construct(**values)
+
+    @classmethod
+    def _trusted_value(cls, field: ModelField, value: Any) -> Any:
+        """Build the value of a field from trusted data, validating only values of unexpected type."""
+        if value is None:
+            return None
+        if field.shape == SHAPE_LIST and isinstance(value, list) and field.sub_fields:
+            return [cls._trusted_value(field.sub_fields[0], item) for item in value]
+        if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+            type_ = field.type_
+            if isinstance(type_, type) and issubclass(type_, OscalBaseModel):
+                return type_.trusted_construct(value)
+            is_str_type = type_ is str or isinstance(type_, type) and issubclass(type_, ConstrainedStr)
+            if is_str_type and isinstance(value, str):
+                return value
+            if isinstance(type_, type) and issubclass(type_, Enum):
+                return type_(value)
+        validated, error = field.validate(value, {}, loc=field.alias, cls=cls)
+        if error:
+            raise err.TrestleError(f'Invalid value for {field.alias} of {cls.__name__}: {error}')
+        return validated
+
     @classmethod
     def create_stripped_model_type(
         cls,
@@ -129,7 +319,8 @@ class OscalBaseModel(TrestleBaseModel):
         # create alias to field_name mapping
         excluded_fields = []
         if stripped_fields is not None:
-            excluded_fields = stripped_fields
+            # a single field name may be passed as a plain string
+            excluded_fields = [stripped_fields] if isinstance(stripped_fields, str) else stripped_fields
         elif stripped_fields_aliases is not None:
             alias_to_field = cls.alias_to_field_map()
             try:
@@ -137,6 +328,11 @@ class OscalBaseModel(TrestleBaseModel):
             except KeyError as e:
                 raise err.TrestleError(f'Field {str(e)} does not exist in the model')
 
+        return _create_stripped_model_type(cls, frozenset(excluded_fields))
+
+    @classmethod
+    def _build_stripped_model_type(cls, excluded_fields: FrozenSet[str]) -> Type['OscalBaseModel']:
+        """Build a new pydantic model from the current model without the excluded fields."""
         current_fields = cls.__fields__
         new_fields_for_model = {}
         # Build field list
@@ -281,7 +477,7 @@ class OscalBaseModel(TrestleBaseModel):
             write_file.close()
 
     @classmethod
-    def oscal_read(cls, path: pathlib.Path) -> Optional['OscalBaseModel']:
+    def oscal_read(cls, path: pathlib.Path, trusted: bool = False) -> Optional['OscalBaseModel']:
         """
         Read OSCAL objects.
 
@@ -289,6 +485,8 @@ class OscalBaseModel(TrestleBaseModel):
 
         Args:
             path: The path of the oscal object to read.
+            trusted: Construct the model without validation since the file is known to be valid trestle output.
+                Files in the workspace of a trust_workspace scope are always read as trusted.
         Returns:
             The oscal object read into trestle oscal models.
         """
@@ -302,6 +500,12 @@ class OscalBaseModel(TrestleBaseModel):
             logger.warning(f'path does not exist in oscal_read: {path}')
             return None
 
+        # large files validated before in the workspace of a ParsedModelCache.enable scope are loaded from its cache
+        parsed_cache = ParsedModelCache(path, f'{cls.__module__}.{cls.__qualname__}')
+        cached = parsed_cache.load()
+        if cached is not None and alias in cached:
+            return cls.trusted_construct(cached[alias])
+
         obj: Dict[str, Any] = {}
         try:
             if content_type == FileContentType.YAML:
@@ -322,12 +526,19 @@ class OscalBaseModel(TrestleBaseModel):
                     f'Invalid OSCAL file structure, oscal file '
                     f'does not have a single top level key wrapping it. It has {len(obj)} keys.'
                 )
-            parsed = cls.parse_obj(obj[alias])
+            trusted = trusted or cls.is_trusted_path(path)
+            if trusted:
+                parsed = cls.trusted_construct(obj[alias])
+            else:
+                parsed = cls.parse_obj(obj[alias])
         except KeyError:
             raise err.TrestleError(f'Provided oscal file does not have top level key key: {alias}')
         except Exception as e:
             raise err.TrestleError(f'Error parsing file {path} {str(e)}')
 
+        # only fully validated models are cached, since entries are loaded without validation
+        if not trusted:
+            parsed_cache.store(parsed)
         return parsed
 
     def copy_to(self, new_oscal_type: Type['OscalBaseModel']) -> 'OscalBaseModel':
@@ -345,10 +556,8 @@ class OscalBaseModel(TrestleBaseModel):
         """
         logger.debug('Copy to started')
         if self.__class__.__name__ == new_oscal_type.__name__:
-            logger.debug('Json based copy')
-            # Note: Json based oppportunistic copy
-            # Dev notes: Do not change this from json. Due to enums (in particular) json is the closest we can get.
-            return new_oscal_type.parse_raw(self.oscal_serialize_json(pretty=False, wrapped=False))
+            logger.debug('Field based copy')
+            return new_oscal_type._transfer_from(self)
 
         if ('__root__' in self.__fields__ and len(self.__fields__) == 1 and '__root__' in new_oscal_type.__fields__
                 and len(new_oscal_type.__fields__) == 1):
@@ -358,6 +567,53 @@ class OscalBaseModel(TrestleBaseModel):
         # bad place here.
         raise err.TrestleError('Provided inconsistent classes to copy to methodology.')
 
+    @classmethod
+    def _transfer_from(cls, model: BaseModel) -> 'OscalBaseModel':
+        """
+        Copy the fields of a valid model into a new model of this class, which has the same name and fields.
+
+        Nested models are copied recursively into the types of the fields of this class and enums are converted by
+        value, so the copy shares no models with the original.  Models whose fields do not match are copied through
+        json with full validation.
+        """
+        values: Dict[str, Any] = {}
+        for name in model.__fields_set__:
+            value = model.__dict__.get(name)
+            if value is None:
+                continue
+            field = cls.__fields__.get(name)
+            if field is None:
+                return cls.parse_raw(model.json(by_alias=True, exclude_none=True))
+            values[name] = cls._transfer_value(field, value)
+        return cls.construct(**values)
+
+    @classmethod
+    def _transfer_value(cls, field: ModelField, value: Any) -> Any:
+        """Copy the value of a field of a valid model into the type of the field of this class."""
+        if value is None:
+            return None
+        if field.shape == SHAPE_LIST and isinstance(value, list) and field.sub_fields:
+            return [cls._transfer_value(field.sub_fields[0], item) for item in value]
+        if field.shape == SHAPE_SINGLETON and not field.sub_fields:
+            type_ = field.type_
+            if isinstance(type_, type) and issubclass(type_, OscalBaseModel) and isinstance(value, BaseModel):
+                if value.__class__.__name__ == type_.__name__:
+                    return type_._transfer_from(value)
+            elif isinstance(type_, type) and issubclass(type_, Enum) and isinstance(value, Enum):
+                return type_(value.value)
+            elif not isinstance(value, (BaseModel, Enum, list, dict)):
+                # strings, urls, numbers and datetimes are immutable and already valid
+                return value
+        # anything else goes through its json form as the json based copy did
+        if isinstance(value, BaseModel):
+            value = orjson.loads(value.json(by_alias=True, exclude_none=True))
+        elif isinstance(value, Enum):
+            value = value.value
+        validated, error = field.validate(value, {}, loc=field.alias, cls=cls)
+        if error:
+            raise err.TrestleError(f'Unable to copy {field.alias} to {cls.__name__}: {error}')
+        return validated
+
     def copy_from(self, existing_oscal_object: 'OscalBaseModel') -> None:
         """
         Copy operation that implicitly does type conversion.
@@ -39,8 +39,8 @@ class CatalogAPI():
     and write the catalog and its markdown representation.
     """
 
-    def __init__(self, catalog: Optional[cat.Catalog], context: Optional[ControlContext] = None):
-        """Initialize catalog api."""
+    def __init__(self, catalog: Optional[cat.Catalog], context: Optional[ControlContext] = None, jobs: int = 1):
+        """Initialize catalog api, reading up to jobs control markdown files concurrently."""
         if not catalog:
             # catalog assemble initializes with no catalog but may merge into an existing one later
             logger.debug('No catalog was provided in CatalogAPI init, generating a new one.')
@@ -48,7 +48,7 @@ class CatalogAPI():
         self._catalog = catalog
         self._catalog_interface = CatalogInterface(self._catalog)
         self._writer = CatalogWriter(self._catalog_interface)
-        self._reader = CatalogReader(self._catalog_interface)
+        self._reader = CatalogReader(self._catalog_interface, jobs)
         self._merger = CatalogMerger(self._catalog_interface)
         self._context = context
 
@@ -25,7 +25,7 @@ from trestle.common.err import TrestleError
 from trestle.common.list_utils import as_dict, as_filtered_list, as_list, deep_append, deep_get, deep_set, deep_update, delete_item_from_list, get_item_from_list, none_if_empty, set_or_pop  # noqa E501
 from trestle.common.model_utils import ModelUtils
 from trestle.core.control_context import ControlContext
-from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface
+from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface, ParamSubstituter
 from trestle.oscal import common
 from trestle.oscal import component as comp
 from trestle.oscal import profile as prof
@@ -667,6 +667,10 @@ class CatalogInterface():
     ) -> None:
         """Go through all controls and change prose based on param values."""
         param_dict = self._get_full_param_dict()
+        # share the rendered params across all controls
+        substituter = ParamSubstituter(
+            param_dict, param_format, param_rep, show_value_warnings, value_assigned_prefix, value_not_assigned_prefix
+        )
         # insert param values into prose of all controls
         for control in self.get_all_controls_from_dict():
             ControlInterface.replace_control_prose(
@@ -676,7 +680,8 @@ class CatalogInterface():
                 param_rep,
                 show_value_warnings,
                 value_assigned_prefix,
-                value_not_assigned_prefix
+                value_not_assigned_prefix,
+                substituter
             )
 
     @staticmethod
@@ -13,10 +13,18 @@
 # limitations under the License.
 """Provide interface to read catalog from markdown back to OSCAL."""
 
+import dataclasses
+import hashlib
+import importlib
 import logging
+import os
 import pathlib
-from typing import Any, Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+import orjson
+
+import trestle
 import trestle.common.const as const
 import trestle.core.generators as gens
 import trestle.core.generic_oscal as generic
@@ -25,7 +33,10 @@ import trestle.oscal.common as com
 import trestle.oscal.component as comp
 from trestle.common.common_types import TypeWithSetParams
 from trestle.common.err import TrestleError
+from trestle.common.file_utils import extract_trestle_project_root
 from trestle.common.list_utils import as_list, none_if_empty
+from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.control_context import ControlContext
 from trestle.core.control_interface import CompDict, ComponentImpInfo, ControlInterface
@@ -44,9 +55,80 @@ class CatalogReader():
     reading catalog from markdown.
     """
 
-    def __init__(self, catalog_interface: CatalogInterface):
-        """Initialize catalog reader."""
+    def __init__(self, catalog_interface: CatalogInterface, jobs: int = 1):
+        """
+        Initialize catalog reader.
+
+        Args:
+            catalog_interface: interface to the catalog being read
+            jobs: number of processes used to read the control markdown files
+        """
         self._catalog_interface = catalog_interface
+        self._jobs = jobs
+
+    @staticmethod
+    def _get_control_files(md_path: pathlib.Path) -> Dict[str, List[pathlib.Path]]:
+        """Get the sorted control markdown files in each group directory, by group id."""
+        return {
+            group_id: sorted(group_dir.glob('*.md'))
+            for group_id, group_dir in CatalogInterface._get_group_ids_and_dirs(md_path).items()
+        }
+
+    @staticmethod
+    def _read_control_files(
+        read_file: Callable[..., Any],
+        md_path: pathlib.Path,
+        control_files: List[pathlib.Path],
+        jobs: int,
+        *args: Any,
+        cache_args: Optional[Tuple[Any, ...]] = None
+    ) -> List[Any]:
+        """
+        Read each control file with read_file(control_file, *args) and return the results in file order.
+
+        Files whose content and args are unchanged since the last read in this trestle workspace are not parsed again.
+        Their results are loaded from the trestle cache instead.  When args hold much more than read_file uses, e.g.
+        a whole control context, cache_args gives the values it does use so unrelated changes keep the cache valid.
+        """
+        cache = _ParsedMarkdownCache.for_md_path(md_path, read_file, args if cache_args is None else cache_args)
+        if cache is None:
+            return CatalogReader._parse_control_files(read_file, control_files, jobs, args)
+        content_digests = [_ParsedMarkdownCache.content_digest(control_file) for control_file in control_files]
+        results = [
+            cache.get(control_file, content_digest)
+            for control_file, content_digest in zip(control_files, content_digests)
+        ]
+        changed = [index for index, result in enumerate(results) if result is _ParsedMarkdownCache.MISSING]
+        parsed = CatalogReader._parse_control_files(read_file, [control_files[index] for index in changed], jobs, args)
+        for index, result in zip(changed, parsed):
+            results[index] = result
+        logger.debug(f'Parsed {len(changed)} changed control markdown files in {md_path}.')
+        # store the results before the caller merges and possibly modifies them
+        cache.save(control_files, content_digests, results)
+        return results
+
+    @staticmethod
+    def _parse_control_files(
+        read_file: Callable[..., Any], control_files: List[pathlib.Path], jobs: int, args: Tuple[Any, ...]
+    ) -> List[Any]:
+        """
+        Parse each control file with read_file(control_file, *args) and return the results in file order.
+
+        With more than one job the files are parsed in a pool of processes, so read_file and args must be picklable.
+        The results are merged by the caller in file order so the output does not depend on the number of jobs.
+        """
+        if jobs <= 1 or len(control_files) <= 1:
+            return [read_file(control_file, *args) for control_file in control_files]
+        n_files = len(control_files)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            return list(
+                executor.map(
+                    read_file,
+                    control_files,
+                    *[[arg] * n_files for arg in args],
+                    chunksize=max(1, n_files // (4 * jobs))
+                )
+            )
 
     def read_additional_content(
         self,
@@ -60,41 +142,46 @@ class CatalogReader():
         alters_map: Dict[str, prof.Alter] = {}
         final_param_dict: Dict[str, Any] = {}
         param_sort_map: Dict[str, str] = {}
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                sort_id, control_alters, control_param_dict = ControlReader.read_editable_content(
-                    control_file,
-                    required_sections_list,
-                    label_map,
-                    sections_dict,
-                    write_mode
-                )
-                alters_map[sort_id] = control_alters
-                for param_id, param_dict in control_param_dict.items():
-                    # if profile_values are present, overwrite values with them
-                    if const.PROFILE_VALUES in param_dict:
+        control_files = [
+            control_file for group_files in self._get_control_files(md_path).values() for control_file in group_files
+        ]
+        contents = self._read_control_files(
+            ControlReader.read_editable_content,
+            md_path,
+            control_files,
+            self._jobs,
+            required_sections_list,
+            label_map,
+            sections_dict,
+            write_mode
+        )
+        for sort_id, control_alters, control_param_dict in contents:
+            alters_map[sort_id] = control_alters
+            for param_id, param_dict in control_param_dict.items():
+                # if profile_values are present, overwrite values with them
+                if const.PROFILE_VALUES in param_dict:
+                    if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
+                        if not write_mode and const.REPLACE_ME_PLACEHOLDER in param_dict[const.PROFILE_VALUES]:
+                            param_dict[const.PROFILE_VALUES].remove(const.REPLACE_ME_PLACEHOLDER)
                         if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
-                            if not write_mode and const.REPLACE_ME_PLACEHOLDER in param_dict[const.PROFILE_VALUES]:
-                                param_dict[const.PROFILE_VALUES].remove(const.REPLACE_ME_PLACEHOLDER)
-                            if param_dict[const.PROFILE_VALUES] != [] and param_dict[const.PROFILE_VALUES] is not None:
-                                param_dict[const.VALUES] = param_dict[const.PROFILE_VALUES]
-                        if not write_mode:
-                            param_dict.pop(const.PROFILE_VALUES)
-                    # verifies if at control profile edition the param value origin was modified
-                    # through the profile-param-value-origin tag
-                    if const.PROFILE_PARAM_VALUE_ORIGIN in param_dict:
-                        if param_dict[const.PROFILE_PARAM_VALUE_ORIGIN] != const.REPLACE_ME_PLACEHOLDER:
-                            param_dict[const.PARAM_VALUE_ORIGIN] = param_dict[const.PROFILE_PARAM_VALUE_ORIGIN]
-                            param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
-                        else:
-                            # removes replace me placeholder and profile-param-value-origin as it was not modified
-                            param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
-                            # validates param-value-origin is in dict to remove it
-                            # because a value wasn´t provided and it shouldn´t be inheriting value from parent
-                            if const.PARAM_VALUE_ORIGIN in param_dict:
-                                param_dict.pop(const.PARAM_VALUE_ORIGIN)
-                    final_param_dict[param_id] = param_dict
-                    param_sort_map[param_id] = sort_id
+                            param_dict[const.VALUES] = param_dict[const.PROFILE_VALUES]
+                    if not write_mode:
+                        param_dict.pop(const.PROFILE_VALUES)
+                # verifies if at control profile edition the param value origin was modified
+                # through the profile-param-value-origin tag
+                if const.PROFILE_PARAM_VALUE_ORIGIN in param_dict:
+                    if param_dict[const.PROFILE_PARAM_VALUE_ORIGIN] != const.REPLACE_ME_PLACEHOLDER:
+                        param_dict[const.PARAM_VALUE_ORIGIN] = param_dict[const.PROFILE_PARAM_VALUE_ORIGIN]
+                        param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
+                    else:
+                        # removes replace me placeholder and profile-param-value-origin as it was not modified
+                        param_dict.pop(const.PROFILE_PARAM_VALUE_ORIGIN)
+                        # validates param-value-origin is in dict to remove it
+                        # because a value wasn´t provided and it shouldn´t be inheriting value from parent
+                        if const.PARAM_VALUE_ORIGIN in param_dict:
+                            param_dict.pop(const.PARAM_VALUE_ORIGIN)
+                final_param_dict[param_id] = param_dict
+                param_sort_map[param_id] = sort_id
         new_alters: List[prof.Alter] = []
         # fill the alters according to the control sorting order
         for key in sorted(alters_map.keys()):
@@ -107,10 +194,20 @@ class CatalogReader():
 
         This will overwrite the existing groups and controls in the catalog.
         """
-        id_map = CatalogInterface._get_group_ids_and_dirs(md_path)
+        group_files = self._get_control_files(md_path)
+        control_files = [control_file for files in group_files.values() for control_file in files]
+        # parse all control files first then build each group from them in order
+        read_controls = dict(
+            zip(
+                control_files,
+                self._read_control_files(
+                    ControlReader.read_control, md_path, control_files, self._jobs, set_parameters_flag
+                )
+            )
+        )
         groups: List[cat.Group] = []
         # read each group dir
-        for group_id, group_dir in id_map.items():
+        for group_id, files in group_files.items():
             control_list_raw = []
             group_title = ''
             # Need to get group title from at least one control in this directory
@@ -118,8 +215,8 @@ class CatalogReader():
             # Set group title to the first one found and warn if different non-empty title appears
             # Controls with empty group titles are tolerated but at least one title must be present or warning given
             # The special group with no name that has the catalog as parent is just a list and has no title
-            for control_path in group_dir.glob('*.md'):
-                control, control_group_title = ControlReader.read_control(control_path, set_parameters_flag)
+            for control_path in files:
+                control, control_group_title = read_controls[control_path]
                 if control_group_title:
                     if group_title:
                         if control_group_title != group_title:
@@ -147,12 +244,15 @@ class CatalogReader():
         return self._catalog_interface._catalog
 
     @staticmethod
-    def read_catalog_imp_reqs(md_path: pathlib.Path, context: ControlContext) -> List[comp.ImplementedRequirement]:
+    def read_catalog_imp_reqs(md_path: pathlib.Path,
+                              context: ControlContext,
+                              jobs: int = 1) -> List[comp.ImplementedRequirement]:
         """Read the full set of control implemented requirements from markdown.
 
         Args:
             md_path: Path to the markdown control files, with directories for each group
             context: Context for the operation
+            jobs: Number of processes used to read the control files
 
         Returns:
             List of implemented requirements gathered from each control
@@ -163,10 +263,16 @@ class CatalogReader():
             This is only used during component assemble and only for updating one component
         """
         imp_req_map: Dict[str, comp.ImplementedRequirement] = {}
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                sort_id, imp_req = ControlReader.read_implemented_requirement(control_file, context)
-                imp_req_map[sort_id] = imp_req
+        control_files = [
+            control_file for files in CatalogReader._get_control_files(md_path).values() for control_file in files
+        ]
+        # the reader only uses the purpose and the component of the context
+        cache_args = (context.purpose, context.comp_name, context.component.title)
+        imp_reqs = CatalogReader._read_control_files(
+            ControlReader.read_implemented_requirement, md_path, control_files, jobs, context, cache_args=cache_args
+        )
+        for sort_id, imp_req in imp_reqs:
+            imp_req_map[sort_id] = imp_req
         return [imp_req_map[key] for key in sorted(imp_req_map.keys())]
 
     @staticmethod
@@ -394,7 +500,8 @@ class CatalogReader():
         ssp: ossp.SystemSecurityPlan,
         comp_dict: Dict[str, generic.GenericComponent],
         part_id_map_by_label: Dict[str, Dict[str, str]],
-        context: ControlContext
+        context: ControlContext,
+        jobs: int = 1
     ) -> None:
         """
         Read md content into the ssp.
@@ -405,6 +512,7 @@ class CatalogReader():
             comp_dict: map of component name to component
             part_id_map_by_label: map label to part_id of control
             context: control context for the procedure
+            jobs: number of processes used to read the control files
 
         Notes:
             The ssp should already contain info from the comp defs and this fills in selected content from md.
@@ -416,28 +524,158 @@ class CatalogReader():
             ssp has components but may not have all needed imp reqs and bycomps
             know controlid and comp name in comp_dict
         """
-        for group_path in CatalogInterface._get_group_ids_and_dirs(md_path).values():
-            for control_file in group_path.glob('*.md'):
-                skip = False
-                for file in control_file.parents:
-                    if file.name == const.INHERITANCE_VIEW_DIR:
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                control_id = control_file.stem
-
-                md_header, control_comp_dict = CatalogReader._read_comp_info_from_md(control_file, context)
-
-                for comp_name, comp_info_dict in control_comp_dict.items():
-                    if comp_name not in comp_dict:
-                        err_msg = f'Control {control_id} references component {comp_name} not defined in a component-definition.'  # noqa E501
-                        # give added guidance if no comp defs were specified at command line
-                        if not context.comp_def_name_list:
-                            err_msg += '  Please specify the names of any component-definitions needed for assembly.'
-                        raise TrestleError(err_msg)
-                    CatalogReader._update_ssp_with_comp_info(
-                        ssp, control_id, comp_dict[comp_name], comp_info_dict, part_id_map_by_label
-                    )
-                CatalogReader._update_ssp_with_md_header(ssp, control_id, comp_dict, part_id_map_by_label, md_header)
+        control_files = [
+            control_file for files in CatalogReader._get_control_files(md_path).values() for control_file in files
+            if const.INHERITANCE_VIEW_DIR not in [parent.name for parent in control_file.parents]
+        ]
+        # the reader only uses the purpose and the component name of the context
+        cache_args = (context.purpose, context.comp_name)
+        control_infos = CatalogReader._read_control_files(
+            CatalogReader._read_comp_info_from_md, md_path, control_files, jobs, context, cache_args=cache_args
+        )
+        for control_file, (md_header, control_comp_dict) in zip(control_files, control_infos):
+            control_id = control_file.stem
+
+            for comp_name, comp_info_dict in control_comp_dict.items():
+                if comp_name not in comp_dict:
+                    err_msg = f'Control {control_id} references component {comp_name} not defined in a component-definition.'  # noqa E501
+                    # give added guidance if no comp defs were specified at command line
+                    if not context.comp_def_name_list:
+                        err_msg += '  Please specify the names of any component-definitions needed for assembly.'
+                    raise TrestleError(err_msg)
+                CatalogReader._update_ssp_with_comp_info(
+                    ssp, control_id, comp_dict[comp_name], comp_info_dict, part_id_map_by_label
+                )
+            CatalogReader._update_ssp_with_md_header(ssp, control_id, comp_dict, part_id_map_by_label, md_header)
+
+
+class _ParsedMarkdownCache:
+    """
+    Results of parsing the control markdown in a directory, keyed by file content and kept in the trestle cache.
+
+    The results are stored as plain json data.  Oscal models are rebuilt with trusted_construct, and only from the
+    classes of the trestle.oscal modules, so loading an entry never runs code from the cache.  Results holding any
+    other kind of object are not stored.
+    """
+
+    # marker for a file with no cached result, since None may be a valid result
+    MISSING = object()
+
+    # tags of the json objects holding values that json cannot represent directly
+    _MODEL_TAG = '__model__'
+    _DATACLASS_TAG = '__dataclass__'
+    _TUPLE_TAG = '__tuple__'
+    _DATA_TAG = 'data'
+    _TAGS = {_MODEL_TAG, _DATACLASS_TAG, _TUPLE_TAG}
+
+    # the only dataclasses found in the parsed results
+    _DATACLASSES = {ComponentImpInfo.__name__: ComponentImpInfo}
+
+    def __init__(self, path: pathlib.Path, md_root: pathlib.Path, args_digest: str) -> None:
+        """Load the results stored by a previous read with the same args."""
+        self._path = path
+        self._md_root = md_root
+        self._args_digest = args_digest
+        self._results: Dict[str, Tuple[str, Any]] = {}
+        if self._path.exists():
+            try:
+                cached = orjson.loads(self._path.read_bytes())
+                if cached.get('args', None) == self._args_digest:
+                    self._results = cached['results']
+            except Exception as e:
+                logger.debug(f'Ignoring unreadable parsed markdown cache {self._path}: {e}')
+
+    @classmethod
+    def for_md_path(cls, md_path: pathlib.Path, read_file: Callable[..., Any],
+                    args: Tuple[Any, ...]) -> Optional['_ParsedMarkdownCache']:
+        """Get the cache for reading the markdown with read_file and args, or None if not in a trestle workspace."""
+        md_root = md_path.resolve()
+        trestle_root = extract_trestle_project_root(md_root)
+        if trestle_root is None:
+            return None
+        name = ModelUtils.get_digest(md_root.as_posix(), read_file.__qualname__) + '.json'
+        path = trestle_root / const.TRESTLE_CACHE_DIR / const.ASSEMBLED_MD_CACHE_DIR / name
+        return cls(path, md_root, ModelUtils.get_digest(trestle.__version__, *args))
+
+    @staticmethod
+    def content_digest(control_file: pathlib.Path) -> str:
+        """Get the digest of the content of the control file."""
+        return hashlib.sha256(control_file.read_bytes()).hexdigest()
+
+    def _key(self, control_file: pathlib.Path) -> str:
+        return control_file.resolve().relative_to(self._md_root).as_posix()
+
+    @staticmethod
+    def _to_data(obj: Any) -> Any:
+        """Convert a parsed result to json data, raising TypeError for any object that cannot be restored."""
+        if obj is None or isinstance(obj, (str, bool, int, float)):
+            return obj
+        if isinstance(obj, OscalBaseModel):
+            model_data = orjson.loads(obj.oscal_serialize_json_bytes(wrapped=False))
+            if '__root__' in model_data:
+                model_data = model_data['__root__']
+            class_name = f'{obj.__class__.__module__}.{obj.__class__.__name__}'
+            return {_ParsedMarkdownCache._MODEL_TAG: class_name, _ParsedMarkdownCache._DATA_TAG: model_data}
+        if dataclasses.is_dataclass(obj) and _ParsedMarkdownCache._DATACLASSES.get(obj.__class__.__name__) is type(obj):
+            fields = {
+                field.name: _ParsedMarkdownCache._to_data(getattr(obj, field.name))
+                for field in dataclasses.fields(obj)
+            }
+            return {_ParsedMarkdownCache._DATACLASS_TAG: obj.__class__.__name__, _ParsedMarkdownCache._DATA_TAG: fields}
+        if isinstance(obj, tuple):
+            return {_ParsedMarkdownCache._TUPLE_TAG: [_ParsedMarkdownCache._to_data(item) for item in obj]}
+        if isinstance(obj, list):
+            return [_ParsedMarkdownCache._to_data(item) for item in obj]
+        if isinstance(obj, dict) and all(isinstance(key, str) and key not in _ParsedMarkdownCache._TAGS for key in obj):
+            return {key: _ParsedMarkdownCache._to_data(value) for key, value in obj.items()}
+        raise TypeError(f'Unable to store {type(obj)} in the parsed markdown cache')
+
+    @staticmethod
+    def _from_data(data: Any) -> Any:
+        """Restore a parsed result from the json data created by _to_data."""
+        if isinstance(data, list):
+            return [_ParsedMarkdownCache._from_data(item) for item in data]
+        if not isinstance(data, dict):
+            return data
+        if _ParsedMarkdownCache._MODEL_TAG in data:
+            module_name, _, class_name = data[_ParsedMarkdownCache._MODEL_TAG].rpartition('.')
+            if not module_name.startswith('trestle.oscal.'):
+                raise TypeError(f'Model class {data[_ParsedMarkdownCache._MODEL_TAG]} is not an oscal class')
+            model_class = getattr(importlib.import_module(module_name), class_name)
+            if not (isinstance(model_class, type) and issubclass(model_class, OscalBaseModel)):
+                raise TypeError(f'{data[_ParsedMarkdownCache._MODEL_TAG]} is not an oscal model')
+            return model_class.trusted_construct(data[_ParsedMarkdownCache._DATA_TAG])
+        if _ParsedMarkdownCache._DATACLASS_TAG in data:
+            dataclass_type = _ParsedMarkdownCache._DATACLASSES[data[_ParsedMarkdownCache._DATACLASS_TAG]]
+            fields = data[_ParsedMarkdownCache._DATA_TAG]
+            return dataclass_type(**{name: _ParsedMarkdownCache._from_data(value) for name, value in fields.items()})
+        if _ParsedMarkdownCache._TUPLE_TAG in data:
+            return tuple(_ParsedMarkdownCache._from_data(item) for item in data[_ParsedMarkdownCache._TUPLE_TAG])
+        return {key: _ParsedMarkdownCache._from_data(value) for key, value in data.items()}
+
+    def get(self, control_file: pathlib.Path, content_digest: str) -> Any:
+        """Get the cached result for the control file if its content is unchanged, else MISSING."""
+        cached_digest, data = self._results.get(self._key(control_file), (None, None))
+        if cached_digest != content_digest:
+            return _ParsedMarkdownCache.MISSING
+        try:
+            return self._from_data(data)
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable parsed markdown cache entry for {control_file}: {e}')
+            return _ParsedMarkdownCache.MISSING
+
+    def save(self, control_files: List[pathlib.Path], content_digests: List[str], results: List[Any]) -> None:
+        """Store the results for exactly the given control files."""
+        try:
+            self._results = {
+                self._key(control_file): (content_digest, self._to_data(result))
+                for control_file, content_digest, result in zip(control_files, content_digests, results)
+            }
+        except TypeError as e:
+            logger.debug(f'Not storing the parsed markdown cache {self._path}: {e}')
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = self._path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_bytes(orjson.dumps({'args': self._args_digest, 'results': self._results}))
+        tmp_path.replace(self._path)
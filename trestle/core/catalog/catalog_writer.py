@@ -14,9 +14,13 @@
 """Provide interface to write OSCAL catalog to markdown."""
 
 import copy
+import hashlib
+import json
 import logging
-from typing import Any, Dict, List
+import pathlib
+from typing import Any, Callable, Dict, List, Optional, Set
 
+import trestle
 import trestle.common.const as const
 import trestle.oscal.catalog as cat
 from trestle.common.list_utils import as_list, deep_get, none_if_empty
@@ -44,6 +48,9 @@ class CatalogWriter():
     def __init__(self, catalog_interface: CatalogInterface):
         """Initialize catalog writer."""
         self._catalog_interface = catalog_interface
+        self._digests: Optional[_ControlMarkdownDigests] = None
+        self._n_written = 0
+        self._n_skipped = 0
 
     def write_catalog_as_profile_markdown(
         self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]], md_alters: List[prof.Alter]
@@ -53,8 +60,10 @@ class CatalogWriter():
         # this is just from the set_params
         profile_set_param_dict = CatalogInterface._get_full_profile_param_dict(context.profile)
 
-        # write out the controls
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
+        controls = list(self._catalog_interface.get_all_controls_from_catalog(True))
+        control_dirs = self._make_control_dirs(context.md_root, controls)
+
+        def _write_control(control: cat.Control) -> None:
             # here we do special handling of how set-parameters merge with the yaml header
             new_context = ControlContext.clone(context)
             new_context.merged_header = {}
@@ -79,7 +88,12 @@ class CatalogWriter():
 
             found_control_alters = [alter for alter in md_alters if alter.control_id == control.id]
 
-            self._write_control_into_dir(new_context, control, part_id_map, found_control_alters)
+            self._write_control_into_dir(
+                new_context, control, control_dirs[control.id], part_id_map, found_control_alters
+            )
+
+        # write out the controls
+        self._write_controls(_write_control, controls)
 
     def _add_inherited_props_to_header(self, context: ControlContext, control_id: str) -> ControlContext:
         """Add inherited props to the merged header under inherited tag."""
@@ -285,17 +299,18 @@ class CatalogWriter():
         # get param_dict of set_params in profile
         profile_set_param_dict = CatalogInterface._get_full_profile_param_dict(context.profile)
         catalog_merger = CatalogMerger(self._catalog_interface)
-        for control in self._catalog_interface.get_all_controls_from_dict():
+        controls = list(self._catalog_interface.get_all_controls_from_dict())
+        control_dirs = self._make_control_dirs(context.md_root, controls)
+
+        def _write_control(control: cat.Control) -> None:
             control_id = control.id
-            context.comp_dict = self._catalog_interface._control_comp_dicts.get(control_id, {})
             control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control_id)
-            control_file_path.parent.mkdir(exist_ok=True, parents=True)
             # the catalog interface is from the resolved profile catalog
             control = self._catalog_interface.get_control(control_id)
-            _, group_title, _ = self._catalog_interface.get_group_info_by_control(control_id)
             control_param_dict = ControlInterface.get_control_param_dict(control, False)
             set_param_dict = self._construct_set_parameters_dict(profile_set_param_dict, control_param_dict, context)
             new_context = ControlContext.clone(context)
+            new_context.comp_dict = copy.deepcopy(self._catalog_interface._control_comp_dicts.get(control_id, {}))
 
             if set_param_dict:
                 self._add_set_params_from_cli_yaml_header_to_header(new_context, set_param_dict, control_param_dict)
@@ -317,10 +332,9 @@ class CatalogWriter():
                     for param_dict in param_list:
                         param_dict.pop(const.HEADER_RULE_ID, None)
 
-            control_writer = ControlWriter()
-            control_writer.write_control_for_editing(
-                new_context, control, control_file_path.parent, group_title, part_id_map, []
-            )
+            self._write_control_into_dir(new_context, control, control_dirs[control_id], part_id_map, [])
+
+        self._write_controls(_write_control, controls)
 
     def write_catalog_as_component_markdown(
         self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]]
@@ -375,39 +389,47 @@ class CatalogWriter():
                     self._catalog_interface.add_comp_info(imp_req.control_id, context.comp_name, label, comp_info)
 
         catalog_merger = CatalogMerger(self._catalog_interface)
+        controls = [
+            control for control in self._catalog_interface.get_all_controls_from_catalog(True)
+            if control.id in control_ids_in_comp_imp
+        ]
+        control_dirs = self._make_control_dirs(context.md_root, controls)
 
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
-            if control.id in control_ids_in_comp_imp:
-                context.comp_dict = self._catalog_interface.get_comp_info(control.id)
-                new_context = ControlContext.clone(context)
-                # get the resolved catalog values for the control params
-                control_param_dict = ControlInterface.get_control_param_dict(control, False)
-                # update them with values in the ci
-                for set_param in as_list(new_context.control_implementation.set_parameters):
-                    _update_values(set_param, control_param_dict)
-                # update them with values in the imp_req
-                for imp_req in as_list(new_context.control_implementation.implemented_requirements):
-                    if imp_req.control_id == control.id:
-                        for set_param in as_list(imp_req.set_parameters):
-                            _update_values(set_param, control_param_dict)
-
-                # insert the param values into the header
-                if control_param_dict:
-                    new_context.merged_header[const.PARAM_VALUES_TAG] = {}
-                    for key, param in control_param_dict.items():
-                        new_context.merged_header[const.PARAM_VALUES_TAG][key] = none_if_empty(
-                            ControlInterface._param_values_as_str_list(param)
-                        )
-                # merge the md_header and md_comp_dict with info in cat_interface for this control
-                control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control.id)
-                catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
-
-                self._write_control_into_dir(new_context, control, part_id_map, [])
+        def _write_control(control: cat.Control) -> None:
+            new_context = ControlContext.clone(context)
+            new_context.comp_dict = copy.deepcopy(self._catalog_interface.get_comp_info(control.id))
+            # get the resolved catalog values for the control params
+            control_param_dict = ControlInterface.get_control_param_dict(control, False)
+            # update them with values in the ci
+            for set_param in as_list(new_context.control_implementation.set_parameters):
+                _update_values(set_param, control_param_dict)
+            # update them with values in the imp_req
+            for imp_req in as_list(new_context.control_implementation.implemented_requirements):
+                if imp_req.control_id == control.id:
+                    for set_param in as_list(imp_req.set_parameters):
+                        _update_values(set_param, control_param_dict)
+
+            # insert the param values into the header
+            if control_param_dict:
+                new_context.merged_header[const.PARAM_VALUES_TAG] = {}
+                for key, param in control_param_dict.items():
+                    new_context.merged_header[const.PARAM_VALUES_TAG][key] = none_if_empty(
+                        ControlInterface._param_values_as_str_list(param)
+                    )
+            # merge the md_header and md_comp_dict with info in cat_interface for this control
+            control_file_path = self._catalog_interface.get_control_file_path(context.md_root, control.id)
+            catalog_merger._merge_header_and_comp_dict(control, control_file_path, new_context)
+
+            self._write_control_into_dir(new_context, control, control_dirs[control.id], part_id_map, [])
+
+        self._write_controls(_write_control, controls)
 
     def write_catalog_as_catalog(self, context: ControlContext, part_id_map: Dict[str, Dict[str, str]]) -> None:
         """Write the catalog as a simple catalog."""
-        # write out the controls
-        for control in self._catalog_interface.get_all_controls_from_catalog(True):
+        controls = list(self._catalog_interface.get_all_controls_from_catalog(True))
+        control_dirs = self._make_control_dirs(context.md_root, controls)
+
+        def _write_control(control: cat.Control) -> None:
             # here we do special handling of how set-parameters merge with the yaml header
             new_context = ControlContext.clone(context)
 
@@ -442,23 +464,148 @@ class CatalogWriter():
                 for pop in pop_list:
                     new_context.cli_yaml_header[const.SET_PARAMS_TAG].pop(pop)
 
-            self._write_control_into_dir(new_context, control, part_id_map, [])
+            self._write_control_into_dir(new_context, control, control_dirs[control.id], part_id_map, [])
+
+        # write out the controls
+        self._write_controls(_write_control, controls)
+
+    def _make_control_dirs(self, md_root: pathlib.Path, controls: List[cat.Control]) -> Dict[str, pathlib.Path]:
+        """Create the group directories for the controls up front and return the directory of each control."""
+        # we need to create the dir structure on demand because we don't know a priori what groups are included
+        control_dirs: Dict[str, pathlib.Path] = {}
+        made_dirs: Set[pathlib.Path] = set()
+        for control in controls:
+            group_dir = md_root.joinpath(*self._catalog_interface.get_control_path(control.id))
+            if group_dir not in made_dirs:
+                group_dir.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(group_dir)
+            control_dirs[control.id] = group_dir
+        return control_dirs
+
+    def _write_controls(self, write_control: Callable[[cat.Control], None], controls: List[cat.Control]) -> None:
+        """Write the markdown of each control with write_control, then save the digests of the written files."""
+        self._n_written = 0
+        self._n_skipped = 0
+        for control in controls:
+            write_control(control)
+        if self._digests is not None:
+            self._digests.save()
+            logger.info(
+                f'Regenerated {self._n_written} control markdown files and skipped {self._n_skipped} unchanged ones.'
+            )
 
     def _write_control_into_dir(
         self,
         context: ControlContext,
         control: cat.Control,
+        group_dir: pathlib.Path,
         part_id_map: Dict[str, Dict[str, str]],
         found_control_alters: List[prof.Alter]
     ):
-        # we need to create the dir structure on demand because we don't know a priori what groups are included
+        if ControlInterface.is_withdrawn(control):
+            logger.debug(f'Not writing out control {control.id} since it is marked Withdrawn.')
+            return
         _, group_title, _ = self._catalog_interface.get_group_info_by_control(control.id)
-        group_dir = context.md_root
-        control_path = self._catalog_interface.get_control_path(control.id)
-        for sub_dir in control_path:
-            group_dir = group_dir / sub_dir
-            if not group_dir.exists():
-                group_dir.mkdir(parents=True, exist_ok=True)
-
+        if self._digests is None and (context.trestle_root / const.TRESTLE_CONFIG_DIR).is_dir():
+            self._digests = _ControlMarkdownDigests(context.trestle_root)
+        control_file = group_dir / (control.id + const.MARKDOWN_FILE_EXT)
+        input_digest = None
+        if self._digests is not None:
+            input_digest = _ControlMarkdownDigests.input_digest(
+                context, control, group_title, part_id_map.get(control.id, {}), found_control_alters
+            )
+            if self._digests.is_unchanged(control_file, input_digest):
+                logger.debug(f'Skipping control {control.id} whose markdown inputs are unchanged.')
+                self._n_skipped += 1
+                return
         writer = ControlWriter()
         writer.write_control_for_editing(context, control, group_dir, group_title, part_id_map, found_control_alters)
+        self._n_written += 1
+        if self._digests is not None and input_digest is not None:
+            self._digests.add(control_file, input_digest)
+
+
+class _ControlMarkdownDigests:
+    """Digests of the inputs and content of generated control markdown, stored in the trestle cache."""
+
+    def __init__(self, trestle_root: pathlib.Path) -> None:
+        """Load any digests stored by a previous generate."""
+        self._trestle_root = trestle_root.resolve()
+        self._path = trestle_root / const.TRESTLE_CACHE_DIR / const.GENERATED_MD_DIGESTS_FILE
+        self._digests: Dict[str, Dict[str, str]] = {}
+        if self._path.exists():
+            try:
+                self._digests = json.loads(self._path.read_text(encoding=const.FILE_ENCODING))
+            except Exception as e:
+                logger.debug(f'Ignoring unreadable generated markdown digests {self._path}: {e}')
+
+    @staticmethod
+    def input_digest(
+        context: ControlContext,
+        control: cat.Control,
+        group_title: str,
+        control_part_id_map: Dict[str, str],
+        found_alters: List[prof.Alter]
+    ) -> str:
+        """Hash everything the control writer uses to write the markdown for the control."""
+        profile_alters = []
+        if context.profile and context.profile.modify:
+            profile_alters = [
+                alter for alter in as_list(context.profile.modify.alters) if alter.control_id == control.id
+            ]
+        return ModelUtils.get_digest(
+            trestle.__version__,
+            context.purpose,
+            context.to_markdown,
+            context.prompt_responses,
+            context.include_all_parts,
+            context.overwrite_header_values,
+            context.set_parameters_flag,
+            context.cli_yaml_header,
+            context.sections_dict,
+            context.required_sections,
+            context.allowed_sections,
+            context.merged_header,
+            context.comp_dict,
+            control,
+            group_title,
+            control_part_id_map,
+            found_alters,
+            profile_alters
+        )
+
+    def _key(self, control_file: pathlib.Path) -> str:
+        control_file = control_file.resolve()
+        try:
+            return control_file.relative_to(self._trestle_root).as_posix()
+        except ValueError:
+            return control_file.as_posix()
+
+    @staticmethod
+    def _content_digest(control_file: pathlib.Path) -> Optional[str]:
+        if not control_file.is_file():
+            return None
+        return hashlib.sha256(control_file.read_bytes()).hexdigest()
+
+    def is_unchanged(self, control_file: pathlib.Path, input_digest: str) -> bool:
+        """Determine if the markdown was generated from the same inputs and has not been edited since."""
+        entry = self._digests.get(self._key(control_file), None)
+        if not entry or entry.get('inputs', None) != input_digest:
+            return False
+        content_digest = self._content_digest(control_file)
+        return content_digest is not None and entry.get('content', None) == content_digest
+
+    def add(self, control_file: pathlib.Path, input_digest: str) -> None:
+        """Record the inputs and resulting content of the markdown just written."""
+        key = self._key(control_file)
+        content_digest = self._content_digest(control_file)
+        if content_digest is None:
+            self._digests.pop(key, None)
+        else:
+            self._digests[key] = {'inputs': input_digest, 'content': content_digest}
+
+    def save(self) -> None:
+        """Write the digests to the trestle cache."""
+        text = json.dumps(self._digests, indent=2, sort_keys=True)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_text(text, encoding=const.FILE_ENCODING)
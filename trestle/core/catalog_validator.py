@@ -16,20 +16,61 @@
 """Validate catalog by confirming no duplicate param ids."""
 import logging
 import pathlib
-from typing import Optional
+from typing import Optional, Set
 
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.list_utils import as_list
-from trestle.core.catalog.catalog_interface import CatalogInterface
-from trestle.core.validator import Validator
-from trestle.oscal.catalog import Catalog
+from trestle.core.validator import ModelVisitor, Validator
+from trestle.oscal.catalog import Catalog, Control, Group
 
 logger = logging.getLogger(__name__)
 
 
+class _CatalogParamsVisitor(ModelVisitor):
+    """Visitor collecting the parameter ids of all controls in a catalog."""
+
+    def __init__(self, catalog: Catalog) -> None:
+        """Initialize the visitor for the catalog."""
+        self._catalog = catalog
+        self._param_ids: Set[str] = set()
+        self._valid = True
+        self._generate_group_index = 0
+
+    def visit(self, node: object) -> None:
+        """Record the parameter ids of each control, and assign ids to groups without one as CatalogInterface does."""
+        if isinstance(node, Group) and node.id is None:
+            node.id = f'trestle_group_{self._generate_group_index:04d}'
+            self._generate_group_index += 1
+            logger.warning(f'Group titled "{node.title}" has no id and has been assigned id: {node.id}')
+        elif self._valid and isinstance(node, Control):
+            for param in as_list(node.params):
+                if param.id in self._param_ids:
+                    logger.warning(f'Catalog has duplicated parameter id: {param.id} in control {node.id}')
+                    self._valid = False
+                    return
+                self._param_ids.add(param.id)
+
+    def is_valid(self) -> bool:
+        """Confirm no control parameter ids are duplicated, including by the loose parameters of the catalog."""
+        if not self._valid:
+            return False
+        for param in as_list(self._catalog.params):
+            if param.id in self._param_ids:
+                logger.warning(f'Catalog has duplicated parameter id: {param.id} in catalog params')
+                return False
+        return True
+
+
 class CatalogValidator(Validator):
     """Validator to confirm all param ids in catalog are unique."""
 
+    def get_visitor(self,
+                    model: TopLevelOscalModel,
+                    quiet: bool,
+                    trestle_root: Optional[pathlib.Path] = None) -> Optional[ModelVisitor]:
+        """Get the visitor that checks the parameter ids of a catalog, or None if the model is not a catalog."""
+        return _CatalogParamsVisitor(model) if isinstance(model, Catalog) else None
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
@@ -45,17 +86,4 @@ class CatalogValidator(Validator):
         """
         if not isinstance(model, Catalog):
             return True
-        catalog: Catalog = model
-        cat_interface = CatalogInterface(catalog)
-        param_ids = set()
-        for control in cat_interface.get_all_controls_from_dict():
-            for param in as_list(control.params):
-                if param.id in param_ids:
-                    logger.warning(f'Catalog has duplicated parameter id: {param.id} in control {control.id}')
-                    return False
-                param_ids.add(param.id)
-        for param_id in cat_interface.loose_param_dict.keys():
-            if param_id in param_ids:
-                logger.warning(f'Catalog has duplicated parameter id: {param.id} in control {control.id}')
-                return False
-        return True
+        return self._model_is_valid_by_visitor(model, quiet, trestle_root)
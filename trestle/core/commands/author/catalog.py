@@ -28,6 +28,7 @@ from trestle.common import file_utils
 from trestle.common.err import TrestleError, TrestleNotFoundError, handle_generic_command_exception
 from trestle.common.load_validate import load_validate_model_name, load_validate_model_path
 from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_api import CatalogAPI
 from trestle.core.commands.author.common import AuthorCommonCommand
 from trestle.core.commands.common.cmd_utils import clear_folder
@@ -61,6 +62,7 @@ class CatalogGenerate(AuthorCommonCommand):
             action='store_true',
             default=False
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS_GENERATE, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -90,7 +92,7 @@ class CatalogGenerate(AuthorCommonCommand):
             markdown_path = trestle_root / args.output
 
             return self.generate_markdown(
-                trestle_root, catalog_path, markdown_path, yaml_header, args.overwrite_header_values
+                trestle_root, catalog_path, markdown_path, yaml_header, args.overwrite_header_values, args.jobs
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error occurred when generating markdown for catalog')
@@ -101,9 +103,10 @@ class CatalogGenerate(AuthorCommonCommand):
         catalog_path: pathlib.Path,
         markdown_path: pathlib.Path,
         yaml_header: Dict[str, Any],
-        overwrite_header_values: bool
+        overwrite_header_values: bool,
+        jobs: int = 1
     ) -> int:
-        """Generate markdown for the controls in the catalog."""
+        """Generate markdown for the controls in the catalog, one control at a time whatever the jobs."""
         try:
             catalog = load_validate_model_path(trestle_root, catalog_path)
             context = ControlContext.generate(
@@ -115,7 +118,7 @@ class CatalogGenerate(AuthorCommonCommand):
                 overwrite_header_values=overwrite_header_values,
                 set_parameters_flag=True
             )
-            catalog_api = CatalogAPI(catalog=catalog, context=context)
+            catalog_api = CatalogAPI(catalog=catalog, context=context, jobs=jobs)
             catalog_api.write_catalog_as_markdown()
 
         except TrestleNotFoundError as e:
@@ -144,6 +147,7 @@ class CatalogAssemble(AuthorCommonCommand):
         self.add_argument('-sp', '--set-parameters', action='store_true', help=const.HELP_SET_PARAMS)
         self.add_argument('-r', '--regenerate', action='store_true', help=const.HELP_REGENERATE)
         self.add_argument('-vn', '--version', help=const.HELP_VERSION, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -156,7 +160,8 @@ class CatalogAssemble(AuthorCommonCommand):
                 parent_cat_name=args.name,
                 set_parameters_flag=args.set_parameters,
                 regenerate=args.regenerate,
-                version=args.version
+                version=args.version,
+                jobs=args.jobs
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error occurred while assembling catalog')
@@ -169,7 +174,8 @@ class CatalogAssemble(AuthorCommonCommand):
         parent_cat_name: Optional[str],
         set_parameters_flag: bool,
         regenerate: bool,
-        version: Optional[str]
+        version: Optional[str],
+        jobs: int = 1
     ) -> int:
         """
         Assemble the markdown directory into a json catalog model file.
@@ -182,6 +188,7 @@ class CatalogAssemble(AuthorCommonCommand):
             set_parameters_flag: set the parameters and props in the control to the values in the markdown yaml header
             regenerate: whether to regenerate the uuid's in the catalog
             version: version for the assembled catalog
+            jobs: number of processes used to read the markdown control files
 
         Returns:
             0 on success, 1 otherwise
@@ -196,9 +203,11 @@ class CatalogAssemble(AuthorCommonCommand):
             raise TrestleError(f'Markdown directory {md_name} does not exist.')
 
         # assemble the markdown controls into fresh md_catalog
-        catalog_api_from_md = CatalogAPI(catalog=None)
+        # assignments are not validated while the catalog is built up - it is validated once complete
+        catalog_api_from_md = CatalogAPI(catalog=None, jobs=jobs)
         try:
-            md_catalog = catalog_api_from_md.read_catalog_from_markdown(md_dir, set_parameters_flag)
+            with OscalBaseModel.bulk_edit():
+                md_catalog = catalog_api_from_md.read_catalog_from_markdown(md_dir, set_parameters_flag)
         except Exception as e:
             raise TrestleError(f'Error reading catalog from markdown {md_dir}: {e}')
 
@@ -221,13 +230,16 @@ class CatalogAssemble(AuthorCommonCommand):
             parent_cat, parent_cat_path = load_validate_model_name(trestle_root, parent_cat_name, Catalog)
             parent_cat_api = CatalogAPI(catalog=parent_cat)
             # merge the just-read md catalog into the original json
-            parent_cat_api.merge_catalog(md_catalog, set_parameters_flag)
-            md_catalog = parent_cat_api._catalog_interface.get_catalog()
+            with OscalBaseModel.bulk_edit():
+                parent_cat_api.merge_catalog(md_catalog, set_parameters_flag)
+                md_catalog = parent_cat_api._catalog_interface.get_catalog()
             new_content_type = FileContentType.path_to_content_type(parent_cat_path)
 
         if version:
             md_catalog.metadata.version = version
 
+        md_catalog.validate_fields()
+
         # now check the destination catalog to see if the in-memory catalog matches it
         if assem_cat_path:
             new_content_type = FileContentType.path_to_content_type(assem_cat_path)
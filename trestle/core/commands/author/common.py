@@ -37,6 +37,9 @@ class AuthorCommonCommand(CommandPlusDocs):
 
     task_name: str
 
+    # check that markdown bodies are valid Github Flavored Markdown when validating
+    strict_gfm: bool = False
+
     def _initialize(self, args: argparse.Namespace) -> int:
         log.set_log_level_from_args(args)
         # Externalize
@@ -47,6 +50,7 @@ class AuthorCommonCommand(CommandPlusDocs):
             self.global_ = args.__getattribute__('global')
         except AttributeError:
             self.global_ = None
+        self.strict_gfm = getattr(args, 'strict_gfm', False)
 
         if self.task_name:
             self.task_path = self.trestle_root / self.task_name
@@ -28,6 +28,7 @@ from trestle.common.err import TrestleError, handle_generic_command_exception
 from trestle.common.list_utils import as_list, deep_get
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_api import CatalogAPI
 from trestle.core.catalog.catalog_reader import CatalogReader
 from trestle.core.commands.author.common import AuthorCommonCommand
@@ -55,6 +56,7 @@ class ComponentGenerate(AuthorCommonCommand):
             '-o', '--output', help='Name of the output generated component markdown folder', required=True, type=str
         )  # noqa E501
         self.add_argument('-fo', '--force-overwrite', help=const.HELP_FO_OUTPUT, required=False, action='store_true')
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS_GENERATE, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -67,13 +69,15 @@ class ComponentGenerate(AuthorCommonCommand):
                 except TrestleError as e:  # pragma: no cover
                     raise TrestleError(f'Unable to overwrite contents in {args.output} folder: {e}')
 
-            return self.component_generate_all(args.trestle_root, args.name, args.output)
+            return self.component_generate_all(args.trestle_root, args.name, args.output, args.jobs)
 
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Generation of the component markdown failed')
 
-    def component_generate_all(self, trestle_root: pathlib.Path, comp_def_name: str, markdown_dir_name: str) -> int:
-        """Generate markdown for all components in comp def."""
+    def component_generate_all(
+        self, trestle_root: pathlib.Path, comp_def_name: str, markdown_dir_name: str, jobs: int = 1
+    ) -> int:
+        """Generate markdown for all components in comp def, one control at a time whatever the jobs."""
         if not file_utils.is_directory_name_allowed(markdown_dir_name):
             raise TrestleError(f'{markdown_dir_name} is not an allowed directory name')
         md_path = trestle_root / markdown_dir_name
@@ -86,7 +90,7 @@ class ComponentGenerate(AuthorCommonCommand):
 
         rc = CmdReturnCodes.SUCCESS.value
         for component in as_list(component_def.components):
-            rc = self.component_generate_by_name(context, component, md_path / component.title)
+            rc = self.component_generate_by_name(context, component, md_path / component.title, jobs)
             if rc != CmdReturnCodes.SUCCESS.value:
                 break
         return rc
@@ -100,7 +104,11 @@ class ComponentGenerate(AuthorCommonCommand):
         return ''
 
     def component_generate_by_name(
-        self, context: ControlContext, component: comp.DefinedComponent, markdown_dir_path: pathlib.Path
+        self,
+        context: ControlContext,
+        component: comp.DefinedComponent,
+        markdown_dir_path: pathlib.Path,
+        jobs: int = 1
     ) -> int:
         """Create markdown for the component using its source profiles."""
         logger.info(f'Generating markdown for component {component.title}')
@@ -122,7 +130,7 @@ class ComponentGenerate(AuthorCommonCommand):
                 resolved_catalog = ProfileResolver.get_resolved_profile_catalog(
                     context.trestle_root, source_profile_uri, param_rep=ParameterRep.LEAVE_MOUSTACHE
                 )
-                local_catalog_api = CatalogAPI(resolved_catalog)
+                local_catalog_api = CatalogAPI(resolved_catalog, jobs=jobs)
                 cat_api_dict[source_profile_uri] = local_catalog_api
             else:
                 local_catalog_api = cat_api_dict[source_profile_uri]
@@ -163,6 +171,7 @@ class ComponentAssemble(AuthorCommonCommand):
         self.add_argument('-o', '--output', help=output_help_str, required=True, type=str)
         self.add_argument('-r', '--regenerate', action='store_true', help=const.HELP_REGENERATE)
         self.add_argument('-vn', '--version', help=const.HELP_VERSION, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -174,6 +183,7 @@ class ComponentAssemble(AuthorCommonCommand):
                 assem_comp_name=args.output,
                 regenerate=args.regenerate,
                 version=args.version,
+                jobs=args.jobs
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Assembly of markdown to component-definition failed')
@@ -186,6 +196,7 @@ class ComponentAssemble(AuthorCommonCommand):
         assem_comp_name: str,
         regenerate: bool,
         version: Optional[str],
+        jobs: int = 1
     ) -> int:
         """
         Assemble the markdown directory into a json component-definition model file.
@@ -197,6 +208,7 @@ class ComponentAssemble(AuthorCommonCommand):
             assem_comp_name: The name of the assembled component-definiton.  Can be same as the parent to overwrite
             regenerate: Whether to regenerate the uuid's in the component
             version: Optional version for the assembled component
+            jobs: Number of processes used to read the markdown control files
 
         Returns:
             0 on success, 1 otherwise
@@ -226,10 +238,11 @@ class ComponentAssemble(AuthorCommonCommand):
 
         context = ControlContext.generate(ContextPurpose.COMPONENT, False, trestle_root, md_dir)
 
-        ComponentAssemble.assemble_comp_def_into_parent(parent_comp, md_dir, context)
+        with OscalBaseModel.bulk_edit(parent_comp):
+            ComponentAssemble.assemble_comp_def_into_parent(parent_comp, md_dir, context, jobs)
 
-        if version:
-            parent_comp.metadata.version = version
+            if version:
+                parent_comp.metadata.version = version
 
         assem_comp_path = ModelUtils.get_model_path_for_name_and_class(
             trestle_root, assem_comp_name, comp.ComponentDefinition, new_content_type
@@ -258,7 +271,7 @@ class ComponentAssemble(AuthorCommonCommand):
 
     @staticmethod
     def assemble_comp_def_into_parent(
-        parent_comp: comp.ComponentDefinition, md_dir: pathlib.Path, context: ControlContext
+        parent_comp: comp.ComponentDefinition, md_dir: pathlib.Path, context: ControlContext, jobs: int = 1
     ) -> None:
         """Assemble markdown content into provided component-definition model."""
         # find the needed list of comps
@@ -286,7 +299,7 @@ class ComponentAssemble(AuthorCommonCommand):
             context.comp_def = parent_comp
             context.component = component
             logger.info(f'Assembling markdown for component {component.title}')
-            ComponentAssemble._update_component_with_markdown(md_dir, component, context)
+            ComponentAssemble._update_component_with_markdown(md_dir, component, context, jobs)
 
     @staticmethod
     def _get_profile_title_and_href_from_dir(md_dir: pathlib.Path) -> Tuple[str, str]:
@@ -305,7 +318,7 @@ class ComponentAssemble(AuthorCommonCommand):
 
     @staticmethod
     def _update_component_with_markdown(
-        md_dir: pathlib.Path, component: comp.DefinedComponent, context: ControlContext
+        md_dir: pathlib.Path, component: comp.DefinedComponent, context: ControlContext, jobs: int = 1
     ) -> None:
         md_path = md_dir / component.title
         sub_dirs = file_utils.iterdir_without_hidden_files(md_path)
@@ -313,7 +326,7 @@ class ComponentAssemble(AuthorCommonCommand):
         for source_dir in source_dirs:
             profile_title, _ = ComponentAssemble._get_profile_title_and_href_from_dir(md_path / source_dir)
             # context has defined component and comp_name
-            imp_reqs = CatalogReader.read_catalog_imp_reqs(md_path / source_dir, context)
+            imp_reqs = CatalogReader.read_catalog_imp_reqs(md_path / source_dir, context, jobs)
             # the imp_reqs need to be inserted into the correct control_implementation
             for imp_req in imp_reqs:
                 ControlInterface.insert_imp_req_into_component(component, imp_req, profile_title, context.trestle_root)
@@ -51,6 +51,10 @@ TEMPLATE_TYPE_VALIDATE_SHORT = '-vtt'
 TEMPLATE_TYPE_VALIDATE_LONG = '--validate-template-type'
 TEMPLATE_TYPE_VALIDATE_HELP = 'Validate that template and instance files match with x-trestle-template-type field'
 
+STRICT_GFM_SHORT = '-sg'
+STRICT_GFM_LONG = '--strict-gfm'
+STRICT_GFM_HELP = 'Also check that the body of each markdown file renders as valid Github Flavored Markdown.'
+
 START_TEMPLATE_VERSION = '0.0.1'  # first ever template version, all templates without version will be defaulted to this
 TRESTLE_RESOURCES = 'trestle.resources'
 TEMPLATE_VERSION_HEADER = 'x-trestle-template-version'
@@ -90,6 +90,12 @@ class Docs(AuthorCommonCommand):
             help=author_const.TEMPLATE_TYPE_VALIDATE_HELP,
             action='store_true'
         )
+        self.add_argument(
+            author_const.STRICT_GFM_SHORT,
+            author_const.STRICT_GFM_LONG,
+            help=author_const.STRICT_GFM_HELP,
+            action='store_true'
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -178,7 +184,7 @@ class Docs(AuthorCommonCommand):
         if not template_file.is_file():
             raise TrestleError(f'Required template file: {self.rel_dir(template_file)} does not exist. Exiting.')
         try:
-            md_api = MarkdownAPI()
+            md_api = MarkdownAPI(self.strict_gfm)
             validate_body = False if validate_only_header else True
             md_api.load_validator_with_template(
                 template_file, validate_header or validate_only_header, validate_body, heading, True
@@ -235,7 +241,7 @@ class Docs(AuthorCommonCommand):
                             logger.info(f'Ignoring file {item_path} from validation.')
                             continue
 
-                    md_api = MarkdownAPI()
+                    md_api = MarkdownAPI(self.strict_gfm)
                     if template_version != '':
                         template_file = self.template_dir / self.template_name
                     else:
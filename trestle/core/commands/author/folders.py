@@ -87,6 +87,12 @@ class Folders(AuthorCommonCommand):
             help=author_const.TEMPLATE_TYPE_VALIDATE_HELP,
             action='store_true'
         )
+        self.add_argument(
+            author_const.STRICT_GFM_SHORT,
+            author_const.STRICT_GFM_LONG,
+            help=author_const.STRICT_GFM_HELP,
+            action='store_true'
+        )
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -167,7 +173,7 @@ class Folders(AuthorCommonCommand):
                     if not readme_validate and template_file.name == 'readme.md':
                         raise TrestleError('Template directory contains a readme.md file and readme validation is off.')
 
-                    md_api = MarkdownAPI()
+                    md_api = MarkdownAPI(self.strict_gfm)
                     md_api.load_validator_with_template(
                         template_file, validate_header, not validate_only_header, heading
                     )
@@ -224,7 +230,7 @@ class Folders(AuthorCommonCommand):
             instance_file_name = instance_file.relative_to(instance_dir)
             instance_file_names.append(instance_file_name)
             if instance_file.suffix == const.MARKDOWN_FILE_EXT:
-                md_api = MarkdownAPI()
+                md_api = MarkdownAPI(self.strict_gfm)
                 versioned_template_dir = None
                 # checks on naming template name out of type header if needed
                 if validate_by_type_field:
@@ -15,14 +15,14 @@
 # limitations under the License.
 """Trestle Commands."""
 import argparse
+import hashlib
 import logging
 import operator
 import pathlib
 import re
-import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
-from jinja2 import ChoiceLoader, DictLoader, Environment, FileSystemLoader, Template
+from jinja2 import BaseLoader, ChoiceLoader, Environment, FileSystemLoader, Template, TemplateNotFound
 
 from ruamel.yaml import YAML
 
@@ -190,9 +190,7 @@ class JinjaCmd(CommandPlusDocs):
     ) -> int:
         """Run jinja over an input file with additional booleans."""
         template_folder = pathlib.Path.cwd()
-        jinja_env = Environment(
-            loader=FileSystemLoader(template_folder), extensions=extensions(), trim_blocks=True, autoescape=True
-        )
+        jinja_env = JinjaCmd.get_environment(template_folder)
         template = jinja_env.get_template(str(r_input_file))
         # create boolean dict
         if operator.xor(bool(ssp), bool(profile)):
@@ -265,6 +263,10 @@ class JinjaCmd(CommandPlusDocs):
         )
         catalog_interface = CatalogInterface(resolved_catalog)
 
+        # one environment for all controls so the template and nested expressions are compiled once
+        jinja_env = JinjaCmd.get_environment(template_folder)
+        template = jinja_env.get_template(str(r_input_file))
+
         # Generate a single markdown page for each control per each group
         for group in catalog_interface.get_all_groups_from_catalog():
             for control in catalog_interface.get_sorted_controls_in_group(group.id):
@@ -278,13 +280,6 @@ class JinjaCmd(CommandPlusDocs):
 
                 control_writer = DocsControlWriter()
 
-                jinja_env = Environment(
-                    loader=FileSystemLoader(template_folder),
-                    extensions=extensions(),
-                    trim_blocks=True,
-                    autoescape=True
-                )
-                template = jinja_env.get_template(str(r_input_file))
                 lut['catalog_interface'] = catalog_interface
                 lut['control_interface'] = ControlInterface()
                 lut['control_writer'] = control_writer
@@ -298,9 +293,25 @@ class JinjaCmd(CommandPlusDocs):
 
         return CmdReturnCodes.SUCCESS.value
 
+    @staticmethod
+    def get_environment(template_folder: pathlib.Path) -> Environment:
+        """Create the environment for templates in the folder and the intermediate output rendered from them."""
+        return Environment(
+            loader=ChoiceLoader([_RenderedLoader(), FileSystemLoader(template_folder)]),
+            extensions=extensions(),
+            trim_blocks=True,
+            autoescape=True
+        )
+
     @staticmethod
     def render_template(template: Template, lut: Dict[str, Any], template_folder: pathlib.Path) -> str:
         """Render template."""
+        jinja_env = template.environment
+        loader = jinja_env.loader
+        if not (isinstance(loader, ChoiceLoader) and isinstance(loader.loaders[0], _RenderedLoader)):
+            jinja_env = JinjaCmd.get_environment(template_folder)
+            loader = jinja_env.loader
+        rendered_loader: _RenderedLoader = loader.loaders[0]
         new_output = template.render(**lut)
         output = ''
         # This recursion allows nesting within expressions (e.g. an expression can contain jinja templates).
@@ -308,20 +319,40 @@ class JinjaCmd(CommandPlusDocs):
         while new_output != output and error_countdown > 0:
             error_countdown = error_countdown - 1
             output = new_output
-            random_name = uuid.uuid4()  # Should be random and not used.
-            dict_loader = DictLoader({str(random_name): new_output})
-            jinja_env = Environment(
-                loader=ChoiceLoader([dict_loader, FileSystemLoader(template_folder)]),
-                extensions=extensions(),
-                autoescape=True,
-                trim_blocks=True
-            )
-            template = jinja_env.get_template(str(random_name))
+            # output seen before is already compiled in the environment
+            template = rendered_loader.get_rendered_template(jinja_env, new_output)
             new_output = template.render(**lut)
 
         return output
 
 
+class _RenderedLoader(BaseLoader):
+    """Loader of intermediate rendered output, named by the hash of its content."""
+
+    prefix = '__trestle_rendered__/'
+
+    def __init__(self) -> None:
+        """Initialize the loader with no sources."""
+        # only the source being loaded is kept, since the environment caches the compiled template
+        self._sources: Dict[str, str] = {}
+
+    def get_rendered_template(self, environment: Environment, source: str) -> Template:
+        """Load the template of the source, which is only compiled if not already cached by the environment."""
+        name = self.prefix + hashlib.sha256(source.encode(const.FILE_ENCODING)).hexdigest()
+        self._sources[name] = source
+        try:
+            return environment.get_template(name)
+        finally:
+            del self._sources[name]
+
+    def get_source(self, environment: Environment, template: str) -> Tuple[str, Optional[str], Callable[[], bool]]:
+        """Get the source of a template added to the loader."""
+        if template not in self._sources:
+            raise TemplateNotFound(template)
+        # the name is derived from the content so a compiled template never goes stale
+        return self._sources[template], None, lambda: True
+
+
 def _number_captions(md_body: str) -> str:
     """Incrementally number tables and image captions."""
     images = {}
@@ -33,6 +33,7 @@ from trestle.common.err import TrestleError, TrestleNotFoundError, handle_generi
 from trestle.common.list_utils import as_filtered_list, as_list, comma_sep_to_list, comma_colon_sep_to_dict, deep_set, none_if_empty  # noqa E501
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_api import CatalogAPI
 from trestle.core.commands.author.common import AuthorCommonCommand
 from trestle.core.commands.common.cmd_utils import clear_folder
@@ -69,6 +70,7 @@ class ProfileGenerate(AuthorCommonCommand):
         )
         self.add_argument('-s', '--sections', help=const.HELP_SECTIONS, required=False, type=str)
         self.add_argument('-rs', '--required-sections', help=const.HELP_REQUIRED_SECTIONS, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS_GENERATE, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -107,7 +109,8 @@ class ProfileGenerate(AuthorCommonCommand):
                 yaml_header,
                 args.overwrite_header_values,
                 sections_dict,
-                comma_sep_to_list(args.required_sections)
+                comma_sep_to_list(args.required_sections),
+                args.jobs
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Generation of the profile markdown failed')
@@ -120,7 +123,8 @@ class ProfileGenerate(AuthorCommonCommand):
         yaml_header: Dict[str, Any],
         overwrite_header_values: bool,
         sections_dict: Optional[Dict[str, str]],
-        required_sections: Optional[List[str]]
+        required_sections: Optional[List[str]],
+        jobs: int = 1
     ) -> int:
         """Generate markdown for the controls in the profile.
 
@@ -132,6 +136,7 @@ class ProfileGenerate(AuthorCommonCommand):
             overwrite_header_values: Overwrite values in the markdown header but allow new items to be added
             sections_dict: Optional dict mapping section short names to long
             required_sections: Optional list of sections that get prompted for prose if not in the profile
+            jobs: Has no effect, since the control markdown files are written serially
 
         Returns:
             0 on success, 1 on error
@@ -155,7 +160,7 @@ class ProfileGenerate(AuthorCommonCommand):
             context.set_parameters_flag = True
             context.required_sections = required_sections
             context.inherited_props = inherited_props
-            catalog_api = CatalogAPI(catalog=catalog, context=context)
+            catalog_api = CatalogAPI(catalog=catalog, context=context, jobs=jobs)
             catalog_api.write_catalog_as_markdown()
 
         except TrestleNotFoundError as e:
@@ -186,6 +191,7 @@ class ProfileAssemble(AuthorCommonCommand):
         self.add_argument('-s', '--sections', help=const.HELP_SECTIONS, required=False, type=str)
         self.add_argument('-rs', '--required-sections', help=const.HELP_REQUIRED_SECTIONS, required=False, type=str)
         self.add_argument('-as', '--allowed-sections', help=const.HELP_ALLOWED_SECTIONS, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -201,7 +207,8 @@ class ProfileAssemble(AuthorCommonCommand):
                 version=args.version,
                 sections_dict=comma_colon_sep_to_dict(args.sections),
                 required_sections=comma_sep_to_list(args.required_sections),
-                allowed_sections=args.allowed_sections
+                allowed_sections=args.allowed_sections,
+                jobs=args.jobs
             )
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Assembly of markdown to profile failed')
@@ -299,7 +306,8 @@ class ProfileAssemble(AuthorCommonCommand):
         version: Optional[str],
         sections_dict: Dict[str, str],
         required_sections: List[str],
-        allowed_sections: Optional[List[str]]
+        allowed_sections: Optional[List[str]],
+        jobs: int = 1
     ) -> int:
         """
         Assemble the markdown directory into a json profile model file.
@@ -315,6 +323,7 @@ class ProfileAssemble(AuthorCommonCommand):
             sections_dict: Optional map of short name to long name for sections
             required_sections: List of required sections in assembled profile, as comma-separated short names
             allowed_sections: Optional list of section short names that are allowed, as comma-separated short names
+            jobs: Number of processes used to read the markdown control files
 
         Returns:
             0 on success, 1 otherwise
@@ -354,24 +363,26 @@ class ProfileAssemble(AuthorCommonCommand):
         # load the editable sections of the markdown and create Adds for them
         # then overwrite the Adds in the existing profile with the new ones
         # keep track if any changes were made
-        catalog_api = CatalogAPI(catalog=catalog, context=context)
-        found_alters, param_dict, param_map = catalog_api.read_additional_content_from_md(label_as_key=True)
+        catalog_api = CatalogAPI(catalog=catalog, context=context, jobs=jobs)
+        with OscalBaseModel.bulk_edit(parent_prof):
+            found_alters, param_dict, param_map = catalog_api.read_additional_content_from_md(label_as_key=True)
 
-        if allowed_sections is not None:
-            for bad_part in [
+            if allowed_sections is not None:
+                bad_parts = [
                     part for alter in found_alters for add in as_list(alter.adds)
                     for part in as_filtered_list(add.parts, lambda a: a.name not in allowed_sections)  # type: ignore
-            ]:
-                raise TrestleError(f'Profile has alter with name {bad_part.name} not in allowed sections.')
+                ]
+                for bad_part in bad_parts:
+                    raise TrestleError(f'Profile has alter with name {bad_part.name} not in allowed sections.')
 
-        ProfileAssemble._replace_alter_adds(parent_prof, found_alters)
-        if set_parameters_flag:
-            ProfileAssemble._replace_modify_set_params(parent_prof, param_dict, param_map)
+            ProfileAssemble._replace_alter_adds(parent_prof, found_alters)
+            if set_parameters_flag:
+                ProfileAssemble._replace_modify_set_params(parent_prof, param_dict, param_map)
 
-        if version:
-            parent_prof.metadata.version = version
+            if version:
+                parent_prof.metadata.version = version
 
-        parent_prof.metadata.oscal_version = OSCAL_VERSION
+            parent_prof.metadata.oscal_version = OSCAL_VERSION
 
         assem_prof_path = ModelUtils.get_model_path_for_name_and_class(
             trestle_root, assem_prof_name, prof.Profile, new_content_type
@@ -453,6 +464,7 @@ class ProfileResolve(AuthorCommonCommand):
             type=str,
             default=''
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -476,7 +488,8 @@ class ProfileResolve(AuthorCommonCommand):
                 value_assigned_prefix,
                 value_not_assigned_prefix,
                 show_labels,
-                label_prefix
+                label_prefix,
+                args.jobs
             )
 
         except Exception as e:  # pragma: no cover
@@ -492,7 +505,8 @@ class ProfileResolve(AuthorCommonCommand):
         value_assigned_prefix: Optional[str],
         value_not_assigned_prefix: Optional[str],
         show_labels: bool,
-        label_prefix: Optional[str]
+        label_prefix: Optional[str],
+        jobs: int = 1
     ) -> int:
         """Create resolved profile catalog from given profile.
 
@@ -506,6 +520,7 @@ class ProfileResolve(AuthorCommonCommand):
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
             show_labels: Show labels for parameters and not values
             label_prefix: Prefix placed in front of param label
+            jobs: Maximum number of sibling profile imports to resolve concurrently
 
         Returns:
             0 on success and raises exception on error
@@ -537,7 +552,8 @@ class ProfileResolve(AuthorCommonCommand):
             param_rep,
             False,
             value_assigned_prefix,
-            value_not_assigned_prefix
+            value_not_assigned_prefix,
+            jobs=jobs
         )
         ModelUtils.save_top_level_model(catalog, trestle_root, catalog_name, FileContentType.JSON)
 
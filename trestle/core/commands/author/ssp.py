@@ -33,6 +33,7 @@ from trestle.common.err import TrestleError, handle_generic_command_exception
 from trestle.common.list_utils import as_list, comma_sep_to_list, delete_list_from_list, none_if_empty
 from trestle.common.load_validate import load_validate_model_name
 from trestle.common.model_utils import ModelUtils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_api import CatalogAPI
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.catalog.catalog_reader import CatalogReader
@@ -89,6 +90,7 @@ class SSPGenerate(AuthorCommonCommand):
             action='store_true',
             default=False
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS_GENERATE, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -119,7 +121,8 @@ class SSPGenerate(AuthorCommonCommand):
                 yaml_header,
                 args.overwrite_header_values,
                 args.force_overwrite,
-                args.include_all_parts
+                args.include_all_parts,
+                args.jobs
             )
 
         except Exception as e:  # pragma: no cover
@@ -135,7 +138,8 @@ class SSPGenerate(AuthorCommonCommand):
         yaml_header: Dict[str, Any],
         overwrite_header_values: bool,
         force_overwrite: bool,
-        include_all_parts: bool
+        include_all_parts: bool,
+        jobs: int = 1
     ) -> int:
         """
         Generate the ssp markdown from the profile and compdefs.
@@ -193,7 +197,7 @@ class SSPGenerate(AuthorCommonCommand):
             show_value_warnings=True
         )
 
-        catalog_api = CatalogAPI(catalog=resolved_catalog, context=context)
+        catalog_api = CatalogAPI(catalog=resolved_catalog, context=context, jobs=jobs)
 
         context.cli_yaml_header[const.TRESTLE_GLOBAL_TAG] = {}
         profile_header = {'title': context.profile.metadata.title, 'href': profile_href}
@@ -259,6 +263,7 @@ class SSPAssemble(AuthorCommonCommand):
         self.add_argument('-o', '--output', help=output_help_str, required=True, type=str)
         self.add_argument('-r', '--regenerate', action='store_true', help=const.HELP_REGENERATE)
         self.add_argument('-vn', '--version', help=const.HELP_VERSION, required=False, type=str)
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     @staticmethod
     def _get_ssp_component(ssp: ossp.SystemSecurityPlan, gen_comp: generic.GenericComponent) -> ossp.SystemComponent:
@@ -598,8 +603,9 @@ class SSPAssemble(AuthorCommonCommand):
                     index_list = [ssp_sys_imp_comps.index(value) for value in diffs if value in ssp_sys_imp_comps]
                     delete_list_from_list(ssp.system_implementation.components, index_list)
 
-                self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
-                CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context)
+                with OscalBaseModel.bulk_edit():
+                    self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
+                    CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context, args.jobs)
 
                 new_file_content_type = FileContentType.path_to_content_type(orig_ssp_path)
 
@@ -611,8 +617,9 @@ class SSPAssemble(AuthorCommonCommand):
                 ssp.control_implementation.implemented_requirements = []
                 ssp.control_implementation.description = const.SSP_SYSTEM_CONTROL_IMPLEMENTATION_TEXT
                 ssp.system_implementation.components = []
-                self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
-                CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context)
+                with OscalBaseModel.bulk_edit():
+                    self._merge_comp_defs(ssp, comp_dict, context, catalog_interface)
+                    CatalogReader.read_ssp_md_content(md_path, ssp, comp_dict, part_id_map_by_label, context, args.jobs)
 
                 import_profile: ossp.ImportProfile = gens.generate_sample_model(ossp.ImportProfile)
                 import_profile.href = const.REPLACE_ME
@@ -632,6 +639,9 @@ class SSPAssemble(AuthorCommonCommand):
             if args.version:
                 ssp.metadata.version = args.version
 
+            # the ssp content was assembled without validation of each assignment so validate it once here
+            ssp.validate_fields()
+
             if ModelUtils.models_are_equivalent(existing_ssp, ssp):
                 logger.info('No changes to assembled ssp so ssp not written out.')
                 return CmdReturnCodes.SUCCESS.value
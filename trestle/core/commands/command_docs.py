@@ -20,12 +20,15 @@ Improves parsing until such a point as ILCLI is fixed.
 
 import argparse
 import logging
+from contextlib import ExitStack
 from typing import Optional, TextIO
 
 from ilcli import Command
 
 from trestle.common import file_utils
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.commands.common.return_codes import CmdReturnCodes
+from trestle.core.parsed_model_cache import ParsedModelCache
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +60,20 @@ class CommandPlusDocs(CommandBase):
     All commands that extend this class will validate the state of trestle workspace.
     """
 
+    def _validate_and_run(self, parsed_args: argparse.Namespace, extra_args: Optional[list] = None) -> int:
+        """Validate the arguments and run the command, trusting or caching the workspace models if requested."""
+        trust_workspace = getattr(parsed_args, 'trust_workspace', False)
+        parsed_cache = getattr(parsed_args, 'parsed_cache', False)
+        if not trust_workspace and not parsed_cache:
+            return super()._validate_and_run(parsed_args, extra_args)
+        trestle_root = file_utils.extract_trestle_project_root(parsed_args.trestle_root)
+        with ExitStack() as stack:
+            if trust_workspace:
+                stack.enter_context(OscalBaseModel.trust_workspace(trestle_root))
+            if parsed_cache:
+                stack.enter_context(ParsedModelCache.enable(trestle_root))
+            return super()._validate_and_run(parsed_args, extra_args)
+
     def _validate_arguments(self, args: argparse.ArgumentParser) -> int:
         """Check trestle-root argument is a valid trestle root directory."""
         root = file_utils.extract_trestle_project_root(args.trestle_root)  # type: ignore
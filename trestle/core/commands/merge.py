@@ -47,6 +47,7 @@ class MergeCmd(CommandPlusDocs):
             help=f'{const.ARG_DESC_ELEMENT}(s) to be merged. The last element is merged into the second last element.',
             required=True
         )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         """Merge elements into the parent oscal model."""
@@ -58,25 +59,27 @@ class MergeCmd(CommandPlusDocs):
             element_paths = elements_clean.split(',')
             trace.log(f'merge _run element paths {element_paths}')
             cwd = Path.cwd()
-            rc = self.perform_all_merges(element_paths, cwd, args.trestle_root)
+            rc = self.perform_all_merges(element_paths, cwd, args.trestle_root, args.jobs)
             return rc
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error while merging subcomponents on a trestle model')
 
     @classmethod
-    def perform_all_merges(cls, element_paths: List[str], effective_cwd: Path, trestle_root: Path) -> int:
+    def perform_all_merges(
+        cls, element_paths: List[str], effective_cwd: Path, trestle_root: Path, jobs: int = 1
+    ) -> int:
         """Run all merges over a list of element paths."""
         for element_path in element_paths:
             logger.debug(f'merge {element_path}')
-            plan = cls.merge(effective_cwd, ElementPath(element_path), trestle_root)
+            plan = cls.merge(effective_cwd, ElementPath(element_path), trestle_root, jobs)
             plan.execute()
         return CmdReturnCodes.SUCCESS.value
 
     @classmethod
-    def merge(cls, effective_cwd: Path, element_path: ElementPath, trestle_root: Path) -> Plan:
+    def merge(cls, effective_cwd: Path, element_path: ElementPath, trestle_root: Path, jobs: int = 1) -> Plan:
         """Merge operations.
 
-        It returns a plan for the operation
+        It returns a plan for the operation.  The decomposed parts of the model are loaded with up to jobs threads.
         """
         if not element_path.is_multipart():
             raise TrestleError(
@@ -116,7 +119,7 @@ class MergeCmd(CommandPlusDocs):
                 collection_type = destination_model_type.get_collection_type()
 
             merged_model_type, _, merged_model_instance = ModelUtils.load_distributed(
-                destination_model_path, trestle_root, collection_type)
+                destination_model_path, trestle_root, collection_type, jobs)
             plan = Plan()
             reset_destination_action = CreatePathAction(destination_model_path, clear_content=True)
             wrapper_alias = destination_model_alias
@@ -160,7 +163,7 @@ class MergeCmd(CommandPlusDocs):
         target_model_filename = target_model_path.with_suffix(file_ext)
         if target_model_filename.exists():
             trace.log(f'target model path with extension does exist so load distrib {target_model_filename}')
-            _, _, target_model_object = ModelUtils.load_distributed(target_model_filename, trestle_root)
+            _, _, target_model_object = ModelUtils.load_distributed(target_model_filename, trestle_root, jobs=jobs)
         else:
             target_model_filename = Path(target_model_path)
             trace.log(f'target model path plus extension does not exist so load distrib {target_model_filename}')
@@ -168,7 +171,7 @@ class MergeCmd(CommandPlusDocs):
             collection_type = type_utils.get_origin(target_model_type)
             trace.log(f'load {target_model_filename} as collection type {collection_type}')
             _, _, target_model_object = ModelUtils.load_distributed(target_model_filename,
-                                                                    trestle_root, collection_type)
+                                                                    trestle_root, collection_type, jobs)
 
         if hasattr(target_model_object, '__dict__') and '__root__' in target_model_object.__dict__:
             trace.log('loaded object has dict and root so set target model object to root contents')
@@ -21,19 +21,79 @@ import logging
 import pathlib
 import pkgutil
 import sys
-from typing import Dict, Optional, Type
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Type
 
 import trestle.common.const as const
 import trestle.common.log as log
 import trestle.tasks
 from trestle.common import file_utils
 from trestle.common.err import TrestleError, TrestleIncorrectArgsError, handle_generic_command_exception
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.commands.command_docs import CommandPlusDocs
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.tasks.base_task import TaskBase, TaskOutcome
 
 logger = logging.getLogger(__name__)
 
+TASK_SECTION_PREFIX = 'task.'
+
+
+@dataclass
+class TaskResult:
+    """Outcome of one task section run as part of a batch."""
+
+    label: str
+    outcome: str
+    seconds: float
+    message: str = ''
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the task ran successfully."""
+        return self.outcome == TaskOutcome.SUCCESS.value
+
+
+def run_task_section(
+    label: str,
+    task_class: Type[TaskBase],
+    options: Dict[str, str],
+    trusted_root: Optional[pathlib.Path],
+    verbose: Optional[int] = None
+) -> TaskResult:
+    """
+    Simulate and then execute the task configured by one section of the config file.
+
+    Args:
+        label: name of the section without the task. prefix, i.e. the task name and an optional .qualifier
+        task_class: class of the task to run
+        options: interpolated options of the section
+        trusted_root: root of the workspace whose models are trusted, or None
+        verbose: verbosity to set up logging with when running in a separate process
+
+    Returns:
+        The outcome of the task and the time it took, with any failure captured rather than raised
+    """
+    if verbose is not None:
+        log.set_log_level_from_args(argparse.Namespace(verbose=verbose))
+    start = time.perf_counter()
+    # the options are already interpolated so they are taken as is
+    config = configparser.ConfigParser(interpolation=None)
+    section_label = TASK_SECTION_PREFIX + label
+    config.read_dict({section_label: options})
+    try:
+        with OscalBaseModel.trust_workspace(trusted_root):
+            task = task_class(config[section_label])
+            simulate_result = task.simulate()
+            if simulate_result != TaskOutcome.SIM_SUCCESS:
+                return TaskResult(label, simulate_result.value, time.perf_counter() - start)
+            actual_result = task.execute()
+        return TaskResult(label, actual_result.value, time.perf_counter() - start)
+    except Exception as e:
+        return TaskResult(label, 'error', time.perf_counter() - start, str(e))
+
 
 class TaskCmd(CommandPlusDocs):
     """Run arbitrary trestle tasks in a simple and extensible methodology."""
@@ -52,6 +112,16 @@ class TaskCmd(CommandPlusDocs):
             '-c', '--config', type=pathlib.Path, help='Pass a customized configuration file specifically for a task'
         )
         self.add_argument('-i', '--info', action='store_true', help='Print information about a particular task.')
+        self.add_argument(
+            '-a', '--all', action='store_true', help='Run the tasks of all task sections in the configuration file.'
+        )
+        self.add_argument(
+            '-s',
+            '--sections',
+            type=str,
+            help='Comma separated task sections to run, each named as in [task.<name>] or [task.<name>.<qualifier>]'
+        )
+        self.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
 
     def _run(self, args: argparse.Namespace) -> int:
         try:
@@ -61,7 +131,17 @@ class TaskCmd(CommandPlusDocs):
             if args.task and args.list:
                 raise TrestleIncorrectArgsError('Task name or -l can be provided not both.')
 
-            if not args.task and not args.list:
+            run_all = getattr(args, 'all', False)
+            sections = getattr(args, 'sections', None)
+            if run_all and sections:
+                raise TrestleIncorrectArgsError('Either -a/--all or -s/--sections can be provided not both.')
+            batch = bool(run_all or sections)
+            if batch and (args.task or args.list or args.info):
+                raise TrestleIncorrectArgsError(
+                    '-a/--all and -s/--sections cannot be combined with a task name, -l or -i.'
+                )
+
+            if not args.task and not args.list and not batch:
                 raise TrestleIncorrectArgsError(
                     'Either a trestle task or "-l/--list" shoudl be passed as input arguments.'
                 )
@@ -88,6 +168,9 @@ class TaskCmd(CommandPlusDocs):
             if args.list:
                 self._list_tasks(task_index)
                 return CmdReturnCodes.SUCCESS.value
+            if batch:
+                labels = self._get_section_labels(global_config, sections)
+                return self._run_batch(args, global_config, task_index, labels)
             # run the task
             if args.task not in task_index.keys():
                 raise TrestleIncorrectArgsError(f'Unknown trestle task: {args.task}')
@@ -121,6 +204,84 @@ class TaskCmd(CommandPlusDocs):
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error while executing Trestle task')
 
+    def _get_section_labels(self, global_config: configparser.ConfigParser, sections: Optional[str]) -> List[str]:
+        """Get the labels of the task sections to run, in order and without the task. prefix."""
+        config_labels = [
+            section[len(TASK_SECTION_PREFIX):]
+            for section in global_config.sections()
+            if section.startswith(TASK_SECTION_PREFIX)
+        ]
+        if not sections:
+            if not config_labels:
+                raise TrestleIncorrectArgsError('Config file has no task sections to run.')
+            return config_labels
+        labels: List[str] = []
+        for label in sections.split(','):
+            label = label.strip()
+            if label.startswith(TASK_SECTION_PREFIX):
+                label = label[len(TASK_SECTION_PREFIX):]
+            if not label or label in labels:
+                continue
+            if label not in config_labels:
+                raise TrestleIncorrectArgsError(f'Config file has no section [{TASK_SECTION_PREFIX}{label}]')
+            labels.append(label)
+        return labels
+
+    def _run_batch(
+        self,
+        args: argparse.Namespace,
+        global_config: configparser.ConfigParser,
+        task_index: Dict[str, Type[TaskBase]],
+        labels: List[str]
+    ) -> int:
+        """Run the tasks of the given sections, concurrently if more than one job, and report a summary."""
+        task_classes: List[Type[TaskBase]] = []
+        for label in labels:
+            # the task name is followed by an optional qualifier so a task may be configured more than once
+            task_name = label.split('.', 1)[0]
+            if task_name not in task_index:
+                raise TrestleIncorrectArgsError(
+                    f'Unknown trestle task: {task_name} in section [{TASK_SECTION_PREFIX}{label}]'
+                )
+            task_classes.append(task_index[task_name])
+        options = [dict(global_config[TASK_SECTION_PREFIX + label]) for label in labels]
+        trusted_root = args.trestle_root if getattr(args, 'trust_workspace', False) else None
+        jobs = getattr(args, 'jobs', 1) or 1
+        start = time.perf_counter()
+        if jobs <= 1 or len(labels) <= 1:
+            results = [
+                run_task_section(label, task_class, option, trusted_root)
+                for label, task_class, option in zip(labels, task_classes, options)
+            ]
+        else:
+            # each process sets up logging itself since it may not inherit the configuration
+            with ProcessPoolExecutor(max_workers=min(jobs, len(labels))) as executor:
+                results = list(
+                    executor.map(
+                        run_task_section,
+                        labels,
+                        task_classes,
+                        options, [trusted_root] * len(labels), [args.verbose] * len(labels)
+                    )
+                )
+        self._report_results(results, time.perf_counter() - start)
+        if all(result.succeeded for result in results):
+            return CmdReturnCodes.SUCCESS.value
+        return CmdReturnCodes.COMMAND_ERROR.value
+
+    def _report_results(self, results: List[TaskResult], seconds: float) -> None:
+        """Log the outcome and duration of each task followed by the totals."""
+        width = max(len(result.label) for result in results)
+        logger.info('Task summary:')
+        for result in results:
+            logger.info(f'    {result.label:<{width}}  {result.outcome:<17}  {result.seconds:8.2f}s')
+        for result in results:
+            if not result.succeeded:
+                reason = f': {result.message}' if result.message else ''
+                logger.error(f'Task {result.label} reported a {result.outcome}{reason}')
+        n_succeeded = len([result for result in results if result.succeeded])
+        logger.info(f'{n_succeeded} of {len(results)} tasks succeeded in {seconds:.2f}s')
+
     def _build_task_index(self) -> Dict[str, Type[TaskBase]]:
         """Build an index of all classes in which are tasks and present as a dictionary."""
         task_index: Dict[str, Type[TaskBase]] = {}
@@ -22,7 +22,9 @@ import trestle.common.log as log
 import trestle.core.validator_factory as vfact
 from trestle.common.const import ARG_VALIDATE, VAL_MODE_ALL
 from trestle.common.err import handle_generic_command_exception
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.commands.command_docs import CommandPlusDocs
+from trestle.core.parsed_model_cache import ParsedModelCache
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,8 @@ class ValidateCmd(CommandPlusDocs):
             mode_args = argparse.Namespace(mode=VAL_MODE_ALL)
             validator = vfact.validator_factory.get(mode_args)
 
-            return validator.validate(args)
+            # the models being validated are never trusted or loaded from the parsed cache, whatever the options
+            with OscalBaseModel.trust_workspace(None), ParsedModelCache.enable(None):
+                return validator.validate(args)
         except Exception as e:  # pragma: no cover
             return handle_generic_command_exception(e, logger, 'Error while validating contents of a trestle model')
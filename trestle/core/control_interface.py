@@ -14,12 +14,13 @@
 """Handle queries and utility operations on controls in memory."""
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Dict, List, Match, Optional, Pattern, Set, Tuple, Union
 
 import trestle.oscal.catalog as cat
 import trestle.oscal.ssp as ossp
@@ -812,6 +813,14 @@ class ControlInterface:
                 param_dict[param.id] = param
         return param_dict
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _param_ids_regex(param_ids: Tuple[str, ...]) -> Pattern[str]:
+        """Compile one pattern matching any of the param_ids with no adjacent alphanumeric char."""
+        # longest ids first so param_10 is not matched as param_1
+        alternation = '|'.join(re.escape(param_id) for param_id in sorted(param_ids, key=len, reverse=True))
+        return re.compile(r'(?<![a-zA-Z0-9_])(' + alternation + r')(?![a-zA-Z0-9_])')
+
     @staticmethod
     def _replace_ids_with_text(
         prose: str,
@@ -826,17 +835,26 @@ class ControlInterface:
         Need to check all values in dict for a match
         Reject matches where the string has an adjacent alphanumeric char: param_1 and param_10 or aparam_1
         """
-        for param in param_dict.values():
-            if param.id not in prose:
-                continue
-            # create the replacement text for the param_id
-            param_str = ControlInterface.param_to_str(
-                param, param_rep, False, False, params_format, value_assigned_prefix, value_not_assigned_prefix
-            )
-            # non-capturing groups are odd in re.sub so capture all 3 groups and replace the middle one
-            pattern = r'(^|[^a-zA-Z0-9_])' + param.id + r'($|[^a-zA-Z0-9_])'
-            prose = re.sub(pattern, r'\1' + param_str + r'\2', prose)
-        return prose
+        params = {param.id: param for param in param_dict.values() if param.id in prose}
+        if not params:
+            return prose
+        param_strs: Dict[str, str] = {}
+
+        def param_id_to_str(match: Match[str]) -> str:
+            param_id = match.group(1)
+            if param_id not in param_strs:
+                param_strs[param_id] = ControlInterface.param_to_str(
+                    params[param_id],
+                    param_rep,
+                    False,
+                    False,
+                    params_format,
+                    value_assigned_prefix,
+                    value_not_assigned_prefix
+                )
+            return param_strs[param_id]
+
+        return ControlInterface._param_ids_regex(tuple(sorted(params))).sub(param_id_to_str, prose)
 
     @staticmethod
     def _replace_params(
@@ -853,137 +871,29 @@ class ControlInterface:
 
         A single line of prose may contain multiple moustaches.
         """
-        # first check if there are any moustache patterns in the text
-        if param_rep == ParameterRep.LEAVE_MOUSTACHE:
-            return text
-        orig_text = text
-        staches: List[str] = re.findall(r'{{.*?}}', text)
-        if not staches:
-            return text
-        # now have list of all staches including braces, e.g. ['{{foo}}', '{{bar}}']
-        # clean the staches so they just have the param ids
-        param_ids = []
-        for stache in staches:
-            # remove braces so these are just param_ids but may have extra chars
-            stache_contents = stache[2:(-2)]
-            param_id = stache_contents.replace('insert: param,', '').strip()
-            param_ids.append(param_id)
-
-        # now replace original stache text with param values
-        for i, _ in enumerate(staches):
-            # A moustache may refer to a param_id not listed in the control's params
-            if param_ids[i] not in param_dict:
-                if show_value_warnings:
-                    logger.warning(f'Control prose references param {param_ids[i]} not set in the control: {staches}')
-            elif param_dict[param_ids[i]] is not None:
-                param = param_dict[param_ids[i]]
-                param_str = ControlInterface.param_to_str(
-                    param,
-                    param_rep,
-                    False,
-                    False,
-                    params_format,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix,
-                    param_dict
-                )
-                text = text.replace(staches[i], param_str, 1).strip()
-                if show_value_warnings and param_rep != ParameterRep.LABEL_OR_CHOICES and not param.values:
-                    # verifies the current parameter is not an aggregated parameter to throw a warning
-                    if const.AGGREGATES not in [prop.name for prop in as_list(param.props)]:
-                        logger.warning(f'Parameter {param_id} has no values and was referenced by prose.')
-            elif show_value_warnings:
-                logger.warning(f'Control prose references param {param_ids[i]} with no specified value.')
-        # there may be staches remaining that we can't replace if not in param_dict
-        if text != orig_text:
-            while True:
-                new_text = ControlInterface._replace_params(
-                    text,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix
-                )
-                if new_text == text:
-                    break
-                text = new_text
-        return text
+        return ParamSubstituter(
+            param_dict, params_format, param_rep, show_value_warnings, value_assigned_prefix, value_not_assigned_prefix
+        ).replace(text)
 
     @staticmethod
-    def _replace_part_prose(
-        control: cat.Control,
-        part: common.Part,
-        param_dict: Dict[str, common.Parameter],
-        params_format: Optional[str] = None,
-        param_rep: ParameterRep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES,
-        show_value_warnings: bool = False,
-        value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None
-    ) -> None:
+    def _replace_part_prose(control: cat.Control, part: common.Part, substituter: ParamSubstituter) -> None:
         """Replace the part prose according to set_param."""
         if part.prose is not None:
-            fixed_prose = ControlInterface._replace_params(
-                part.prose,
-                param_dict,
-                params_format,
-                param_rep,
-                show_value_warnings,
-                value_assigned_prefix,
-                value_not_assigned_prefix
-            )
             # change the prose in the control itself
-            part.prose = fixed_prose
+            part.prose = substituter.replace(part.prose)
         for prt in as_list(part.parts):
-            ControlInterface._replace_part_prose(
-                control,
-                prt,
-                param_dict,
-                params_format,
-                param_rep,
-                show_value_warnings,
-                value_assigned_prefix,
-                value_not_assigned_prefix
-            )
+            ControlInterface._replace_part_prose(control, prt, substituter)
         for sub_control in as_list(control.controls):
             for prt in as_list(sub_control.parts):
-                ControlInterface._replace_part_prose(
-                    sub_control,
-                    prt,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix
-                )
+                ControlInterface._replace_part_prose(sub_control, prt, substituter)
 
     @staticmethod
-    def _replace_param_choices(
-        param: common.Parameter,
-        param_dict: Dict[str, common.Parameter],
-        params_format: Optional[str],
-        param_rep: ParameterRep,
-        show_value_warnings: bool,
-        value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None
-    ) -> None:
+    def _replace_param_choices(param: common.Parameter, substituter: ParamSubstituter) -> None:
         """Set values for all choices param that refer to params with values."""
         if param.select:
-            new_choices: List[str] = []
-            for choice in as_list(param.select.choice):
-                new_choice = ControlInterface._replace_params(
-                    choice,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix
-                )
-                new_choices.append(new_choice)
-            param.select.choice = new_choices
+            param.select.choice = [substituter.replace(choice) for choice in as_list(param.select.choice)]
+            # the choices are part of the text of the param so it must be rendered again
+            substituter.forget(param.id)
 
     @staticmethod
     def replace_control_prose(
@@ -993,14 +903,17 @@ class ControlInterface:
         param_rep: ParameterRep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES,
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None
+        value_not_assigned_prefix: Optional[str] = None,
+        substituter: Optional[ParamSubstituter] = None
     ) -> None:
-        """Replace the control prose according to set_param."""
-        # first replace all choices that reference parameters
-        # note that in ASSIGNMENT_FORM each choice with a parameter will end up as [Assignment: value]
-        for param in as_list(control.params):
-            ControlInterface._replace_param_choices(
-                param,
+        """
+        Replace the control prose according to set_param.
+
+        A substituter for the same param_dict and options may be passed in to reuse its rendered params across
+        controls.
+        """
+        if substituter is None:
+            substituter = ParamSubstituter(
                 param_dict,
                 params_format,
                 param_rep,
@@ -1008,30 +921,16 @@ class ControlInterface:
                 value_assigned_prefix,
                 value_not_assigned_prefix
             )
+        # first replace all choices that reference parameters
+        # note that in ASSIGNMENT_FORM each choice with a parameter will end up as [Assignment: value]
+        for param in as_list(control.params):
+            ControlInterface._replace_param_choices(param, substituter)
         for part in as_list(control.parts):
             if part.prose is not None:
-                fixed_prose = ControlInterface._replace_params(
-                    part.prose,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix
-                )
                 # change the prose in the control itself
-                part.prose = fixed_prose
+                part.prose = substituter.replace(part.prose)
             for prt in as_list(part.parts):
-                ControlInterface._replace_part_prose(
-                    control,
-                    prt,
-                    param_dict,
-                    params_format,
-                    param_rep,
-                    show_value_warnings,
-                    value_assigned_prefix,
-                    value_not_assigned_prefix
-                )
+                ControlInterface._replace_part_prose(control, prt, substituter)
 
     @staticmethod
     def bad_header(header: str) -> bool:
@@ -1201,3 +1100,90 @@ class ControlInterface:
         logger.warning(
             f'Unable to add imp req for component {component.title} control {new_imp_req.control_id} and source: {profile_title}'  # noqa E501
         )
+
+
+class ParamSubstituter:
+    """
+    Replace moustaches referring to parameters with the text of the parameters.
+
+    Each line of text is scanned once with a single precompiled pattern.  A parameter whose text itself contains
+    moustaches is resolved recursively, so nested references are replaced in dependency order in the same pass.
+    The text of each parameter is rendered once and kept until forget is called for it.
+    """
+
+    # a moustache, e.g. {{ insert: param, ac-1_prm_1 }} or {{ac-1_prm_1}}
+    STACHE_REGEX = re.compile(r'{{.*?}}')
+
+    def __init__(
+        self,
+        param_dict: Dict[str, common.Parameter],
+        params_format: Optional[str] = None,
+        param_rep: ParameterRep = ParameterRep.VALUE_OR_LABEL_OR_CHOICES,
+        show_value_warnings: bool = False,
+        value_assigned_prefix: Optional[str] = None,
+        value_not_assigned_prefix: Optional[str] = None
+    ) -> None:
+        """Initialize the substituter for one parameter dictionary and representation."""
+        self._param_dict = param_dict
+        self._params_format = params_format
+        self._param_rep = param_rep
+        self._show_value_warnings = show_value_warnings
+        self._value_assigned_prefix = value_assigned_prefix
+        self._value_not_assigned_prefix = value_not_assigned_prefix
+        self._param_strs: Dict[str, str] = {}
+
+    def forget(self, param_id: str) -> None:
+        """Discard the rendered text of a param after it has changed."""
+        self._param_strs.pop(param_id, None)
+
+    def _param_str(self, param: common.Parameter) -> str:
+        param_str = self._param_strs.get(param.id)
+        if param_str is None:
+            param_str = ControlInterface.param_to_str(
+                param,
+                self._param_rep,
+                False,
+                False,
+                self._params_format,
+                self._value_assigned_prefix,
+                self._value_not_assigned_prefix,
+                self._param_dict
+            )
+            self._param_strs[param.id] = param_str
+        return param_str
+
+    def _replace(self, text: str, param_id_chain: Tuple[str, ...]) -> str:
+
+        def stache_to_str(match: Match[str]) -> str:
+            stache = match.group(0)
+            param_id = stache[2:-2].replace('insert: param,', '').strip()
+            # A moustache may refer to a param_id not listed in the control's params
+            if param_id not in self._param_dict:
+                if self._show_value_warnings:
+                    logger.warning(f'Control prose references param {param_id} not set in the control: {stache}')
+                return stache
+            param = self._param_dict[param_id]
+            if param is None:
+                if self._show_value_warnings:
+                    logger.warning(f'Control prose references param {param_id} with no specified value.')
+                return stache
+            # leave circular references in place
+            if param_id in param_id_chain:
+                return stache
+            param_str = self._param_str(param)
+            if self._show_value_warnings and self._param_rep != ParameterRep.LABEL_OR_CHOICES and not param.values:
+                # verifies the current parameter is not an aggregated parameter to throw a warning
+                if const.AGGREGATES not in [prop.name for prop in as_list(param.props)]:
+                    logger.warning(f'Parameter {param_id} has no values and was referenced by prose.')
+            if '{{' in param_str:
+                param_str = self._replace(param_str, param_id_chain + (param_id, ))
+            return param_str
+
+        return ParamSubstituter.STACHE_REGEX.sub(stache_to_str, text)
+
+    def replace(self, text: str) -> str:
+        """Replace all moustaches in the text that refer to params in the dictionary."""
+        if self._param_rep == ParameterRep.LEAVE_MOUSTACHE or '{{' not in text:
+            return text
+        new_text = self._replace(text, ())
+        return new_text.strip() if new_text != text else text
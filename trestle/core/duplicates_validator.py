@@ -19,13 +19,30 @@ from typing import Optional
 
 from trestle.common.model_utils import ModelUtils
 from trestle.core.base_model import OscalBaseModel
-from trestle.core.validator import Validator
+from trestle.core.validator import ModelVisitor, Validator, ValuesByNameVisitor
 from trestle.oscal.profile import Profile
 
 
+class _DuplicatesVisitor(ValuesByNameVisitor):
+    """Visitor collecting uuids and param_ids to check for duplicates."""
+
+    def is_valid(self) -> bool:
+        """Confirm no duplicate values were found for any name."""
+        return all(ModelUtils.has_no_duplicate_values(values) for values in self.values.values())
+
+
 class DuplicatesValidator(Validator):
     """Validator to check for duplicate uuids and param_ids in the model."""
 
+    def get_visitor(self,
+                    model: OscalBaseModel,
+                    quiet: bool,
+                    trestle_root: Optional[pathlib.Path] = None) -> Optional[ModelVisitor]:
+        """Get the visitor that finds all uuids and, in profiles, param_ids."""
+        # only profile, comp-def and ssp have set-params and only set-params have param_id
+        # param_id is required to be unique in profiles but not in other models
+        return _DuplicatesVisitor(['uuid', 'param_id'] if isinstance(model, Profile) else ['uuid'])
+
     def model_is_valid(self, model: OscalBaseModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None) -> bool:
         """
         Test if the model is valid and contains no duplicate uuids or param_ids.
@@ -37,10 +54,4 @@ class DuplicatesValidator(Validator):
         returns:
             True (valid) if the model does not contain duplicate uuid's.
         """
-        if not ModelUtils.has_no_duplicate_values_by_name(model, 'uuid'):
-            return False
-        # only profile, comp-def and ssp have set-params and only set-params have param_id
-        # param_id is required to be unique in profiles but not in other models
-        if isinstance(model, Profile):
-            return ModelUtils.has_no_duplicate_values_by_name(model, 'param_id')
-        return True
+        return self._model_is_valid_by_visitor(model, quiet, trestle_root)
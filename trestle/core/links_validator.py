@@ -20,14 +20,37 @@ from typing import List, Optional, Set
 
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.model_utils import ModelUtils
-from trestle.core.validator import Validator
+from trestle.core.validator import ModelVisitor, Validator, ValuesByNameVisitor
 
 logger = logging.getLogger(__name__)
 
 
+class _LinksVisitor(ValuesByNameVisitor):
+    """Visitor collecting hrefs and prose to find the uuids referenced by the model."""
+
+    def __init__(self, model: TopLevelOscalModel, quiet: bool) -> None:
+        """Initialize the visitor for the model."""
+        super().__init__(['href', 'prose'])
+        self._model = model
+        self._quiet = quiet
+
+    def is_valid(self) -> bool:
+        """Warn if the references and backmatter resources are not one-to-one."""
+        refs = ModelUtils.find_uuid_refs_in_values(self.values['href'], self.values['prose'])
+        LinksValidator.check_refs_match_resources(self._model, refs, self._quiet)
+        return True
+
+
 class LinksValidator(Validator):
     """Validator to confirm all uuids in links and prose match resources in backmatter."""
 
+    def get_visitor(self,
+                    model: TopLevelOscalModel,
+                    quiet: bool,
+                    trestle_root: Optional[pathlib.Path] = None) -> Optional[ModelVisitor]:
+        """Get the visitor that finds all uuid references in the model."""
+        return _LinksVisitor(model, quiet)
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
@@ -41,8 +64,11 @@ class LinksValidator(Validator):
         returns:
             Always returns True, but gives warning if links and resources are not one-to-one.
         """
-        refs = ModelUtils.find_uuid_refs(model)
+        return self._model_is_valid_by_visitor(model, quiet, trestle_root)
 
+    @staticmethod
+    def check_refs_match_resources(model: TopLevelOscalModel, refs: Set[str], quiet: bool) -> None:
+        """Warn of any uuid references not in the backmatter resources, and any resources not referenced."""
         # find uuids in backmatter
         links: List[str] = []
         if model.back_matter and model.back_matter.resources:
@@ -71,6 +97,3 @@ class LinksValidator(Validator):
             if not quiet:
                 logger.warning(f'Resources have {len(links)} uuids and {len(in_links)} are not referenced by model.')
             logger.debug(f'Resources have {len(in_links)} uuids not referenced by model: {in_links}')
-
-        # This validator is intended just to give warnings, so it always returns True
-        return True
@@ -31,9 +31,14 @@ logger = logging.getLogger(__name__)
 class MarkdownAPI:
     """A common API that wraps around the existing markdown functionality."""
 
-    def __init__(self) -> None:
-        """Initialize markdown API."""
-        self.processor = MarkdownProcessor()
+    def __init__(self, strict_gfm: bool = False) -> None:
+        """
+        Initialize markdown API.
+
+        Args:
+            strict_gfm: check that the body of each markdown file read is valid Github Flavored Markdown
+        """
+        self.processor = MarkdownProcessor(strict_gfm)
         self.validator = None
 
     def load_validator_with_template(
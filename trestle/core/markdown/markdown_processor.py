@@ -14,10 +14,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """A markdown processor."""
+import copy
+import hashlib
 import logging
 import pathlib
+import threading
 import traceback
-from typing import Dict, Optional, Tuple
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import cmarkgfm
 
@@ -34,12 +38,67 @@ from yaml.scanner import ScannerError
 logger = logging.getLogger(__name__)
 
 
+class _ControlTreeCache:
+    """Bounded in-memory cache of parsed control markdown keyed by file contents and the parse maps."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the cache."""
+        self._max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, str], Tuple[Any, Any, Dict, ControlMarkdownNode]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(md_path: pathlib.Path, text: str) -> Tuple[str, str]:
+        """Get the cache key for the markdown text read from the path."""
+        return str(md_path.resolve()), hashlib.sha256(text.encode(const.FILE_ENCODING)).hexdigest()
+
+    def get(
+        self, key: Tuple[str, str], cli_section_dict: Optional[Dict[str, str]], part_label_to_id_map: Optional[Dict]
+    ) -> Optional[Tuple[Dict, ControlMarkdownNode]]:
+        """Return a private copy of the cached header and tree if the contents and maps are unchanged."""
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        cached_sections, cached_labels, header, tree = entry
+        if cached_sections != cli_section_dict or cached_labels != part_label_to_id_map:
+            return None
+        # callers take ownership of the parts in the tree and may edit the header
+        return copy.deepcopy((header, tree))
+
+    def put(
+        self,
+        key: Tuple[str, str],
+        cli_section_dict: Optional[Dict[str, str]],
+        part_label_to_id_map: Optional[Dict],
+        header: Dict,
+        tree: ControlMarkdownNode
+    ) -> None:
+        """Store a private copy of the parsed header and tree."""
+        entry = copy.deepcopy((cli_section_dict, part_label_to_id_map, header, tree))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+_control_tree_cache = _ControlTreeCache(const.MARKDOWN_TREE_CACHE_MAX_ENTRIES)
+
+
 class MarkdownProcessor:
     """A markdown processor."""
 
-    def __init__(self) -> None:
-        """Initialize markdown processor."""
+    def __init__(self, strict_gfm: bool = False) -> None:
+        """
+        Initialize markdown processor.
+
+        Args:
+            strict_gfm: render the body to html to check it is valid Github Flavored Markdown before parsing it
+        """
         self.governed_header = None
+        self.strict_gfm = strict_gfm
 
     def render_gfm_to_html(self, markdown_text: str) -> str:
         """Render given Github Flavored Markdown to HTML."""
@@ -56,7 +115,8 @@ class MarkdownProcessor:
         """Parse the markdown and builds the tree to operate over it."""
         header, markdown_wo_header = self.read_markdown_wo_processing(md_path, read_header, read_body)
 
-        _ = self.render_gfm_to_html(markdown_wo_header)
+        if self.strict_gfm:
+            _ = self.render_gfm_to_html(markdown_wo_header)
 
         lines = markdown_wo_header.split('\n')
         tree = DocsMarkdownNode.build_tree_from_markdown(lines, self.governed_header)
@@ -68,9 +128,22 @@ class MarkdownProcessor:
         cli_section_dict: Dict[str, str] = None,
         part_label_to_id_map: Dict[str, str] = None
     ) -> Tuple[Dict, ControlMarkdownNode]:
-        """Parse control markdown and build tree with identified OSCAL components."""
+        """
+        Parse control markdown and build tree with identified OSCAL components.
+
+        The parsed header and tree are cached in memory by file path and content digest, so re-reading an unchanged
+        control with the same section and label maps returns a fresh copy without parsing it again.
+        """
         try:
-            header, markdown_wo_header = self.read_markdown_wo_processing(md_path, read_header=True, read_body=True)
+            text = self._read_text(md_path)
+            cache_key = _control_tree_cache.key(md_path, text)
+            # a cached tree may have been parsed without the strict check, so strict parsing always checks the text
+            cached = None if self.strict_gfm else _control_tree_cache.get(
+                cache_key, cli_section_dict, part_label_to_id_map
+            )
+            if cached is not None:
+                return cached
+            header, markdown_wo_header = self._split_header(text, read_header=True, read_body=True)
 
             section_to_part_name_map = {}
             if cli_section_dict is not None:
@@ -78,7 +151,8 @@ class MarkdownProcessor:
                 yaml_header_sections_dict = header.get(const.SECTIONS_TAG, {})
                 merged_dict = merge_dicts(yaml_header_sections_dict, cli_section_dict)
                 section_to_part_name_map = {v: k for k, v in merged_dict.items()}
-            _ = self.render_gfm_to_html(markdown_wo_header)
+            if self.strict_gfm:
+                _ = self.render_gfm_to_html(markdown_wo_header)
 
             lines = markdown_wo_header.split('\n')
             tree_context.reset()
@@ -86,36 +160,45 @@ class MarkdownProcessor:
             tree_context.part_label_to_id_map = part_label_to_id_map
             tree = ControlMarkdownNode.build_tree_from_markdown(lines)
             tree_context.reset()
-            return header, tree
         except TrestleError as e:
             logger.error(f'Error while reading control markdown: {md_path}: {e}')
             raise e
+        _control_tree_cache.put(cache_key, cli_section_dict, part_label_to_id_map, header, tree)
+        return header, tree
 
     def read_markdown_wo_processing(self,
                                     md_path: pathlib.Path,
                                     read_header: bool = True,
                                     read_body: bool = True) -> Tuple[Dict, str]:
         """Read markdown header to dictionary and body to string."""
+        return self._split_header(self._read_text(md_path), read_header, read_body)
+
+    @staticmethod
+    def _read_text(md_path: pathlib.Path) -> str:
         try:
-            contents = frontmatter.loads(md_path.open('r', encoding=const.FILE_ENCODING).read())
-            header = {}
-            markdown_wo_header = ''
-            if read_header:
-                header = contents.metadata
-            if read_body:
-                markdown_wo_header = contents.content
-
-            return header, markdown_wo_header
+            return md_path.open('r', encoding=const.FILE_ENCODING).read()
         except UnicodeDecodeError as e:
             logger.debug(traceback.format_exc())
             raise TrestleError(f'Markdown cannot be decoded into {const.FILE_ENCODING}, error: {e}')
-        except ScannerError as e:
-            logger.debug(traceback.format_exc())
-            raise TrestleError(f'Header is not in a valid YAML format: {e}')
         except FileNotFoundError as e:
             logger.debug(traceback.format_exc())
             raise TrestleError(f'Markdown with path {md_path}, not found: {e}')
 
+    @staticmethod
+    def _split_header(text: str, read_header: bool, read_body: bool) -> Tuple[Dict, str]:
+        try:
+            contents = frontmatter.loads(text)
+        except ScannerError as e:
+            logger.debug(traceback.format_exc())
+            raise TrestleError(f'Header is not in a valid YAML format: {e}')
+        header = {}
+        markdown_wo_header = ''
+        if read_header:
+            header = contents.metadata
+        if read_body:
+            markdown_wo_header = contents.content
+        return header, markdown_wo_header
+
     def fetch_value_from_header(self, md_path: pathlib.Path, key: str) -> Optional[str]:
         """Fetch value for the given key from the markdown header if exists."""
         header, _ = self.read_markdown_wo_processing(md_path)
@@ -0,0 +1,130 @@
+# Copyright (c) 2024 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Opt-in cache of models validated when read from large oscal files, stored in the trestle cache."""
+
+import hashlib
+import logging
+import os
+import pathlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+import orjson
+
+import trestle
+import trestle.common.const as const
+from trestle.oscal import OSCAL_VERSION
+
+logger = logging.getLogger(__name__)
+
+# root of the workspace whose large files are cached, set only within a ParsedModelCache.enable scope
+_cache_root: ContextVar[Optional[pathlib.Path]] = ContextVar('parsed_cache_root', default=None)
+
+
+class ParsedModelCache():
+    """
+    Store and retrieve models validated when read from oscal files, in the trestle cache of the current workspace.
+
+    The cache is only active within an enable scope, and only for files of at least PARSED_CACHE_MIN_BYTES in the
+    workspace of that scope, so reading files of any other tree never writes to it.  Each entry is the oscal json of
+    a model that was fully validated, keyed by a hash of the file content, the model type and the versions of trestle
+    and oscal.  Entries are plain json data, so a loaded entry is constructed without validating it again, which is
+    much faster than parsing the original file.  Any unreadable entry is ignored and the file parsed as usual.
+    """
+
+    def __init__(self, path: pathlib.Path, type_name: str) -> None:
+        """
+        Initialize the cache for reading one file.
+
+        Args:
+            path: path of the oscal file being read
+            type_name: name of the type of model the file is read as, or empty if not known before parsing
+        """
+        self._entry_path: Optional[pathlib.Path] = None
+        trestle_root = _cache_root.get()
+        if trestle_root is None:
+            return
+        try:
+            path.resolve().relative_to(trestle_root)
+        except ValueError:
+            return
+        try:
+            if path.stat().st_size < const.PARSED_CACHE_MIN_BYTES:
+                return
+            hasher = hashlib.sha256()
+            for item in [trestle.__version__, OSCAL_VERSION, type_name]:
+                hasher.update(item.encode(const.FILE_ENCODING))
+                hasher.update(b'\0')
+            hasher.update(path.read_bytes())
+        except OSError as e:
+            logger.debug(f'Not using the parsed model cache for {path}: {e}')
+            return
+        self._cache_dir = trestle_root / const.TRESTLE_CACHE_DIR / const.PARSED_CACHE_DIR
+        self._entry_path = self._cache_dir / f'{hasher.hexdigest()}.json'
+
+    @staticmethod
+    @contextmanager
+    def enable(trestle_root: Optional[pathlib.Path]) -> Iterator[None]:
+        """
+        Cache the models read from large files of a trestle workspace.
+
+        Args:
+            trestle_root: The root of the workspace whose files are cached, or None to cache nothing.
+        """
+        token = _cache_root.set(trestle_root.resolve() if trestle_root else None)
+        try:
+            yield
+        finally:
+            _cache_root.reset(token)
+
+    def has_entry(self) -> bool:
+        """Determine if the model of the file is in the cache, so reading the file will not validate it."""
+        return self._entry_path is not None and self._entry_path.exists()
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Load the oscal json of the model, wrapped in its root key, if present in the cache."""
+        if self._entry_path is None or not self._entry_path.exists():
+            return None
+        try:
+            obj = orjson.loads(self._entry_path.read_bytes())
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable parsed model cache entry {self._entry_path}: {e}')
+            return None
+        if not isinstance(obj, dict) or len(obj) != 1:
+            logger.debug(f'Ignoring parsed model cache entry {self._entry_path} without a single root key')
+            return None
+        # mark the entry as recently used so it survives pruning
+        self._entry_path.touch()
+        return obj
+
+    def store(self, model: Any) -> None:
+        """Store the fully validated model read from the file in the cache."""
+        if self._entry_path is None:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so concurrent readers never see a partial entry
+            tmp_path = self._entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_bytes(model.oscal_serialize_json_bytes())
+            tmp_path.replace(self._entry_path)
+            self._prune()
+        except Exception as e:
+            logger.debug(f'Unable to store parsed model cache entry {self._entry_path}: {e}')
+
+    def _prune(self) -> None:
+        """Remove the oldest entries beyond the maximum allowed."""
+        entries = sorted(self._cache_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old_entry in entries[const.PARSED_CACHE_MAX_ENTRIES:]:
+            old_entry.unlink(missing_ok=True)
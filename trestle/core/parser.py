@@ -31,7 +31,7 @@ from trestle.core.base_model import OscalBaseModel
 logger = logging.getLogger(__name__)
 
 
-def parse_dict(data: Dict[str, Any], model_name: str) -> OscalBaseModel:
+def parse_dict(data: Dict[str, Any], model_name: str, trusted: bool = False) -> OscalBaseModel:
     """Load a model from the data dict.
 
     This functionality is provided for situations when the OSCAL data type is not known ahead of time. Here the model
@@ -40,6 +40,7 @@ def parse_dict(data: Dict[str, Any], model_name: str) -> OscalBaseModel:
     Args:
         data: Oscal data loaded into memory as a dictionary with the `root key` removed.
         model_name: should be of the form 'module.class' from trestle.oscal.* modules
+        trusted: construct the model without validation since the data is known to be valid trestle output
 
     Returns:
         The oscal model of the desired model.
@@ -60,6 +61,8 @@ def parse_dict(data: Dict[str, Any], model_name: str) -> OscalBaseModel:
     if mclass is None:
         raise TrestleError(f'class "{class_name}" could not be found in "{module_name}"')
 
+    if trusted:
+        return mclass.trusted_construct(data)
     instance = mclass.parse_obj(data)
     return instance
 
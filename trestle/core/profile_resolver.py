@@ -22,9 +22,12 @@ import trestle.oscal.common as com
 import trestle.oscal.profile as prof
 from trestle.common.const import TRESTLE_INHERITED_PROPS_TRACKER
 from trestle.common.list_utils import as_list, pop_item_from_list
+from trestle.core.base_model import OscalBaseModel
 from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.control_interface import ParameterRep
+from trestle.core.remote.cache import FetcherFactory
 from trestle.core.resolver._import import Import
+from trestle.core.resolver.catalog_cache import ResolvedCatalogCache
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +77,9 @@ class ProfileResolver():
         param_rep: ParameterRep = ParameterRep.LEAVE_MOUSTACHE,
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None
+        value_not_assigned_prefix: Optional[str] = None,
+        use_cache: bool = True,
+        jobs: int = 1
     ) -> Tuple[cat.Catalog, Optional[Dict[str, Any]]]:
         """
         Create the resolved profile catalog given a profile path along with inherited props.
@@ -89,11 +94,63 @@ class ProfileResolver():
             show_value_warnings: warn if prose references a value that has not been set
             value_assigned_prefix: Prefix placed in front of param string if a value was assigned
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
+            use_cache: load the resolved catalog from the trestle cache if its inputs are unchanged
+            jobs: maximum number of sibling imports of a profile to resolve concurrently
 
         Returns:
             The resolved profile catalog and a control dict of inherited props
         """
         logger.debug(f'get resolved profile catalog and inherited props for {profile_path} via generated Import.')
+        # share connections to remote hosts across all fetches of the import graph
+        with FetcherFactory.connection_pool():
+            if jobs > 1:
+                Import.prefetch(trestle_root, str(profile_path), jobs)
+            return ProfileResolver._resolve_profile_catalog_and_inherited_props(
+                trestle_root,
+                profile_path,
+                block_adds,
+                block_params,
+                params_format,
+                param_rep,
+                show_value_warnings,
+                value_assigned_prefix,
+                value_not_assigned_prefix,
+                use_cache,
+                jobs
+            )
+
+    @staticmethod
+    def _resolve_profile_catalog_and_inherited_props(
+        trestle_root: pathlib.Path,
+        profile_path: str,
+        block_adds: bool,
+        block_params: bool,
+        params_format: Optional[str],
+        param_rep: ParameterRep,
+        show_value_warnings: bool,
+        value_assigned_prefix: Optional[str],
+        value_not_assigned_prefix: Optional[str],
+        use_cache: bool,
+        jobs: int
+    ) -> Tuple[cat.Catalog, Optional[Dict[str, Any]]]:
+        catalog_cache: Optional[ResolvedCatalogCache] = None
+        if use_cache:
+            catalog_cache = ResolvedCatalogCache(
+                trestle_root,
+                profile_path,
+                [
+                    block_adds,
+                    block_params,
+                    params_format,
+                    param_rep.value,
+                    show_value_warnings,
+                    value_assigned_prefix,
+                    value_not_assigned_prefix
+                ]
+            )
+            cached = catalog_cache.load()
+            if cached:
+                return cached
         import_ = prof.Import(href=str(profile_path), include_all={})
         # The final Import has change_prose=True to force parameter substitution in the prose only at the last stage.
         import_filter = Import(
@@ -107,11 +164,19 @@ class ProfileResolver():
             None,
             show_value_warnings,
             value_assigned_prefix,
-            value_not_assigned_prefix
+            value_not_assigned_prefix,
+            jobs=jobs
         )
         logger.debug('launch pipeline')
-        resolved_profile_catalog = next(import_filter.process())
-        resolved_profile_catalog, inherited_props = ProfileResolver._extract_inherited_props(resolved_profile_catalog)
+        # the filters assign many models as they build the catalog, so it is validated once in full when complete
+        with OscalBaseModel.bulk_edit():
+            resolved_profile_catalog = next(import_filter.process())
+            with OscalBaseModel.bulk_edit(resolved_profile_catalog):
+                resolved_profile_catalog, inherited_props = ProfileResolver._extract_inherited_props(
+                    resolved_profile_catalog
+                )
+        if catalog_cache:
+            catalog_cache.store(resolved_profile_catalog, inherited_props)
         return resolved_profile_catalog, inherited_props
 
     @staticmethod
@@ -124,7 +189,9 @@ class ProfileResolver():
         param_rep: ParameterRep = ParameterRep.LEAVE_MOUSTACHE,
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
-        value_not_assigned_prefix: Optional[str] = None
+        value_not_assigned_prefix: Optional[str] = None,
+        use_cache: bool = True,
+        jobs: int = 1
     ) -> cat.Catalog:
         """
         Create the resolved profile catalog given a profile path.
@@ -139,6 +206,8 @@ class ProfileResolver():
             show_value_warnings: warn if prose references a value that has not been set
             value_assigned_prefix: Prefix placed in front of param string if a value was assigned
             value_not_assigned_prefix: Prefix placed in front of param string if a value was *not* assigned
+            use_cache: load the resolved catalog from the trestle cache if its inputs are unchanged
+            jobs: maximum number of sibling imports of a profile to resolve concurrently
 
         Returns:
             The resolved profile catalog
@@ -153,6 +222,8 @@ class ProfileResolver():
             param_rep,
             show_value_warnings,
             value_assigned_prefix,
-            value_not_assigned_prefix
+            value_not_assigned_prefix,
+            use_cache,
+            jobs
         )
         return resolved_profile_catalog
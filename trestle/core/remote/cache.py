@@ -19,17 +19,23 @@ Trestle cache operations library.
 Allows for using URI's to reference external directories and then expand.
 """
 
+import copy
 import datetime
 import getpass
+import hashlib
+import json
 import logging
 import os
 import pathlib
 import platform
 import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from io import StringIO
-from typing import Any, Dict, Optional, Tuple, Type, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type, Union
 from urllib import parse
 
 import paramiko
@@ -41,10 +47,54 @@ from trestle.common import const, file_utils
 from trestle.common.err import TrestleError
 from trestle.core import parser
 from trestle.core.base_model import OscalBaseModel
+from trestle.core.parsed_model_cache import ParsedModelCache
 
 logger = logging.getLogger(__name__)
 
 
+class _ParsedModelMemo:
+    """Bounded in-process memo of models parsed from fetched files, keyed by path and content digest."""
+
+    def __init__(self, max_entries: int) -> None:
+        """Initialize the memo."""
+        self._max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[Any, ...], Tuple[OscalBaseModel, str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(path: pathlib.Path, content: bytes, *args: Any) -> Tuple[Any, ...]:
+        """Get the key of the model parsed from the content of the file at path."""
+        return (str(path), hashlib.sha256(content).hexdigest()) + args
+
+    def get(self, key: Tuple[Any, ...]) -> Optional[Tuple[OscalBaseModel, str]]:
+        """Get a private copy of the memoized model and its root key."""
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+        model, root_key = entry
+        # callers such as the resolver filters modify the model they are given
+        return copy.deepcopy(model), root_key
+
+    def put(self, key: Tuple[Any, ...], model: OscalBaseModel, root_key: str) -> None:
+        """Memoize a private copy of the model."""
+        entry = copy.deepcopy(model), root_key
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all memoized models."""
+        with self._lock:
+            self._entries.clear()
+
+
+_parsed_model_memo = _ParsedModelMemo(const.PARSED_MODEL_MEMO_MAX_ENTRIES)
+
+
 class FetcherBase(ABC):
     """FetcherBase - base class for caching and fetching remote oscal objects."""
 
@@ -105,6 +155,13 @@ class FetcherBase(ABC):
                 ) from e  # noqa E501
         return False
 
+    def get_cached_path(self, force_update: bool = False) -> pathlib.Path:
+        """Update the cache if needed and return the path of the cached object."""
+        self._update_cache(force_update)
+        if not self._cached_object_path.exists():
+            raise TrestleError(f'Cache get failure for {self._uri}: {self._cached_object_path} does not exist.')
+        return self._cached_object_path
+
     def get_raw(self, force_update: bool = False) -> Dict[str, Any]:
         """Retrieve the raw dictionary representing the underlying object."""
         self._update_cache(force_update)
@@ -131,20 +188,60 @@ class FetcherBase(ABC):
         if not cache_file.exists():
             raise TrestleError(f'get_oscal failure for {self._uri}')
 
+        key = _ParsedModelMemo.key(cache_file, self._read_cached_bytes(), model_type)
+        memoized = _parsed_model_memo.get(key)
+        if memoized:
+            return memoized[0]
+        # models read from the parsed cache or a trusted workspace are not validated
+        type_name = f'{model_type.__module__}.{model_type.__qualname__}'
+        trusted = OscalBaseModel.is_trusted_path(cache_file) or ParsedModelCache(cache_file, type_name).has_entry()
         try:
-            return model_type.oscal_read(cache_file)
+            model = model_type.oscal_read(cache_file)
         except Exception as e:
             logger.debug(f'get_oscal failed, error loading cache file for {self._uri} as {model_type}')
             raise TrestleError(f'get_oscal failure for {self._uri}: {e}.') from e
+        # only validated models are memoized, since they are also returned outside of the trusted scope
+        if model is not None and not trusted:
+            _parsed_model_memo.put(key, model, model_type.__name__)
+        return model
 
     def get_oscal(self, force_update: bool = False) -> Tuple[OscalBaseModel, str]:
-        """Retrieve the cached file and model name without knowing its model type."""
-        model_dict = self.get_raw(force_update)
+        """
+        Retrieve the cached file and model name without knowing its model type.
+
+        The validated model is memoized in the process, so fetching unchanged content again returns a copy of it
+        rather than parsing the file again.
+        """
+        self._update_cache(force_update)
+        key = _ParsedModelMemo.key(self._cached_object_path, self._read_cached_bytes())
+        memoized = _parsed_model_memo.get(key)
+        if memoized:
+            return memoized
+        # the entries of the parsed cache are wrapped in the root key, which gives the model type
+        parsed_cache = ParsedModelCache(self._cached_object_path, '')
+        cached = parsed_cache.load()
+        if cached is not None:
+            model_dict = cached
+            trusted = True
+        else:
+            model_dict = self.get_raw()
+            trusted = OscalBaseModel.is_trusted_path(self._cached_object_path)
         root_key = parser.root_key(model_dict)
         model_name = parser.to_full_model_name(root_key)
         if model_name is None:
             raise TrestleError(f'Failed cache read of non top level model with root_key {root_key}')
-        return parser.parse_dict(model_dict[root_key], model_name), root_key
+        model = parser.parse_dict(model_dict[root_key], model_name, trusted)
+        # only fully validated models are cached or memoized, since entries are used without validation
+        if not trusted:
+            parsed_cache.store(model)
+            _parsed_model_memo.put(key, model, root_key)
+        return model, root_key
+
+    def _read_cached_bytes(self) -> bytes:
+        try:
+            return self._cached_object_path.read_bytes()
+        except Exception as e:
+            raise TrestleError(f'Cache get failure for {self._uri}: {e}.') from e
 
 
 class LocalFetcher(FetcherBase):
@@ -285,20 +382,65 @@ class HTTPSFetcher(FetcherBase):
         if self._username is not None and self._password is not None:
             auth = HTTPBasicAuth(self._username, self._password)
 
+        headers = {'Accept-Encoding': 'gzip'}
+        if self._cached_object_path.exists():
+            # ask the server to send the body only if it changed since it was cached
+            meta = self._read_meta()
+            if meta.get('etag', None):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified', None):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        # reuse the connection to the host if a connection pool is open
+        pool = FetcherFactory.get_connection_pool()
+        get = pool.get_session(self._url).get if pool else requests.get
         try:
-            response = requests.get(self._url, auth=auth, verify=verify, timeout=30)
+            response = get(self._url, auth=auth, verify=verify, timeout=30, headers=headers, stream=True)
         except Exception as e:
             raise TrestleError(f'Cache update failure to connect via HTTPS: {self._url} ({e})')
 
-        if response.status_code == 200:
-            try:
-                result = response.text
-            except Exception as err:
-                raise TrestleError(f'Cache update failure reading response via HTTPS: {self._url} ({err})')
+        with response:
+            if response.status_code == 304:
+                logger.debug(f'Cached copy of {self._url} is not modified.')
+                # touch the cached object so it is not stale again until it expires
+                self._cached_object_path.touch()
+            elif response.status_code == 200:
+                # replace atomically since concurrent imports of the same uri may fetch it at the same time
+                cached_path = self._cached_object_path
+                tmp_path = cached_path.with_name(f'{cached_path.name}.{threading.get_ident()}')
+                try:
+                    with tmp_path.open('wb') as f:
+                        # iter_content decodes any gzip transfer encoding
+                        for chunk in response.iter_content(chunk_size=const.HTTP_DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                except Exception as err:
+                    tmp_path.unlink(missing_ok=True)
+                    raise TrestleError(f'Cache update failure reading response via HTTPS: {self._url} ({err})')
+                tmp_path.replace(cached_path)
+                self._write_meta(response.headers.get('ETag', None), response.headers.get('Last-Modified', None))
             else:
-                self._cached_object_path.write_text(result, encoding=const.FILE_ENCODING)
-        else:
-            raise TrestleError(f'GET returned code {response.status_code}: {self._uri}')
+                raise TrestleError(f'GET returned code {response.status_code}: {self._uri}')
+
+    @property
+    def _meta_path(self) -> pathlib.Path:
+        return self._cached_object_path.with_name(self._cached_object_path.name + const.HTTP_CACHE_META_SUFFIX)
+
+    def _read_meta(self) -> Dict[str, str]:
+        """Read the validators of the cached object, if any."""
+        try:
+            return json.loads(self._meta_path.read_text(encoding=const.FILE_ENCODING))
+        except Exception:
+            return {}
+
+    def _write_meta(self, etag: Optional[str], last_modified: Optional[str]) -> None:
+        """Store the validators sent with the cached object so the next fetch can be conditional."""
+        if not etag and not last_modified:
+            self._meta_path.unlink(missing_ok=True)
+            return
+        meta = {'etag': etag, 'last_modified': last_modified}
+        tmp_path = self._meta_path.with_name(f'{self._meta_path.name}.{threading.get_ident()}')
+        tmp_path.write_text(json.dumps(meta), encoding=const.FILE_ENCODING)
+        tmp_path.replace(self._meta_path)
 
 
 class SFTPFetcher(FetcherBase):
@@ -343,6 +485,19 @@ class SFTPFetcher(FetcherBase):
         supplied via environment variable SSH_KEY. In the latter case, it must not require a passphrase prompt.
         """
         u = parse.urlparse(self._uri)
+        username = getpass.getuser() if not u.username else u.username
+        pool = FetcherFactory.get_connection_pool()
+        if pool is None:
+            _, sftp_client = self._connect(u, username)
+            self._get_file(sftp_client, u)
+            return
+        # reuse the connection to the host if a connection pool is open
+        sftp_client, lock = pool.get_sftp_client((u.hostname, u.port, username), lambda: self._connect(u, username))
+        with lock:
+            self._get_file(sftp_client, u)
+
+    def _connect(self, u: parse.ParseResult, username: str) -> Tuple[paramiko.SSHClient, paramiko.SFTPClient]:
+        """Connect to the host of the uri and open sftp."""
         client = paramiko.SSHClient()
         # Must pick up host keys from the default known_hosts on this environment:
         try:
@@ -357,7 +512,6 @@ class SFTPFetcher(FetcherBase):
             pkey = None
             look_for_keys = True
 
-        username = getpass.getuser() if not u.username else u.username
         try:
             client.connect(
                 u.hostname,
@@ -374,7 +528,10 @@ class SFTPFetcher(FetcherBase):
             sftp_client = client.open_sftp()
         except Exception as e:
             raise TrestleError(f'Cache update failure to open sftp for {u.hostname}: {e}.')
+        return client, sftp_client
 
+    def _get_file(self, sftp_client: paramiko.SFTPClient, u: parse.ParseResult) -> None:
+        """Get the remote file of the uri into the cache."""
         localpath = self._cached_object_path
         try:
             sftp_client.get(remotepath=u.path[1:], localpath=(localpath.__str__()))
@@ -382,6 +539,60 @@ class SFTPFetcher(FetcherBase):
             raise TrestleError(f'Error getting remote resource {self._uri} into cache {localpath}: {e}')
 
 
+class ConnectionPool:
+    """Connections to remote hosts shared by all fetchers while the pool is open."""
+
+    def __init__(self) -> None:
+        """Initialize the empty pool."""
+        # requests sessions are not thread safe, so each thread has its own session per host
+        self._thread_sessions = threading.local()
+        self._sessions: List[requests.Session] = []
+        self._sftp_clients: Dict[Tuple[Any, ...], Tuple[paramiko.SSHClient, paramiko.SFTPClient, threading.Lock]] = {}
+        self._lock = threading.Lock()
+
+    def get_session(self, url: str) -> requests.Session:
+        """Get the https session of this thread for the host of the url, which keeps its connections alive."""
+        host = parse.urlparse(url).netloc
+        sessions: Optional[Dict[str, requests.Session]] = getattr(self._thread_sessions, 'sessions', None)
+        if sessions is None:
+            sessions = {}
+            self._thread_sessions.sessions = sessions
+        if host not in sessions:
+            sessions[host] = requests.Session()
+            with self._lock:
+                self._sessions.append(sessions[host])
+        return sessions[host]
+
+    def get_sftp_client(
+        self, key: Tuple[Any, ...], connect: Callable[[], Tuple[paramiko.SSHClient, paramiko.SFTPClient]]
+    ) -> Tuple[paramiko.SFTPClient, threading.Lock]:
+        """
+        Get the sftp client for the key, connecting with connect if needed, and the lock serializing its use.
+
+        The pool lock is held while connecting so that concurrent fetches from one host share a single connection.
+        """
+        with self._lock:
+            if key not in self._sftp_clients:
+                client, sftp_client = connect()
+                self._sftp_clients[key] = client, sftp_client, threading.Lock()
+            _, sftp_client, lock = self._sftp_clients[key]
+            return sftp_client, lock
+
+    def close(self) -> None:
+        """Close all connections in the pool."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            for client, _, _ in self._sftp_clients.values():
+                try:
+                    client.close()
+                except Exception as e:
+                    logger.debug(f'Error closing pooled ssh connection: {e}')
+            self._sessions.clear()
+            self._sftp_clients.clear()
+            self._thread_sessions = threading.local()
+
+
 # For passing variables:
 # Do https://gist.github.com/gbaman/b3137e18c739e0cf98539bf4ec4366ad#gistcomment-2747872
 # or https://gist.github.com/gbaman/b3137e18c739e0cf98539bf4ec4366ad#gistcomment-2752081
@@ -389,6 +600,10 @@ class SFTPFetcher(FetcherBase):
 class FetcherFactory:
     """Factory method for creating a fetcher."""
 
+    _connection_pool: Optional[ConnectionPool] = None
+    _connection_pool_depth = 0
+    _connection_pool_lock = threading.Lock()
+
     class UriType(Enum):
         """Specify types of URI."""
 
@@ -459,3 +674,30 @@ class FetcherFactory:
         }
         uri_type = cls.get_uri_type(uri)
         return fetcher_dict[uri_type](trestle_root, uri)  # type: ignore
+
+    @classmethod
+    def get_connection_pool(cls) -> Optional[ConnectionPool]:
+        """Get the open connection pool, if any."""
+        return cls._connection_pool
+
+    @classmethod
+    @contextmanager
+    def connection_pool(cls) -> Iterator[ConnectionPool]:
+        """
+        Share connections to each remote host among all fetchers, in any thread, until the outermost scope exits.
+
+        Scopes may be nested, and the connections are closed when the outermost one exits.
+        """
+        with cls._connection_pool_lock:
+            if cls._connection_pool is None:
+                cls._connection_pool = ConnectionPool()
+            cls._connection_pool_depth += 1
+            pool = cls._connection_pool
+        try:
+            yield pool
+        finally:
+            with cls._connection_pool_lock:
+                cls._connection_pool_depth -= 1
+                if cls._connection_pool_depth == 0:
+                    cls._connection_pool = None
+                    pool.close()
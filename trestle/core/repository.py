@@ -355,7 +355,15 @@ class Repository:
             raise TrestleError(f'Given model {model_alias} is not a top level model.')
 
         verbose = log.get_current_verbosity_level(logger)
-        args = argparse.Namespace(type=model_alias, name=name, trestle_root=self.root_dir, verbose=verbose, quiet=False)
+        args = argparse.Namespace(
+            type=model_alias,
+            name=name,
+            trestle_root=self.root_dir,
+            verbose=verbose,
+            quiet=False,
+            jobs=1,
+            changed_only=False
+        )
 
         try:
             ret = validatecmd.ValidateCmd()._run(args)
@@ -403,7 +411,8 @@ class AgileAuthoring(Repository):
             set_parameters=set_parameters,
             regenerate=regenerate,
             version=version,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -444,7 +453,8 @@ class AgileAuthoring(Repository):
             sections=sections,
             required_sections=required_sections,
             allowed_sections=allowed_sections,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -472,7 +482,8 @@ class AgileAuthoring(Repository):
             trestle_root=self.root_dir,
             regenerate=regenerate,
             version=version,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -507,7 +518,8 @@ class AgileAuthoring(Repository):
             trestle_root=self.root_dir,
             regenerate=regenerate,
             version=version,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -540,7 +552,8 @@ class AgileAuthoring(Repository):
             force_overwrite=force_overwrite,
             yaml_header=yaml_header,
             overwrite_header_values=overwrite_header_values,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -577,7 +590,8 @@ class AgileAuthoring(Repository):
             overwrite_header_values=overwrite_header_values,
             sections=sections,
             required_sections=required_sections,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -602,7 +616,12 @@ class AgileAuthoring(Repository):
 
         verbose = log.get_current_verbosity_level(logger)
         args = argparse.Namespace(
-            name=name, output=output, trestle_root=self.root_dir, force_overwrite=force_overwrite, verbose=verbose
+            name=name,
+            output=output,
+            trestle_root=self.root_dir,
+            force_overwrite=force_overwrite,
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -641,7 +660,8 @@ class AgileAuthoring(Repository):
             include_all_parts=include_all_parts,
             yaml_header=yaml_header,
             overwrite_header_values=overwrite_header_values,
-            verbose=verbose
+            verbose=verbose,
+            jobs=1
         )
 
         try:
@@ -16,13 +16,17 @@
 import logging
 import os
 import pathlib
-from typing import Iterator, List, Optional, Union
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Set, Tuple, Union
 
 import trestle.common.const as const
 import trestle.oscal.catalog as cat
 import trestle.oscal.profile as prof
+from trestle.common import file_utils
 from trestle.common.err import TrestleError
 from trestle.core.control_interface import ParameterRep
+from trestle.core.models.file_content_type import FileContentType
 from trestle.core.pipeline import Pipeline
 from trestle.core.remote import cache
 from trestle.core.resolver.merge import Merge
@@ -32,6 +36,10 @@ from trestle.oscal.common import Resource
 
 logger = logging.getLogger(__name__)
 
+# the first key of a json object, and the first top level key of a yaml document after any comments and directives
+_JSON_ROOT_KEY = re.compile(r'\s*\{\s*"([^"\\]+)"\s*:')
+_YAML_ROOT_KEY = re.compile(r'^[\'"]?([A-Za-z][\w-]*)[\'"]?\s*:', re.MULTILINE)
+
 
 class Import(Pipeline.Filter):
     """Import filter class."""
@@ -50,7 +58,8 @@ class Import(Pipeline.Filter):
         show_value_warnings: bool = False,
         value_assigned_prefix: Optional[str] = None,
         value_not_assigned_prefix: Optional[str] = None,
-        parent_url_root: Optional[str] = None
+        parent_url_root: Optional[str] = None,
+        jobs: int = 1
     ) -> None:
         """Initialize and store trestle root for cache access."""
         self._trestle_root = trestle_root
@@ -66,37 +75,117 @@ class Import(Pipeline.Filter):
         self.value_assigned_prefix = value_assigned_prefix
         self.value_not_assigned_prefix = value_not_assigned_prefix
         self._parent_url_root = parent_url_root
+        self._jobs = jobs
+
+        self._import.href, self._parent_url_root = Import.resolve_href(
+            self._import.href, self._resources, self._parent_url_root
+        )
+
+    @staticmethod
+    def resolve_href(href: Optional[str], resources: Optional[List[Resource]],
+                     parent_url_root: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        Convert an import href into the uri to fetch along with the parent url root for its child imports.
 
-        if not self._import.href or not self._import.href.strip():
+        Args:
+            href: the href of the import as given in the profile
+            resources: the back matter resources of the importing profile
+            parent_url_root: the parent path of the importing profile if it was remote
+
+        Returns:
+            The uri to fetch and the parent url root to be used by imports within the fetched model
+        """
+        if not href or not href.strip():
             raise TrestleError('Attempt to import via an empty href.')
 
-        if self._import.href[0] == '#':
+        if href[0] == '#':
             # Specification section on internal reference resolution:
             # https://pages.nist.gov/OSCAL/concepts/processing/profile-resolution/#d2e300-head
             # if href is a local reference, replace it with the actual uri in the resources
             try:
-                resource = [r for r in self._resources if r.uuid == self._import.href[1:]][0]
-                self._import.href = [
+                resource = [r for r in resources if r.uuid == href[1:]][0]
+                href = [
                     rlink.href
                     for rlink in resource.rlinks
                     if rlink.href.endswith('.json') or rlink.href.endswith('.yaml') or rlink.href.endswith('.yml')
                 ][0]
 
             except Exception as e:
-                logger.debug(f'Profile resolution failed for resource with uuid: {self._import.href}')
+                logger.debug(f'Profile resolution failed for resource with uuid: {href}')
                 raise TrestleError(
                     f'Back matter resource resolution needed for profile import failed with error: {str(e)}'
                 )
 
-        uri_type = cache.FetcherFactory.get_uri_type(self._import.href)
+        uri_type = cache.FetcherFactory.get_uri_type(href)
         # if this looks like a relative path to remote source, append parent path
-        if uri_type == cache.FetcherFactory.UriType.LOCAL_FILE and self._parent_url_root:
-            self._import.href = self._parent_url_root + '/' + self._import.href
+        if uri_type == cache.FetcherFactory.UriType.LOCAL_FILE and parent_url_root:
+            href = parent_url_root + '/' + href
         # if href is now a remote path, capture its parent path for possible use with child imports that are relative
         if cache.FetcherFactory.uri_type_is_not_local(uri_type):
-            self._parent_url_root = os.path.dirname(self._import.href)
-            logger.debug('parent url root path %s', self._parent_url_root)
-        logger.debug('import href is %s', self._import.href)
+            parent_url_root = os.path.dirname(href)
+            logger.debug('parent url root path %s', parent_url_root)
+        logger.debug('import href is %s', href)
+        return href, parent_url_root
+
+    @staticmethod
+    def _peek_root_key(path: pathlib.Path) -> Optional[str]:
+        """Get the root key of an oscal json or yaml file from its first lines, or None if it is not found there."""
+        with path.open('r', encoding=const.FILE_ENCODING) as f:
+            head = f.read(const.ROOT_KEY_PEEK_CHARS).lstrip('\ufeff')
+        if FileContentType.to_content_type(path.suffix) == FileContentType.JSON:
+            match = _JSON_ROOT_KEY.match(head)
+        else:
+            match = _YAML_ROOT_KEY.search(head)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _prefetch_one(trestle_root: pathlib.Path, href: str,
+                      parent_url_root: Optional[str]) -> List[Tuple[str, Optional[str]]]:
+        """Fetch the href into the cache and return the resolved hrefs of its imports if it is a profile."""
+        try:
+            fetcher = cache.FetcherFactory.get_fetcher(trestle_root, href)
+            cached_path = fetcher.get_cached_path()
+            # only profiles have imports, so other models such as large catalogs are not parsed here
+            root_key = Import._peek_root_key(cached_path)
+            if root_key is not None and root_key != const.MODEL_TYPE_PROFILE:
+                return []
+            model_dict = file_utils.load_file(cached_path)
+            if const.MODEL_TYPE_PROFILE not in model_dict:
+                return []
+            profile_dict = model_dict[const.MODEL_TYPE_PROFILE]
+            resources = [
+                Resource.parse_obj(resource) for resource in profile_dict.get('back-matter', {}).get('resources', [])
+            ]
+            return [
+                Import.resolve_href(import_dict.get('href', None), resources, parent_url_root)
+                for import_dict in profile_dict.get('imports', [])
+            ]
+        except Exception as e:
+            logger.debug(f'Unable to prefetch imports of {href}: {e}')
+            return []
+
+    @staticmethod
+    def prefetch(trestle_root: pathlib.Path, href: str, jobs: int) -> None:
+        """
+        Fetch every model in the import graph of the href into the cache, fetching each level of the graph concurrently.
+
+        Any failure is left for the resolution itself to report in context.
+        """
+        try:
+            level = [Import.resolve_href(href, None, None)]
+        except TrestleError as e:
+            logger.debug(f'Unable to prefetch imports of {href}: {e}')
+            return
+        seen: Set[str] = {level[0][0]}
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            while level:
+                next_level: List[Tuple[str, Optional[str]]] = []
+                for sub_imports in executor.map(lambda item: Import._prefetch_one(trestle_root, *item), level):
+                    for sub_import in sub_imports:
+                        if sub_import[0] not in seen:
+                            seen.add(sub_import[0])
+                            next_level.append(sub_import)
+                level = next_level
 
     def process(self, _=None) -> Iterator[cat.Catalog]:  # type: ignore
         """Load href for catalog or profile and yield each import as catalog imported by its distinct pipeline."""
@@ -117,7 +206,8 @@ class Import(Pipeline.Filter):
             # profile uuid's must be unique or they may trigger circular reference warning
             if profile.uuid in self._uuid_chain:
                 raise TrestleError(f'Profile {profile.metadata.title} is referenced in circular manner.')
-            self._uuid_chain.append(profile.uuid)
+            # each import gets its own copy of the chain so sibling imports can be resolved independently
+            uuid_chain = self._uuid_chain + [profile.uuid]
             resources = profile.back_matter.resources if profile.back_matter and profile.back_matter.resources else None
 
             pipelines: List[Pipeline] = []
@@ -128,15 +218,16 @@ class Import(Pipeline.Filter):
                 import_filter = Import(
                     self._trestle_root,
                     sub_import,
-                    self._uuid_chain,
+                    uuid_chain,
                     resources=resources,
-                    parent_url_root=self._parent_url_root
+                    parent_url_root=self._parent_url_root,
+                    jobs=self._jobs
                 )
                 prune_filter = Prune(sub_import, profile)
                 pipeline = Pipeline([import_filter, prune_filter])
                 pipelines.append(pipeline)
                 logger.debug(f'sub_import add pipeline for sub href {sub_import.href} of main href {self._import.href}')
-            merge_filter = Merge(profile)
+            merge_filter = Merge(profile, self._jobs)
             modify_filter = Modify(
                 profile,
                 self._change_prose,
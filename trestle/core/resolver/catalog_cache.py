@@ -0,0 +1,159 @@
+# Copyright (c) 2024 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent cache of resolved profile catalogs keyed by a digest of all resolution inputs."""
+
+import hashlib
+import logging
+import os
+import pathlib
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import orjson
+
+import trestle
+import trestle.common.const as const
+import trestle.oscal.catalog as cat
+import trestle.oscal.profile as prof
+from trestle.common import file_utils
+from trestle.common.err import TrestleError
+from trestle.common.list_utils import as_list
+from trestle.core.remote import cache
+from trestle.core.resolver._import import Import
+from trestle.oscal.common import Resource
+
+logger = logging.getLogger(__name__)
+
+# first key of a json or yaml oscal file, which is the model type
+JSON_ROOT_KEY_REGEX = re.compile(r'\A\s*\{\s*"([^"]+)"\s*:')
+
+YAML_ROOT_KEY_REGEX = re.compile(r'^([A-Za-z][A-Za-z-]*)\s*:', re.MULTILINE)
+
+CATALOG_KEY = 'catalog'
+
+INHERITED_PROPS_KEY = 'inherited-props'
+
+
+class ResolvedCatalogCache():
+    """
+    Store and retrieve resolved profile catalogs in the trestle cache.
+
+    The key of each entry is a hash of the content of the profile, the content of every catalog and profile it
+    imports transitively, and the arguments passed to the resolver.  Any change upstream therefore results in a
+    different key and a fresh resolution.
+    """
+
+    def __init__(self, trestle_root: pathlib.Path, profile_path: str, resolver_args: List[Any]) -> None:
+        """
+        Initialize the cache for one resolution request.
+
+        Args:
+            trestle_root: root directory of the trestle workspace
+            profile_path: string path or uri of the profile being resolved
+            resolver_args: all other arguments to the resolver that may affect the resolved catalog
+        """
+        self._trestle_root = trestle_root
+        self._profile_path = str(profile_path)
+        self._resolver_args = resolver_args
+        self._cache_dir = trestle_root / const.TRESTLE_CACHE_DIR / const.RESOLVED_CACHE_DIR
+        self._key: Optional[str] = None
+
+    @staticmethod
+    def _get_root_key(path: pathlib.Path, content: bytes) -> Optional[str]:
+        """Find the model type of the file without parsing all of it."""
+        text = content.decode(const.FILE_ENCODING, errors='ignore')
+        regex = JSON_ROOT_KEY_REGEX if path.suffix == '.json' else YAML_ROOT_KEY_REGEX
+        match = regex.search(text)
+        return match.group(1) if match else None
+
+    def _hash_import(
+        self,
+        hasher: Any,
+        href: str,
+        resources: Optional[List[Resource]],
+        parent_url_root: Optional[str],
+        uuid_chain: List[str]
+    ) -> None:
+        """Add the content of the imported model and all its imports to the hash."""
+        href, parent_url_root = Import.resolve_href(href, resources, parent_url_root)
+        fetcher = cache.FetcherFactory.get_fetcher(self._trestle_root, href)
+        cached_path = fetcher.get_cached_path()
+        content = cached_path.read_bytes()
+        hasher.update(str(cached_path).encode(const.FILE_ENCODING))
+        hasher.update(hashlib.sha256(content).digest())
+        if self._get_root_key(cached_path, content) != const.MODEL_TYPE_PROFILE:
+            return
+        profile = prof.Profile.parse_obj(file_utils.load_file(cached_path)[const.MODEL_TYPE_PROFILE])
+        if profile.uuid in uuid_chain:
+            raise TrestleError(f'Profile {profile.metadata.title} is referenced in circular manner.')
+        resources = profile.back_matter.resources if profile.back_matter else None
+        for sub_import in as_list(profile.imports):
+            self._hash_import(hasher, sub_import.href, resources, parent_url_root, uuid_chain + [profile.uuid])
+
+    def get_key(self) -> Optional[str]:
+        """Return the key for this resolution, or None if the import graph could not be traversed."""
+        if self._key is None:
+            hasher = hashlib.sha256()
+            hasher.update(trestle.__version__.encode(const.FILE_ENCODING))
+            hasher.update(repr(self._resolver_args).encode(const.FILE_ENCODING))
+            try:
+                self._hash_import(hasher, self._profile_path, None, None, [])
+            except Exception as e:
+                # let the resolver itself report any problem with the profile or its imports
+                logger.debug(f'Unable to compute resolved catalog cache key for {self._profile_path}: {e}')
+                return None
+            self._key = hasher.hexdigest()
+        return self._key
+
+    def _entry_path(self) -> Optional[pathlib.Path]:
+        key = self.get_key()
+        return self._cache_dir / f'{key}.json' if key else None
+
+    def load(self) -> Optional[Tuple[cat.Catalog, Dict[str, Any]]]:
+        """Load the resolved catalog and inherited props if present in the cache."""
+        entry_path = self._entry_path()
+        if entry_path is None or not entry_path.exists():
+            return None
+        try:
+            data = orjson.loads(entry_path.read_bytes())
+            catalog = cat.Catalog.parse_obj(data[CATALOG_KEY])
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable resolved catalog cache entry {entry_path}: {e}')
+            return None
+        # mark the entry as recently used so it survives pruning
+        entry_path.touch()
+        logger.debug(f'resolved catalog for {self._profile_path} loaded from cache {entry_path}')
+        return catalog, data[INHERITED_PROPS_KEY]
+
+    def store(self, catalog: cat.Catalog, inherited_props: Dict[str, Any]) -> None:
+        """Store the resolved catalog and inherited props in the cache."""
+        entry_path = self._entry_path()
+        if entry_path is None:
+            return
+        data = {CATALOG_KEY: catalog.dict(by_alias=True, exclude_none=True), INHERITED_PROPS_KEY: inherited_props}
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so concurrent readers never see a partial entry
+            tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_bytes(orjson.dumps(data, default=catalog.__json_encoder__))
+            tmp_path.replace(entry_path)
+            self._prune()
+        except Exception as e:
+            logger.debug(f'Unable to store resolved catalog cache entry {entry_path}: {e}')
+
+    def _prune(self) -> None:
+        """Remove the oldest entries beyond the maximum allowed."""
+        entries = sorted(self._cache_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old_entry in entries[const.RESOLVED_CACHE_MAX_ENTRIES:]:
+            old_entry.unlink(missing_ok=True)
@@ -0,0 +1,107 @@
+# Copyright (c) 2024 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent index of the control ids in resolved profile catalogs, for control membership checks."""
+
+import logging
+import os
+import pathlib
+import threading
+from typing import Dict, FrozenSet, Optional
+
+import orjson
+
+import trestle.common.const as const
+from trestle.core.catalog.catalog_interface import CatalogInterface
+from trestle.core.profile_resolver import ProfileResolver
+from trestle.core.resolver.catalog_cache import ResolvedCatalogCache
+
+logger = logging.getLogger(__name__)
+
+# distinguishes the digest of the index from the digest of a resolved catalog of the same profile
+CONTROL_ID_INDEX_ARGS = ['control-ids']
+
+
+class ControlIdIndex():
+    """
+    Provide the set of control ids in the resolved catalog of a profile.
+
+    Each set is stored in the trestle cache keyed by the digest of the profile and everything it imports, as computed
+    by ResolvedCatalogCache, and is shared by all users in the process.  A profile whose import graph is unchanged is
+    therefore never resolved again, and only its control ids are loaded rather than the full resolved catalog.
+    """
+
+    _memo: Dict[str, FrozenSet[str]] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, trestle_root: pathlib.Path) -> None:
+        """Initialize the index for profiles resolved in the given trestle workspace."""
+        self._trestle_root = pathlib.Path(trestle_root)
+        self._cache_dir = self._trestle_root / const.TRESTLE_CACHE_DIR / const.CONTROL_ID_INDEX_DIR
+
+    def get_control_ids(self, profile_path: str) -> FrozenSet[str]:
+        """Get the ids of all controls in the resolved catalog of the profile."""
+        key = ResolvedCatalogCache(self._trestle_root, profile_path, CONTROL_ID_INDEX_ARGS).get_key()
+        if key is None:
+            return self._resolve(profile_path)
+        with ControlIdIndex._lock:
+            control_ids = ControlIdIndex._memo.get(key)
+        if control_ids is None:
+            entry_path = self._cache_dir / f'{key}.json'
+            control_ids = self._load(entry_path)
+            if control_ids is None:
+                control_ids = self._resolve(profile_path)
+                self._store(entry_path, control_ids)
+            with ControlIdIndex._lock:
+                ControlIdIndex._memo[key] = control_ids
+        return control_ids
+
+    def contains(self, profile_path: str, control_id: str) -> bool:
+        """Check if the control is in the resolved catalog of the profile."""
+        return control_id in self.get_control_ids(profile_path)
+
+    @staticmethod
+    def clear() -> None:
+        """Clear the control ids held in memory."""
+        with ControlIdIndex._lock:
+            ControlIdIndex._memo.clear()
+
+    def _resolve(self, profile_path: str) -> FrozenSet[str]:
+        catalog = ProfileResolver.get_resolved_profile_catalog(self._trestle_root, profile_path)
+        return frozenset(CatalogInterface.get_control_ids_from_catalog(catalog))
+
+    @staticmethod
+    def _load(entry_path: pathlib.Path) -> Optional[FrozenSet[str]]:
+        if not entry_path.exists():
+            return None
+        try:
+            control_ids = frozenset(orjson.loads(entry_path.read_bytes()))
+        except Exception as e:
+            logger.debug(f'Ignoring unreadable control id index entry {entry_path}: {e}')
+            return None
+        # mark the entry as recently used so it survives pruning
+        entry_path.touch()
+        return control_ids
+
+    def _store(self, entry_path: pathlib.Path, control_ids: FrozenSet[str]) -> None:
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so concurrent readers never see a partial entry
+            tmp_path = entry_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_bytes(orjson.dumps(sorted(control_ids)))
+            tmp_path.replace(entry_path)
+            entries = sorted(self._cache_dir.glob('*.json'), key=lambda p: p.stat().st_mtime, reverse=True)
+            for old_entry in entries[const.CONTROL_ID_INDEX_MAX_ENTRIES:]:
+                old_entry.unlink(missing_ok=True)
+        except Exception as e:
+            logger.debug(f'Unable to store control id index entry {entry_path}: {e}')
@@ -13,8 +13,14 @@
 # limitations under the License.
 """Create resolved catalog from profile."""
 
+import contextvars
 import logging
-from typing import Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import orjson
+
+from pydantic.v1 import BaseModel
 
 import trestle.oscal.catalog as cat
 import trestle.oscal.common as com
@@ -57,10 +63,11 @@ class Merge(Pipeline.Filter):
     Now the controls must be gathered, merged, and grouped based on the merge settings.
     """
 
-    def __init__(self, profile: prof.Profile) -> None:
-        """Initialize the class with the profile."""
+    def __init__(self, profile: prof.Profile, jobs: int = 1) -> None:
+        """Initialize the class with the profile and the number of imports that may be resolved concurrently."""
         logger.debug('merge filter initialize')
         self._profile = profile
+        self._jobs = jobs
 
     def _get_id(self, item: OBT) -> Optional[str]:
         id_ = getattr(item, ID, None)
@@ -68,39 +75,50 @@ class Merge(Pipeline.Filter):
             id_ = getattr(item, NAME, None)
         return id_
 
-    def _item_genertor(self, dest: List[OBT], src: List[OBT], merge_method: Optional[str]) -> Iterator[OBT]:
-        if merge_method == prof.CombinationMethodValidValues.keep.value:
-            dest.extend(src)
-        else:
-            for item in src:
-                # if there is an exact copy of this in dest then ignore it
-                if item not in dest:
-                    yield item
-
-    def _merge_item(self, item: OBT, dest: List[OBT], merge_method: Optional[str]) -> bool:
-        merged = False
-        item_id = self._get_id(item)
-        if item_id is not None:
-            for other in dest:
-                other_id = self._get_id(other)
-                if other_id != item_id:
-                    continue
-                if merge_method == prof.CombinationMethodValidValues.merge.value:
-                    self._merge_items(other, item, merge_method)
-                merged = True
-                break
-        return merged
+    @staticmethod
+    def _structural_key(item: Any) -> Any:
+        """Return a hashable key that is the same for items that compare equal."""
+        if isinstance(item, BaseModel):
+            return orjson.dumps(item.dict(), default=str)
+        try:
+            hash(item)
+        except TypeError:
+            return repr(item)
+        return item
 
     def _merge_lists(self, dest: List[OBT], src: List[OBT], merge_method: Optional[str]) -> None:
-        added_items = []
         if merge_method == prof.CombinationMethodValidValues.keep.value:
             dest.extend(src)
             return
-        for item in self._item_genertor(dest, src, merge_method):
-            merged = self._merge_item(item, dest, merge_method)
-            # it isn't already in dest and no match was found for merge, so append
-            if not merged:
+        # index dest once by id and by content so each incoming item is matched without scanning dest
+        id_index: Dict[str, OBT] = {}
+        id_keys: Dict[str, Any] = {}
+        key_counts: Dict[Any, int] = {}
+        for other in dest:
+            key = self._structural_key(other)
+            key_counts[key] = key_counts.get(key, 0) + 1
+            other_id = self._get_id(other)
+            if other_id is not None and other_id not in id_index:
+                id_index[other_id] = other
+                id_keys[other_id] = key
+        added_items = []
+        for item in src:
+            # if there is an exact copy of this in dest then ignore it
+            if key_counts.get(self._structural_key(item), 0):
+                continue
+            item_id = self._get_id(item)
+            other = id_index.get(item_id) if item_id is not None else None
+            if other is None:
+                # it isn't already in dest and no match was found for merge, so append
                 added_items.append(item)
+                continue
+            if merge_method == prof.CombinationMethodValidValues.merge.value:
+                self._merge_items(other, item, merge_method)
+                # the merged item has new content so its key must be updated for later exact copy checks
+                key_counts[id_keys[item_id]] -= 1
+                new_key = self._structural_key(other)
+                key_counts[new_key] = key_counts.get(new_key, 0) + 1
+                id_keys[item_id] = new_key
         dest.extend(added_items)
 
     def _merge_attrs(
@@ -221,7 +239,17 @@ class Merge(Pipeline.Filter):
         """
         merged: Optional[cat.Catalog] = None
         logger.debug(f'merge entering process with {len(pipelines)} pipelines')
-        for pipeline in pipelines:
-            catalog = next(pipeline.process(None))
+        catalogs: Iterable[cat.Catalog]
+        if self._jobs > 1 and len(pipelines) > 1:
+            # resolve the imports concurrently but merge them in declaration order so the result is deterministic
+            # each worker runs in a copy of the current context so settings such as bulk_edit carry over
+            context = contextvars.copy_context()
+            with ThreadPoolExecutor(max_workers=min(self._jobs, len(pipelines))) as executor:
+                catalogs = list(
+                    executor.map(lambda pipeline: context.copy().run(next, pipeline.process(None)), pipelines)
+                )
+        else:
+            catalogs = (next(pipeline.process(None)) for pipeline in pipelines)
+        for catalog in catalogs:
             merged = self._merge_catalog(merged, catalog)
         yield merged  # type: ignore
@@ -79,6 +79,10 @@ class RuleParametersValidator(Validator):
             if not control:
                 deep_set(self._rule_param_values_dict, [set_param.param_id, comp_uuid, control_id], set_param.values)
 
+    def reads_imported_models(self) -> bool:
+        """Report that the profile imported by the model is resolved."""
+        return True
+
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
     ) -> bool:
@@ -15,20 +15,90 @@
 """Base class for all validators."""
 
 import argparse
+import hashlib
+import json
 import logging
+import os
 import pathlib
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+from pydantic.v1 import BaseModel
+
+import trestle
 import trestle.common.file_utils
+from trestle.common import const
 from trestle.common.common_types import TopLevelOscalModel
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
 from trestle.core.commands.common.return_codes import CmdReturnCodes
 from trestle.core.models.file_content_type import FileContentType
+from trestle.core.resolver.catalog_cache import ResolvedCatalogCache
 
 logger = logging.getLogger(__name__)
 
+# key of the profile imported by a model, e.g. a system security plan
+IMPORT_PROFILE_KEY = 'import-profile'
+
+
+class ModelVisitor(ABC):
+    """
+    Visitor that checks a model during a traversal shared with other visitors.
+
+    The traversal reaches the same models and dicts as ModelUtils.find_values_by_name, so a visitor can collect the
+    values of named fields without walking the model itself.
+    """
+
+    @abstractmethod
+    def visit(self, node: Union[BaseModel, Dict[str, Any]]) -> None:
+        """Inspect one model or dict found in the traversal."""
+
+    @abstractmethod
+    def is_valid(self) -> bool:
+        """Report whether the model is valid once the traversal is complete."""
+
+
+class ValuesByNameVisitor(ModelVisitor):
+    """Visitor collecting the values of named fields, as ModelUtils.find_values_by_name would for each name."""
+
+    def __init__(self, names_of_interest: List[str]) -> None:
+        """Initialize an empty list of values for each name."""
+        self.values: Dict[str, List[Any]] = {name: [] for name in names_of_interest}
+
+    def visit(self, node: Union[BaseModel, Dict[str, Any]]) -> None:
+        """Collect the values of the named fields of the node."""
+        if type(node) is dict:
+            for name, values in self.values.items():
+                if name in node:
+                    values.append(node[name])
+            return
+        for name, values in self.values.items():
+            value = getattr(node, name, None)
+            if value is not None:
+                values.append(value)
+
+    def is_valid(self) -> bool:
+        """Accept the model, since collecting values alone finds no problems - subclasses check the values."""
+        return True
+
+
+def visit_model(object_of_interest: Any, visitors: List[ModelVisitor]) -> None:
+    """Traverse the object once and pass every model and dict it contains to each visitor."""
+    if isinstance(object_of_interest, BaseModel):
+        for visitor in visitors:
+            visitor.visit(object_of_interest)
+        for field in getattr(object_of_interest, const.FIELDS_SET, ()):
+            visit_model(getattr(object_of_interest, field, None), visitors)
+    elif type(object_of_interest) is list:
+        for item in object_of_interest:
+            visit_model(item, visitors)
+    elif type(object_of_interest) is dict:
+        for visitor in visitors:
+            visitor.visit(object_of_interest)
+        for item in object_of_interest.values():
+            visit_model(item, visitors)
+
 
 class Validator(ABC):
     """Validator base class."""
@@ -38,6 +108,41 @@ class Validator(ABC):
         # subclasses can override as needed
         return self.__doc__
 
+    def get_visitor(self,
+                    model: TopLevelOscalModel,
+                    quiet: bool,
+                    trestle_root: Optional[pathlib.Path] = None) -> Optional[ModelVisitor]:
+        """
+        Get a visitor that validates the model during a traversal shared with other validators.
+
+        Validators that need to walk the whole model should return a visitor so several of them can be run over a
+        single traversal.  Others return None and are run with model_is_valid.
+
+        args:
+            model: An Oscal model that can be passed to the validator.
+            quiet: Don't report msgs unless invalid.
+
+        returns:
+            The visitor, or None if the validator does not traverse the model.
+        """
+        return None
+
+    def _model_is_valid_by_visitor(
+        self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
+    ) -> bool:
+        """Validate the model with its own traversal by the visitor of this validator."""
+        visitor = self.get_visitor(model, quiet, trestle_root)
+        visit_model(model, [visitor])
+        return visitor.is_valid()
+
+    def reads_imported_models(self) -> bool:
+        """
+        Determine if the validator reads the models imported by the model, e.g. to resolve its profile.
+
+        The models skipped by changed_only validation must then also be unchanged in what they import.
+        """
+        return False
+
     @abstractmethod
     def model_is_valid(
         self, model: TopLevelOscalModel, quiet: bool, trestle_root: Optional[pathlib.Path] = None
@@ -65,35 +170,16 @@ class Validator(ABC):
             else:
                 models = ModelUtils.get_models_of_type(args.type, trestle_root)
             models_path = trestle_root / ModelUtils.model_type_to_model_dir(args.type)
-            for m in models:
-                model_path = models_path / m
-                try:
-                    _, _, model = ModelUtils.load_distributed(model_path, trestle_root)
-                except TrestleError as e:
-                    logger.warning(f'File load error {e}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                if not self.model_is_valid(model, args.quiet, trestle_root):  # type: ignore
-                    logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                if not args.quiet:
-                    logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
-            return CmdReturnCodes.SUCCESS.value
+            return self._validate_model_paths([models_path / m for m in models], args, False)
 
         # validate all
         if args.all:
-            model_tups = ModelUtils.get_all_models(trestle_root)
-            for mt in model_tups:
-
+            model_paths = []
+            for mt in ModelUtils.get_all_models(trestle_root):
                 model_dir = trestle_root / ModelUtils.model_type_to_model_dir(mt[0]) / mt[1]
                 extension_type = trestle.common.file_utils.get_contextual_file_type(model_dir)
-                model_path = model_dir / f'{mt[0]}{FileContentType.to_file_extension(extension_type)}'
-                _, _, model = ModelUtils.load_distributed(model_path, trestle_root)
-                if not self.model_is_valid(model, args.quiet, trestle_root):  # type: ignore
-                    logger.info(f'INVALID: Model {model_path} did not pass the {self.error_msg()}')
-                    return CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
-                if not args.quiet:
-                    logger.info(f'VALID: Model {model_path} passed the {self.error_msg()}')
-            return CmdReturnCodes.SUCCESS.value
+                model_paths.append(model_dir / f'{mt[0]}{FileContentType.to_file_extension(extension_type)}')
+            return self._validate_model_paths(model_paths, args, True)
 
         # validate file
         if args.file:
@@ -105,3 +191,177 @@ class Validator(ABC):
             if not args.quiet:
                 logger.info(f'VALID: Model {file_path} passed the {self.error_msg()}')
         return CmdReturnCodes.SUCCESS.value
+
+    def _validate_model_paths(
+        self, model_paths: List[pathlib.Path], args: argparse.Namespace, raise_load_errors: bool
+    ) -> int:
+        """
+        Validate each model and report every failure.
+
+        With more than one job the models are loaded and validated in a pool of processes.  With changed_only, models
+        whose content is unchanged since they last passed validation are skipped.
+        """
+        trestle_root = args.trestle_root
+        digests = _ValidationDigests(trestle_root, self.__class__.__name__, self.reads_imported_models())
+        to_validate = []
+        for model_path in model_paths:
+            if args.changed_only and digests.is_unchanged(model_path):
+                if not args.quiet:
+                    logger.info(f'SKIPPED: Model {model_path} is unchanged since it last passed validation')
+                continue
+            to_validate.append(model_path)
+
+        if args.jobs > 1 and len(to_validate) > 1:
+            with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+                results = list(
+                    executor.map(
+                        _validate_model_path, [self] * len(to_validate),
+                        to_validate, [trestle_root] * len(to_validate), [args.quiet] * len(to_validate)
+                    )
+                )
+        else:
+            results = [_validate_model_path(self, model_path, trestle_root, args.quiet) for model_path in to_validate]
+
+        load_errors = []
+        rc = CmdReturnCodes.SUCCESS.value
+        for model_path, (is_valid, msg) in zip(to_validate, results):
+            if is_valid is None:
+                logger.warning(f'File load error {msg}')
+                load_errors.append(msg)
+                rc = CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+            elif not is_valid:
+                logger.info(f'INVALID: Model {model_path} did not pass the {msg}')
+                if args.changed_only:
+                    digests.remove(model_path)
+                rc = CmdReturnCodes.OSCAL_VALIDATION_ERROR.value
+            else:
+                if not args.quiet:
+                    logger.info(f'VALID: Model {model_path} passed the {msg}')
+                if args.changed_only:
+                    digests.add(model_path)
+        if args.changed_only:
+            digests.save()
+        if load_errors and raise_load_errors:
+            raise TrestleError(load_errors[0])
+        return rc
+
+
+def _validate_model_path(validator: Validator, model_path: pathlib.Path, trestle_root: pathlib.Path,
+                         quiet: bool) -> Tuple[Optional[bool], Optional[str]]:
+    """
+    Load and validate a single model.
+
+    Returns:
+        Whether the model is valid, or None if it could not be loaded, and the error message of the validator or of
+        the load failure.
+    """
+    try:
+        _, _, model = ModelUtils.load_distributed(model_path, trestle_root)
+    except TrestleError as e:
+        return None, str(e)
+    is_valid = validator.model_is_valid(model, quiet, trestle_root)  # type: ignore
+    return is_valid, validator.error_msg()
+
+
+class _ValidationDigests:
+    """Digests of the content of models that passed validation, stored in the trestle cache."""
+
+    def __init__(self, trestle_root: pathlib.Path, validator_name: str, include_imports: bool = False) -> None:
+        """
+        Load any digests stored by a previous validation.
+
+        Args:
+            trestle_root: root of the trestle workspace
+            validator_name: name of the validator the digests are for
+            include_imports: include the profile imported by a model and all it imports in its digest
+        """
+        self._trestle_root = trestle_root
+        self._validator_name = validator_name
+        self._include_imports = include_imports
+        self._path = trestle_root / const.TRESTLE_CACHE_DIR / const.VALIDATED_DIGESTS_FILE
+        self._digests: Dict[str, str] = {}
+        self._loaded = False
+
+    def _load(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._path.exists():
+            try:
+                self._digests = json.loads(self._path.read_text(encoding=const.FILE_ENCODING))
+            except Exception as e:
+                logger.debug(f'Ignoring unreadable validation digests {self._path}: {e}')
+
+    def _key(self, model_path: pathlib.Path) -> str:
+        model_dir = model_path if model_path.is_dir() else model_path.parent
+        return model_dir.resolve().relative_to(self._trestle_root.resolve()).as_posix()
+
+    @staticmethod
+    def _get_import_profile_href(model_dir: pathlib.Path) -> Optional[str]:
+        """Find the href of the profile imported by the model, which may be split into its own file."""
+        for root_path in model_dir.iterdir():
+            if not root_path.is_file() or root_path.stem not in const.MODEL_TYPE_LIST:
+                continue
+            root_key = root_path.stem
+            model_dict = trestle.common.file_utils.load_file(root_path)[root_key]
+            import_profile = model_dict.get(IMPORT_PROFILE_KEY)
+            if import_profile is None:
+                for split_path in (model_dir / root_key).glob(f'{IMPORT_PROFILE_KEY}.*'):
+                    import_profile = trestle.common.file_utils.load_file(split_path)[IMPORT_PROFILE_KEY]
+            return import_profile.get('href') if import_profile else None
+        return None
+
+    def _digest(self, model_path: pathlib.Path) -> Optional[str]:
+        """
+        Hash the content of all files of the model, which may be split, and of the models it imports if needed.
+
+        Returns:
+            The digest, or None if the imported models could not be hashed so the model must always be validated.
+        """
+        model_dir = model_path if model_path.is_dir() else model_path.parent
+        hasher = hashlib.sha256()
+        hasher.update(f'{trestle.__version__} {self._validator_name}'.encode(const.FILE_ENCODING))
+        for path in sorted(p for p in model_dir.rglob('*') if p.is_file()):
+            hasher.update(path.relative_to(model_dir).as_posix().encode(const.FILE_ENCODING))
+            hasher.update(hashlib.sha256(path.read_bytes()).digest())
+        if self._include_imports:
+            try:
+                href = self._get_import_profile_href(model_dir)
+            except Exception as e:
+                logger.debug(f'Unable to find the profile imported by {model_dir}: {e}')
+                return None
+            if href:
+                # the key of the resolved catalog covers the profile and every model it imports
+                imports_key = ResolvedCatalogCache(self._trestle_root, href, []).get_key()
+                if imports_key is None:
+                    return None
+                hasher.update(imports_key.encode(const.FILE_ENCODING))
+        return hasher.hexdigest()
+
+    def is_unchanged(self, model_path: pathlib.Path) -> bool:
+        """Determine if the model passed validation with its current content."""
+        self._load()
+        digest = self._digest(model_path)
+        return digest is not None and self._digests.get(self._key(model_path)) == digest
+
+    def add(self, model_path: pathlib.Path) -> None:
+        """Record that the model passed validation with its current content."""
+        self._load()
+        digest = self._digest(model_path)
+        if digest is None:
+            self._digests.pop(self._key(model_path), None)
+        else:
+            self._digests[self._key(model_path)] = digest
+
+    def remove(self, model_path: pathlib.Path) -> None:
+        """Forget the model so it is validated again."""
+        self._load()
+        self._digests.pop(self._key(model_path), None)
+
+    def save(self) -> None:
+        """Write the digests to the trestle cache."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first so concurrent readers never see a partial file
+        tmp_path = self._path.with_suffix(f'.{os.getpid()}.tmp')
+        tmp_path.write_text(json.dumps(self._digests, indent=2, sort_keys=True), encoding=const.FILE_ENCODING)
+        tmp_path.replace(self._path)
@@ -42,3 +42,5 @@ def init_arguments(cmd: Command) -> None:
     cmd.add_argument('-n', '--name', help='Name of single model to validate (with --type specified).', required=False)
     quiet_help = 'Do not report messages unless validation fails.'
     cmd.add_argument('-q', '--quiet', action='store_true', help=quiet_help, required=False)
+    cmd.add_argument('-j', '--jobs', help=const.HELP_JOBS, required=False, type=int, default=1)
+    cmd.add_argument('-co', '--changed-only', action='store_true', help=const.HELP_CHANGED_ONLY, required=False)
@@ -38,6 +38,7 @@ from trestle.oscal.common import Property
 from trestle.oscal.common import Resource
 from trestle.tasks.base_task import TaskBase
 from trestle.tasks.base_task import TaskOutcome
+from trestle.tasks.xlsx_helper import read_sheet_rows
 
 logger = logging.getLogger(__name__)
 
@@ -50,16 +51,19 @@ class XlsxHelper:
     def __init__(self, file: str) -> None:
         """Initialize."""
         self._spread_sheet = file
-        self._wb = load_workbook(self._spread_sheet)
+        wb = load_workbook(self._spread_sheet, read_only=True)
         sheet_candidates = ['Combined Profiles', 'Combined']
         self._sheet_name = None
         for sheet_candidate in sheet_candidates:
-            if sheet_candidate in self._wb.sheetnames:
+            if sheet_candidate in wb.sheetnames:
                 self._sheet_name = sheet_candidate
                 break
         if not self._sheet_name:
+            wb.close()
             raise RuntimeError(f'{file} missing one of {sheet_candidates} sheet')
-        self._work_sheet = self._wb[self._sheet_name]
+        # stream the rows once as value tuples, the workbook is not needed afterwards
+        self._rows = read_sheet_rows(wb[self._sheet_name])
+        wb.close()
         self._mapper()
         self._key_to_col_map = {'statement': 'description'}
 
@@ -78,28 +82,23 @@ class XlsxHelper:
     def _mapper(self) -> None:
         """Map columns heading names to column numbers."""
         self._col_name_to_number = {}
-        cols = self._work_sheet.max_column + 1
-        row = 1
-        for col in range(row, cols):
-            cell = self._work_sheet.cell(row, col)
-            if cell.value:
-                name = self._normalize(cell.value)
+        header = self._rows[0] if self._rows else ()
+        for col, value in enumerate(header, start=1):
+            if value:
+                name = self._normalize(value)
                 self._col_name_to_number[name] = col
 
     def row_generator(self) -> Iterator[int]:
         """Generate rows until max reached."""
-        row = 2
-        while row <= self._work_sheet.max_row:
-            yield row
-            row += 1
+        yield from range(2, len(self._rows) + 1)
 
     def get(self, row: int, name: str) -> str:
         """Get cell value for given row and column name."""
         nname = self._normalize(name)
         cname = self._translate(nname)
         col = self._col_name_to_number[cname]
-        cell = self._work_sheet.cell(row, col)
-        return cell.value
+        values = self._rows[row - 1]
+        return values[col - 1] if col <= len(values) else None
 
 
 class CatalogHelper:
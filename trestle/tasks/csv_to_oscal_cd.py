@@ -25,11 +25,11 @@ import sys
 import traceback
 import uuid
 from math import log10
-from typing import Generator, Iterator, List, Optional, Union
+from typing import Dict, Generator, Iterator, List, Optional, Set, Tuple, Union
 
 from trestle.common.list_utils import as_list
-from trestle.core.catalog.catalog_interface import CatalogInterface
-from trestle.core.profile_resolver import ProfileResolver
+from trestle.core.base_model import OscalBaseModel
+from trestle.core.resolver.control_id_index import ControlIdIndex
 from trestle.oscal import OSCAL_VERSION
 from trestle.oscal.common import Metadata
 from trestle.oscal.common import Property
@@ -363,17 +363,19 @@ class CsvToOscalComponentDefinition(TaskBase):
         control_mappings = self._calculate_control_mappings(rules[2])
         # rule set manager
         self._rule_set_id_mgr = _RuleSetIdMgr(self._cd_mgr.get_max_rule_set_number(), len(rules[1]))
-        # rule additions, deletions & modifications (by row)
-        self.rules_del(rules[0])
-        self.rules_add(rules[1])
-        self.rules_mod(rules[2])
-        # set-parameters additions, deletions & modifications (by row)
-        self.set_params_del(set_params[0])
-        self.set_params_add(set_params[1])
-        self.set_params_mod(set_params[2])
-        # control mappings additions, deletions & modifications (by row)
-        self.control_mappings_del(control_mappings[0])
-        self.control_mappings_add(control_mappings[1])
+        # defer validation of the many small edits until the component definition is complete
+        with OscalBaseModel.bulk_edit():
+            # rule additions, deletions & modifications (by row)
+            self.rules_del(rules[0])
+            self.rules_add(rules[1])
+            self.rules_mod(rules[2])
+            # set-parameters additions, deletions & modifications (by row)
+            self.set_params_del(set_params[0])
+            self.set_params_add(set_params[1])
+            self.set_params_mod(set_params[2])
+            # control mappings additions, deletions & modifications (by row)
+            self.control_mappings_del(control_mappings[0])
+            self.control_mappings_add(control_mappings[1])
         # note: control mappings mod is currently not possible
         # note: add/del user columns not currently supported
         if len(self._unresolved_controls) > 0:
@@ -384,6 +386,7 @@ class CsvToOscalComponentDefinition(TaskBase):
                 raise RuntimeError(text)
         # prepare new/revised component definition
         component_definition = self._cd_mgr.get_component_definition()
+        component_definition.validate_fields()
         # write OSCAL ComponentDefinition to file
         if self._verbose:
             logger.info(f'output: {ofile}')
@@ -416,6 +419,7 @@ class CsvToOscalComponentDefinition(TaskBase):
         """Calculate set parameters add, delete, modify."""
         cd_set_params = self._cd_mgr.get_set_params_keys()
         csv_set_params = self._csv_mgr.get_set_params_keys()
+        mod_rules = set(mod_rules)
         del_set_params = []
         add_set_params = []
         mod_set_params = []
@@ -444,6 +448,7 @@ class CsvToOscalComponentDefinition(TaskBase):
         """Calculate control mappings add, delete, modify."""
         cd_controls = self._cd_mgr.get_control_keys()
         csv_controls = self._csv_mgr.get_control_keys()
+        mod_rules = set(mod_rules)
         del_control_mappings = []
         add_control_mappings = []
         mod_control_mappings = []
@@ -768,12 +773,14 @@ class CsvToOscalComponentDefinition(TaskBase):
             # component
             component = self._cd_mgr.get_component(component_title, component_type, component_description)
             # props
-            component.props = self._modify_rule_props(component, rule_key)
+            self._modify_rule_props(component, rule_key)
+        # rebuild the props of each modified component once
+        self._cd_mgr.commit_rule_definitions()
 
-    def _modify_rule_props(self, component: DefinedComponent, rule_key: tuple) -> List[Property]:
+    def _modify_rule_props(self, component: DefinedComponent, rule_key: tuple) -> None:
         """Modify rule props."""
         rule_id = self._csv_mgr.get_value(rule_key, RULE_ID)
-        rule_set = _RuleSetHelper.get_rule_set(component.props, rule_id)
+        rule_set = self._cd_mgr.get_rule_set(component, rule_id)
         rule_ns = self._csv_mgr.get_value(rule_key, NAMESPACE)
         column_names = CsvColumn.get_filtered_required_column_names() + CsvColumn.get_filtered_optional_column_names()
         # req'd & optional props
@@ -792,7 +799,6 @@ class CsvToOscalComponentDefinition(TaskBase):
         for column_name in column_names:
             column_value = self._csv_mgr.get_value(rule_key, column_name).strip()
             self._cd_mgr.update_rule_definition(component, rule_set, column_name, column_value, rule_ns, class_)
-        return component.props
 
     def set_params_del(self, del_set_params: List[str]) -> None:
         """Set parameters delete."""
@@ -1076,31 +1082,22 @@ class _ResolvedProfileCatalogHelper():
     def __init__(self, profile_list: List[str], root: str = '.') -> None:
         """Initialize."""
         self._profile_list = profile_list
-        self._root = root
-        self._profile_map = {}
-        self._control_list = []
+        self._control_id_index = ControlIdIndex(pathlib.Path(root))
+        self._control_ids: Set[str] = set()
         self._init = False
 
     def _initialize(self):
         if not self._init:
             for profile in self._profile_list:
-                catalog = ProfileResolver.get_resolved_profile_catalog(
-                    pathlib.Path(self._root),
-                    profile,
-                )
-                self._profile_map[profile] = catalog
-                controls = CatalogInterface.get_control_ids_from_catalog(catalog)
-                self._control_list += controls
-            logger.debug(f'resolved controls: {self._control_list}')
+                # profiles unchanged since a previous run are not resolved again
+                self._control_ids |= self._control_id_index.get_control_ids(profile)
+            logger.debug(f'resolved controls: {sorted(self._control_ids)}')
             self._init = True
 
     def validate(self, control_id: str) -> bool:
         """Validate control_id."""
         self._initialize()
-        rval = True
-        if control_id not in self._control_list:
-            rval = False
-        return rval
+        return control_id in self._control_ids
 
 
 class _CdMgr():
@@ -1132,6 +1129,7 @@ class _CdMgr():
         self._cd_rules_map = {}
         self._cd_set_params_map = {}
         self._cd_controls_map = {}
+        self._props_indexes: Dict[int, _RuleSetPropsIndex] = {}
         #
         for component in self._component_definition.components:
             self.accounting(component)
@@ -1217,9 +1215,10 @@ class _CdMgr():
         self.accounting_rule_definitions(component)
         # set-parameters & control mappings
         if component.control_implementations:
+            rule_ids = self._get_rule_ids(component)
             for control_implementation in component.control_implementations:
                 # set-parameters
-                self.accounting_set_parameters(component, control_implementation)
+                self.accounting_set_parameters(component, control_implementation, rule_ids)
                 # control mappings
                 self.accounting_control_mappings(component, control_implementation)
 
@@ -1237,12 +1236,12 @@ class _CdMgr():
                         self._max_rule_set_number = rule_set_number
 
     def accounting_set_parameters(
-        self, component: DefinedComponent, control_implementation: ControlImplementation
+        self, component: DefinedComponent, control_implementation: ControlImplementation, rule_ids: Dict[str, str]
     ) -> None:
         """Accounting, set-parameters."""
         if control_implementation.set_parameters:
             for set_parameter in control_implementation.set_parameters:
-                rule_id = self._get_rule_id(component, set_parameter.param_id)
+                rule_id = rule_ids.get(set_parameter.param_id)
                 key = (
                     component.title,
                     component.type,
@@ -1307,20 +1306,38 @@ class _CdMgr():
                             )
                             self._cd_controls_map[key] = prop
 
-    def _get_rule_id(self, component: DefinedComponent, param_id: str) -> str:
-        """Get rule_id for given param_id."""
-        rule_id = None
-        if component.props:
-            map_ = {}
-            rule_set = None
-            for prop in component.props:
-                if prop.name == 'Rule_Id':
-                    map_[prop.remarks] = prop.value
-                elif prop.name == 'Parameter_Id' and prop.value == param_id:
-                    rule_set = prop.remarks
+    def _get_rule_ids(self, component: DefinedComponent) -> Dict[str, str]:
+        """Get map of param_id to rule_id for the component."""
+        rule_ids = {}
+        map_ = {}
+        rule_sets = {}
+        for prop in as_list(component.props):
+            if prop.name == 'Rule_Id':
+                map_[prop.remarks] = prop.value
+            elif prop.name == 'Parameter_Id':
+                rule_sets[prop.value] = prop.remarks
+        for param_id, rule_set in rule_sets.items():
             if rule_set:
-                rule_id = map_[rule_set]
-        return rule_id
+                rule_ids[param_id] = map_.get(rule_set)
+        return rule_ids
+
+    def _get_props_index(self, component: DefinedComponent) -> '_RuleSetPropsIndex':
+        """Get the index of the rule set props of the component, created when first needed."""
+        props_index = self._props_indexes.get(id(component))
+        if props_index is None:
+            props_index = _RuleSetPropsIndex(component)
+            self._props_indexes[id(component)] = props_index
+        return props_index
+
+    def get_rule_set(self, component: DefinedComponent, rule_id: str) -> str:
+        """Get rule_set for given rule_id."""
+        return self._get_props_index(component).get_rule_set(rule_id)
+
+    def commit_rule_definitions(self) -> None:
+        """Rebuild the props of each component whose rule definitions were updated."""
+        for props_index in self._props_indexes.values():
+            props_index.commit()
+        self._props_indexes = {}
 
     def update_rule_definition(
         self, component: DefinedComponent, rule_set: str, name: str, value: str, ns: str, class_: str
@@ -1342,12 +1359,7 @@ class _CdMgr():
 
     def find_property(self, component: DefinedComponent, rule_set: str, name: str) -> Property:
         """Find property."""
-        rval = None
-        for prop in component.props:
-            if prop.remarks == rule_set and prop.name == name:
-                rval = prop
-                break
-        return rval
+        return self._get_props_index(component).find(rule_set, name)
 
     def add_property(
         self, component: DefinedComponent, rule_set: str, name: str, value: str, ns: str, class_: str
@@ -1360,34 +1372,90 @@ class _CdMgr():
             class_=class_,
             remarks=rule_set,
         )
-        last = 0
-        for index, prop in enumerate(component.props):
-            if prop.remarks == rule_set:
-                last = index
-        props = []
-        for index, prop in enumerate(component.props):
-            if prop_add:
-                if index > last:
-                    props.append(prop_add)
-                    prop_add = None
-                    logger.debug(f'add-prop (last): {rule_set} {name} {prop.value} ->> {value}')
-                elif prop_add.remarks == prop.remarks:
-                    if CsvColumn.get_order(prop.name) > CsvColumn.get_order(prop_add.name):
-                        props.append(prop_add)
-                        prop_add = None
-                        logger.debug(f'add-prop (order): {rule_set} {name} {prop.value} ->> {value}')
-            props.append(prop)
-        component.props = props
+        logger.debug(f'add-prop: {rule_set} {name} ->> {value}')
+        self._get_props_index(component).add(prop_add)
 
     def delete_property(self, component: DefinedComponent, rule_set: str, name: str) -> None:
         """Delete property."""
-        props = []
-        for prop in component.props:
-            if prop.remarks == rule_set and prop.name == name:
+        self._get_props_index(component).delete(rule_set, name)
+
+
+class _RuleSetPropsIndex():
+    """Index of the props of a component by rule set.
+
+    Props added and deleted through the index are kept in per rule set lists, and the props of the component are
+    rebuilt once on commit rather than on every edit.
+    """
+
+    def __init__(self, component: DefinedComponent) -> None:
+        """Initialize."""
+        self._component = component
+        self._rule_sets: Dict[str, List[Property]] = {}
+        self._props: Dict[Tuple[str, str], Property] = {}
+        self._rule_set_by_rule_id: Dict[str, str] = {}
+        self._edited_rule_sets: Set[str] = set()
+        self._last_rule_set = component.props[-1].remarks if component.props else None
+        for prop in as_list(component.props):
+            self._rule_sets.setdefault(prop.remarks, []).append(prop)
+            self._props.setdefault((prop.remarks, prop.name), prop)
+            if prop.name == RULE_ID:
+                self._rule_set_by_rule_id.setdefault(prop.value, prop.remarks)
+
+    def get_rule_set(self, rule_id: str) -> str:
+        """Get rule_set for given rule_id."""
+        return self._rule_set_by_rule_id.get(rule_id)
+
+    def find(self, rule_set: str, name: str) -> Property:
+        """Find property."""
+        return self._props.get((rule_set, name))
+
+    def add(self, prop_add: Property) -> None:
+        """Add property to its rule set, ahead of the first prop that comes after it in column order."""
+        rule_set_props = self._rule_sets.setdefault(prop_add.remarks, [])
+        order = CsvColumn.get_order(prop_add.name)
+        index = len(rule_set_props)
+        for i, prop in enumerate(rule_set_props):
+            if CsvColumn.get_order(prop.name) > order:
+                index = i
+                break
+        if index == len(rule_set_props) and prop_add.remarks == self._last_rule_set:
+            # there is no prop after the last rule set to insert ahead of, so it is not added
+            logger.debug(f'add-prop (none): {prop_add.remarks} {prop_add.name}')
+            return
+        rule_set_props.insert(index, prop_add)
+        self._props.setdefault((prop_add.remarks, prop_add.name), prop_add)
+        self._edited_rule_sets.add(prop_add.remarks)
+
+    def delete(self, rule_set: str, name: str) -> None:
+        """Delete property."""
+        if self._props.pop((rule_set, name), None) is None:
+            return
+        rule_set_props = []
+        for prop in self._rule_sets[rule_set]:
+            if prop.name == name:
                 logger.debug(f'delete-prop: {rule_set} {name} {prop.value}')
             else:
+                rule_set_props.append(prop)
+        self._rule_sets[rule_set] = rule_set_props
+        self._edited_rule_sets.add(rule_set)
+
+    def commit(self) -> None:
+        """Rebuild the props of the component, with each edited rule set in place of its first prop."""
+        if not self._edited_rule_sets:
+            return
+        props = []
+        placed = set()
+        for prop in as_list(self._component.props):
+            rule_set = prop.remarks
+            if rule_set not in self._edited_rule_sets:
                 props.append(prop)
-        component.props = props
+            elif rule_set not in placed:
+                props += self._rule_sets[rule_set]
+                placed.add(rule_set)
+        for rule_set in self._edited_rule_sets - placed:
+            props += self._rule_sets[rule_set]
+        self._component.props = props
+        self._edited_rule_sets = set()
 
 
 class CsvColumn():
@@ -1567,57 +1635,98 @@ class CsvColumn():
     ]
 
 
-Row = Iterator[List[str]]
+# position of a data row in the columns of the csv
+Row = int
 
 
 class _CsvMgr():
-    """Csv Manager."""
+    """Csv Manager.
+
+    The csv is stored by column along with a map of normalized heading to column index, and the rule, set-parameter
+    and control maps are built in a single pass as the rows are read.
+    """
 
     def __init__(self, csv_path: pathlib.Path) -> None:
         """Initialize."""
-        self._csv = []
-        with open(csv_path, 'r', newline='') as f:
-            csv_reader = csv.reader(f, delimiter=',', quoting=csv.QUOTE_MINIMAL)
-            for row in csv_reader:
-                self._csv.append(row)
-        self._undecorate_header()
-        self._verify()
         self._csv_rules_map = {}
         self._csv_set_params_map = {}
         self._csv_controls_map = {}
         self._csv_profile_list = []
-        for row_num, row in self.row_generator():
-            self._check_row_minimum_requirements(row_num, row)
-            component_title = self.get_row_value(row, f'{COMPONENT_TITLE}')
-            component_type = self.get_row_value(row, f'{COMPONENT_TYPE}')
-            component_description = self.get_row_value(row, f'{COMPONENT_DESCRIPTION}')
-            rule_id = self.get_row_value(row, f'{RULE_ID}')
-            # rule sets
-            check_id = self.get_row_value(row, f'{CHECK_ID}', default=None)
-            target_component = self.get_row_value(row, f'{TARGET_COMPONENT}', default=None)
-            key = synthesize_rule_key(component_title, component_type, rule_id, check_id, target_component)
-            if key in self._csv_rules_map:
-                text = f'row "{row_num}" contains duplicate {RULE_ID} "{rule_id}"'
-                raise RuntimeError(text)
-            self._csv_rules_map[key] = [row_num, row]
-            logger.debug(f'csv-rules: {key} {self._csv_rules_map[key][0]}')
-            # set parameters, by component
-            source = self.get_row_value(row, PROFILE_SOURCE)
-            if source and source not in self._csv_profile_list:
-                self._csv_profile_list.append(source)
-            description = self.get_row_value(row, PROFILE_DESCRIPTION)
-            for param_id_key in self.get_parameter_id_column_names():
-                param_id = self.get_row_value(row, param_id_key)
-                if param_id:
-                    key = (component_title, component_type, rule_id, source, description, param_id)
-                    self._csv_set_params_map[key] = [row_num, row]
-                    logger.debug(f'csv-set-parameters: {key} {self._csv_set_params_map[key][0]}')
-            # control mappings
-            self._control_mappings(row_num, row, component_description, component_type, rule_id, source, description)
+        with open(csv_path, 'r', newline='') as f:
+            csv_reader = iter(csv.reader(f, delimiter=',', quoting=csv.QUOTE_MINIMAL))
+            self._set_header(next(csv_reader, []))
+            self._verify()
+            # the second row holds column descriptions and the data rows follow it
+            for row_num, values in enumerate(csv_reader, start=2):
+                row = self._append_row(values)
+                if row_num < 3 or self._is_no_control(row):
+                    continue
+                logger.debug(f'row_gen: {row_num} {values}')
+                self._map_row(row_num, row)
         logger.debug(f'csv rules: {len(self._csv_rules_map)}')
         logger.debug(f'csv params: {len(self._csv_set_params_map)}')
         logger.debug(f'csv controls: {len(self._csv_controls_map)}')
 
+    def _set_header(self, head_row: List[str]) -> None:
+        """Set the header and the column lookups derived from it."""
+        self._header = self._undecorate_header(head_row)
+        self._columns: List[List[str]] = [[] for _ in self._header]
+        self._col_index = {}
+        for index, heading in enumerate(self._header):
+            self._col_index.setdefault(self._get_normalized_column_name(heading), index)
+        self._parameter_id_column_names = [col_name for col_name in self._header if col_name.startswith(PARAMETER_ID)]
+        self._parameter_column_names = [
+            col_name for col_name in self._header
+            if col_name.startswith(PARAMETER) and not col_name.startswith(PARAMETER_VALUE_DEFAULT)
+        ]
+        self._user_column_names = [
+            col_name for col_name in self._header if not (
+                CsvColumn.is_column_name_required(col_name) or CsvColumn.is_column_name_optional(col_name)
+                or CsvColumn.is_column_name_parameter(col_name)
+            )
+        ]
+
+    def _append_row(self, values: List[str]) -> Row:
+        """Append the values of a row to the columns, padding short rows with empty values."""
+        row = self._row_count()
+        for index, column in enumerate(self._columns):
+            column.append(values[index] if index < len(values) else '')
+        return row
+
+    def _row_count(self) -> int:
+        """Get the number of rows after the header."""
+        return len(self._columns[0]) if self._columns else 0
+
+    def _map_row(self, row_num: int, row: Row) -> None:
+        """Add the row to the rule, set-parameter and control maps."""
+        self._check_row_minimum_requirements(row_num, row)
+        component_title = self.get_row_value(row, f'{COMPONENT_TITLE}')
+        component_type = self.get_row_value(row, f'{COMPONENT_TYPE}')
+        component_description = self.get_row_value(row, f'{COMPONENT_DESCRIPTION}')
+        rule_id = self.get_row_value(row, f'{RULE_ID}')
+        # rule sets
+        check_id = self.get_row_value(row, f'{CHECK_ID}', default=None)
+        target_component = self.get_row_value(row, f'{TARGET_COMPONENT}', default=None)
+        key = synthesize_rule_key(component_title, component_type, rule_id, check_id, target_component)
+        if key in self._csv_rules_map:
+            text = f'row "{row_num}" contains duplicate {RULE_ID} "{rule_id}"'
+            raise RuntimeError(text)
+        self._csv_rules_map[key] = [row_num, row]
+        logger.debug(f'csv-rules: {key} {self._csv_rules_map[key][0]}')
+        # set parameters, by component
+        source = self.get_row_value(row, PROFILE_SOURCE)
+        if source and source not in self._csv_profile_list:
+            self._csv_profile_list.append(source)
+        description = self.get_row_value(row, PROFILE_DESCRIPTION)
+        for param_id_key in self._parameter_id_column_names:
+            param_id = self.get_row_value(row, param_id_key)
+            if param_id:
+                key = (component_title, component_type, rule_id, source, description, param_id)
+                self._csv_set_params_map[key] = [row_num, row]
+                logger.debug(f'csv-set-parameters: {key} {self._csv_set_params_map[key][0]}')
+        # control mappings
+        self._control_mappings(row_num, row, component_description, component_type, rule_id, source, description)
+
     def _control_mappings(
         self,
         row_num: int,
@@ -1638,39 +1747,24 @@ class _CsvMgr():
 
     def get_parameter_id_column_names(self) -> List[str]:
         """Get parameter_id column_names."""
-        col_names = []
-        for col_name in self._csv[0]:
-            if col_name.startswith(PARAMETER_ID):
-                col_names.append(col_name)
-        return col_names
+        return [] + self._parameter_id_column_names
 
     def get_parameter_column_names(self) -> List[str]:
         """Get parameter column_names."""
-        col_names = []
-        for col_name in self._csv[0]:
-            if col_name.startswith(PARAMETER_VALUE_DEFAULT):
-                continue
-            if col_name.startswith(PARAMETER):
-                col_names.append(col_name)
-        return col_names
+        return [] + self._parameter_column_names
 
     def get_profile_list(self):
         """Get profile list."""
         return [] + self._csv_profile_list
 
-    def row_generator(self) -> Generator[Union[int, Row], None, None]:
+    def row_generator(self) -> Generator[Tuple[int, Row], None, None]:
         """Generate rows."""
-        index = 0
-        for row in self._csv:
-            index += 1
-            if index < 3:
-                continue
+        for row in range(1, self._row_count()):
             if self._is_no_control(row):
                 continue
-            logger.debug(f'row_gen: {index} {row}')
-            yield index, row
+            yield row + 2, row
 
-    def _check_row_minimum_requirements(self, row_num: int, row: List) -> None:
+    def _check_row_minimum_requirements(self, row_num: int, row: Row) -> None:
         """Check row minimum requirements."""
         if self._is_component_type_validation(row):
             column_names = CsvColumn.get_required_column_names_validation()
@@ -1682,7 +1776,7 @@ class _CsvMgr():
                 text = f'row "{row_num}" missing value for "{column_name}"'
                 raise RuntimeError(text)
 
-    def _is_no_control(self, row: List) -> bool:
+    def _is_no_control(self, row: Row) -> bool:
         """Check for no control."""
         if self._is_component_type_validation(row):
             rval = False
@@ -1694,7 +1788,7 @@ class _CsvMgr():
                 rval = False
         return rval
 
-    def _is_component_type_validation(self, row: List) -> bool:
+    def _is_component_type_validation(self, row: Row) -> bool:
         """Check for component type validation."""
         component_type = self.get_row_value(row, f'{COMPONENT_TYPE}')
         if component_type.lower().strip() == validation:
@@ -1703,23 +1797,21 @@ class _CsvMgr():
             rval = False
         return rval
 
-    def _undecorate_header(self) -> None:
+    def _undecorate_header(self, head_row: List[str]) -> List[str]:
         """Undecorate header, and reformat each word in header to title case."""
-        head_row = self._csv[0]
-        self._csv[0] = []
+        header = []
         for column_name in head_row:
             heading = self._get_normalized_column_name(column_name)
             heading = heading.title()
-            self._csv[0].append(heading)
+            header.append(heading)
+        return header
 
     def _verify(self) -> None:
         """Verify."""
         required_columns = CsvColumn.get_required_column_names()
-        if len(self._csv):
-            head_row = self._csv[0]
-            for heading in head_row:
-                if heading in required_columns:
-                    required_columns.remove(heading)
+        for heading in self._header:
+            if heading in required_columns:
+                required_columns.remove(heading)
         if len(required_columns):
             text = f'Missing columns: {required_columns}'
             raise RuntimeError(text)
@@ -1742,19 +1834,9 @@ class _CsvMgr():
 
     def get_col_index(self, column_name: str) -> int:
         """Get index for column name."""
-        rval = -1
-        index = 0
-        head_row = self._csv[0]
-        col_name = self._get_normalized_column_name(column_name)
-        for heading in head_row:
-            head_name = self._get_normalized_column_name(heading)
-            if head_name == col_name:
-                rval = index
-                break
-            index += 1
-        return rval
+        return self._col_index.get(self._get_normalized_column_name(column_name), -1)
 
-    def get_row(self, rule_key: tuple) -> List:
+    def get_row(self, rule_key: tuple) -> Row:
         """Get row for rule."""
         return self._csv_rules_map[rule_key][1]
 
@@ -1762,12 +1844,12 @@ class _CsvMgr():
         """Get row number for rule."""
         return self._csv_rules_map[rule_key][0]
 
-    def get_row_value(self, row: List[str], name: str, default='') -> str:
+    def get_row_value(self, row: Row, name: str, default='') -> str:
         """Get value for specified name."""
         rval = default
         index = self.get_col_index(name)
         if index >= 0:
-            rval = row[index]
+            rval = self._columns[index][row]
         return rval
 
     def get_value(self, rule_key: tuple, name: str) -> str:
@@ -1789,11 +1871,4 @@ class _CsvMgr():
 
     def get_user_column_names(self) -> List[str]:
         """Get user column names."""
-        user_column_names = []
-        for column_name in self._csv[0]:
-            t1 = CsvColumn.is_column_name_required(column_name)
-            t2 = CsvColumn.is_column_name_optional(column_name)
-            t3 = CsvColumn.is_column_name_parameter(column_name)
-            if not (t1 or t2 or t3):
-                user_column_names.append(column_name)
-        return user_column_names
+        return [] + self._user_column_names
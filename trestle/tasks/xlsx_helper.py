@@ -17,12 +17,16 @@
 # mypy: ignore-errors  # noqa E800
 import logging
 import pathlib
+import posixpath
 import string
+import zipfile
 from typing import Any, Dict, Iterator, List, Tuple
 
+from defusedxml import ElementTree
+
 from openpyxl import load_workbook
-from openpyxl.cell.cell import MergedCell
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
 
 from trestle import __version__
 from trestle.common.err import TrestleError
@@ -39,6 +43,51 @@ def get_trestle_version() -> str:
     return __version__
 
 
+_NS_MAIN = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+_NS_REL = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_NS_PKG_REL = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+
+
+def read_sheet_rows(work_sheet: Any) -> List[Tuple[Any, ...]]:
+    """Stream the rows of a work sheet as value tuples, ending at the last row holding a value."""
+    rows = []
+    last = 0
+    for values in work_sheet.iter_rows(values_only=True):
+        rows.append(values)
+        if any(value is not None for value in values):
+            last = len(rows)
+    # formatted but empty trailing rows may extend to the sheet limit
+    del rows[last:]
+    return rows
+
+
+def read_merged_ranges(spread_sheet: str, sheet_name: str) -> List[CellRange]:
+    """Read the merged cell ranges of a work sheet, which are not available from a read-only work sheet."""
+    with zipfile.ZipFile(spread_sheet) as archive:
+        workbook = ElementTree.fromstring(archive.read('xl/workbook.xml'), forbid_dtd=True)
+        rel_id = None
+        for sheet in workbook.iter(f'{_NS_MAIN}sheet'):
+            if sheet.get('name') == sheet_name:
+                rel_id = sheet.get(f'{_NS_REL}id')
+        rels = ElementTree.fromstring(archive.read('xl/_rels/workbook.xml.rels'), forbid_dtd=True)
+        target = None
+        for rel in rels.iter(f'{_NS_PKG_REL}Relationship'):
+            if rel.get('Id') == rel_id:
+                target = rel.get('Target')
+        if target is None:
+            return []
+        sheet_path = target.lstrip('/') if target.startswith('/') else posixpath.join('xl', target)
+        merged_ranges = []
+        with archive.open(posixpath.normpath(sheet_path)) as sheet_xml:
+            for _, element in ElementTree.iterparse(sheet_xml, forbid_dtd=True):
+                if element.tag == f'{_NS_MAIN}mergeCell':
+                    merged_ranges.append(CellRange(element.get('ref')))
+                # discard parsed rows as the sheet is scanned
+                if element.tag == f'{_NS_MAIN}row':
+                    element.clear()
+        return merged_ranges
+
+
 class Column():
     """Spread sheet columns."""
 
@@ -210,9 +259,10 @@ class XlsxHelper:
         """Load."""
         self._spread_sheet = spread_sheet
         self._sheet_name = sheet_name
-        self._wb = load_workbook(self._spread_sheet)
-        self._work_sheet = self._wb[self._sheet_name]
-        self._map_name_to_letters = {}
+        # stream the cell values of the work sheet in a single pass
+        wb = load_workbook(self._spread_sheet, read_only=True)
+        self._rows = read_sheet_rows(wb[self._sheet_name])
+        wb.close()
         # accumulators
         self.rows_missing_control_id = []
         self.rows_missing_goal_name_id = []
@@ -228,21 +278,12 @@ class XlsxHelper:
         self._map_columns()
 
     def row_generator(self) -> Iterator[int]:
-        """Generate rows until control_id is None."""
-        row = 1
-        rows_skipped_consecutive = 0
-        # assume no more data when 100 consecutve rows no control id
-        rows_skipped_consecutive_limit = 100
-        while True:
-            row = row + 1
+        """Generate rows with control_id or goal_name_id, up to the last row of the work sheet."""
+        for row in range(2, len(self._rows) + 1):
             control_id = self._get_control_id(row)
             goal_id = self.get_goal_name_id(row)
             if control_id is None and goal_id is None:
-                rows_skipped_consecutive += 1
-                if rows_skipped_consecutive < rows_skipped_consecutive_limit:
-                    continue
-                logger.debug(f'break: {row} {rows_skipped_consecutive}')
-                break
+                continue
             if control_id is None:
                 self._add_row(row, self.rows_missing_control_id)
                 continue
@@ -252,14 +293,12 @@ class XlsxHelper:
             if self._is_filtered(row):
                 continue
             yield row
-            rows_skipped_consecutive = 0
 
     def _is_filtered(self, row) -> bool:
         """Return True if row is to be skipped."""
         if self._column.filter_column is None:
             return False
-        col = self._get_column_letter(self._column.filter_column)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.filter_column)
         if value is None:
             return False
         if value.lower() != 'yes':
@@ -269,8 +308,7 @@ class XlsxHelper:
 
     def get_goal_name_id(self, row: int, strict: bool = True) -> str:
         """Get goal_name_id from work_sheet."""
-        col = self._get_column_letter(self._column.goal_name_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.goal_name_id)
         if value is None:
             self._add_row(row, self.rows_missing_goal_name_id)
         else:
@@ -288,8 +326,7 @@ class XlsxHelper:
 
     def get_rule_name_id(self, row: int, strict: bool = False) -> str:
         """Get rule_name_id from work_sheet."""
-        col = self._get_column_letter(self._column.rule_name_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.rule_name_id)
         if value is None:
             self._add_row(row, self.rows_missing_rule_name_id)
         else:
@@ -307,16 +344,14 @@ class XlsxHelper:
 
     def get_parameter_value_default(self, row: int) -> str:
         """Get parameter_value_default from work_sheet."""
-        col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.rename_values_alternatives)
         if value is not None:
             value = str(value).split(',')[0].strip()
         return value
 
     def get_parameter_values(self, row: int) -> str:
         """Get parameter_values from work_sheet."""
-        col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.rename_values_alternatives)
         if value is None and self.get_parameter_name(row) is not None:
             self._add_row(row, self.rows_missing_parameters_values)
         # massage into comma separated list of values
@@ -330,8 +365,7 @@ class XlsxHelper:
 
     def _get_goal_text(self, row: int) -> str:
         """Get goal_text from work_sheet."""
-        col = self._get_column_letter(self._column.control_text)
-        goal_text = self._work_sheet[col + str(row)].value
+        goal_text = self._get_value(row, self._column.control_text)
         # normalize & tokenize
         value = goal_text.replace('\t', ' ')
         return value
@@ -361,8 +395,8 @@ class XlsxHelper:
         Example: {'au-2': ['(a)', '(d)'], 'au-12': [], 'si-4': ['(a)', '(b)', '(c)']}
         """
         value = {}
-        for col in self._get_column_letter(self._column.nist_mappings):
-            control = self._work_sheet[col + str(row)].value
+        for column in self.map_name_to_columns[self._column.nist_mappings]:
+            control = self._cell_value(row, column)
             if control is None:
                 continue
             # remove blanks
@@ -387,7 +421,7 @@ class XlsxHelper:
     def get_component_name(self, row: int) -> str:
         """Get component_name from work_sheet."""
         col = self._get_column_letter(self._column.resource_title)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.resource_title)
         if value is None:
             raise RuntimeError(f'row {row} col {col} missing component name')
         return value.strip()
@@ -401,7 +435,7 @@ class XlsxHelper:
         name = None
         description = None
         col = self._get_column_letter(self._column.rename_parameter_opt_parm)
-        combined_values = self._work_sheet[col + str(row)].value
+        combined_values = self._get_value(row, self._column.rename_parameter_opt_parm)
         if combined_values is not None:
             if '\n' in combined_values:
                 parameter_parts = combined_values.split('\n')
@@ -425,23 +459,25 @@ class XlsxHelper:
 
     def _get_control_id(self, row: int) -> int:
         """Get control_id from work_sheet."""
-        col = self._get_column_letter(self._column.control_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_value(row, self._column.control_id)
         return value
 
     def _get_column_letter(self, name: str) -> str:
         """Get column letter."""
-        value = self.map_name_to_letters[name]
+        value = [get_column_letter(column) for column in self.map_name_to_columns[name]]
         if len(value) == 1:
             value = value[0]
         return value
 
+    def _get_value(self, row: int, name: str) -> Any:
+        """Get value for the row in the first column of the given name."""
+        return self._cell_value(row, self.map_name_to_columns[name][0])
+
     def _map_columns(self) -> None:
         """Map columns."""
-        self.map_name_to_letters = {}
-        columns = self._work_sheet.max_column
-        for column in range(1, columns + 1):
-            cell_value = self._cell_value(1, column)
+        self.map_name_to_columns = {}
+        header = self._get_header()
+        for column, cell_value in enumerate(header, start=1):
             if cell_value is None:
                 continue
             cell_tokens = cell_value.split()
@@ -483,28 +519,35 @@ class XlsxHelper:
                      self._column.resource_title,
                      self._column.rename_parameter_opt_parm,
                      self._column.rename_values_alternatives]:
-            if name not in self.map_name_to_letters.keys():
+            if name not in self.map_name_to_columns.keys():
                 raise RuntimeError(f'missing column {name}')
 
     def _add_column(self, name: str, column: int, limit: int) -> None:
         """Add column."""
-        if name not in self.map_name_to_letters:
-            self.map_name_to_letters[name] = []
-        if limit > 0 and len(self.map_name_to_letters[name]) == limit:
+        if name not in self.map_name_to_columns:
+            self.map_name_to_columns[name] = []
+        if limit > 0 and len(self.map_name_to_columns[name]) == limit:
             raise RuntimeError(f'duplicate column {name} {get_column_letter(column)}')
-        self.map_name_to_letters[name].append(get_column_letter(column))
+        self.map_name_to_columns[name].append(column)
+
+    def _get_header(self) -> List[Any]:
+        """Get the heading of each column, taking merged headings from the first cell of the merge."""
+        header = list(self._rows[0]) if self._rows else []
+        for merged_range in read_merged_ranges(self._spread_sheet, self._sheet_name):
+            if merged_range.min_row != 1:
+                continue
+            for column in range(merged_range.min_col + 1, min(merged_range.max_col, len(header)) + 1):
+                header[column - 1] = header[merged_range.min_col - 1]
+        return header
 
     def _cell_value(self, row: int, col: int) -> Any:
-        """Get value for cell, adjusting for merged cells."""
-        cell = self._work_sheet.cell(row, col)
-        retval = cell.value
-        if isinstance(cell, MergedCell):
-            # cell is merged
-            for mc_range in self._work_sheet.merged_cells.ranges:
-                coord = get_column_letter(col) + str(row)
-                if coord in mc_range:
-                    retval = mc_range.start_cell.value
-        return retval
+        """Get value for cell, or None if the cell is beyond the data of the work sheet."""
+        if row > len(self._rows):
+            return None
+        values = self._rows[row - 1]
+        if col > len(values):
+            return None
+        return values[col - 1]
 
     def _normalize_control(self, control: str) -> Tuple[str, List[str]]:
         """Remove parenthesized characters from controls."""